@@ -19,8 +19,8 @@ async def main():
     ) as client:
         # Check API health
         try:
-            health_status = await client.get_health()
-            models_available = await client.get_available_models()
+            health_status = await client.async_get_health()
+            models_available = await client.async_get_available_models()
             print("API Health Status:", health_status)
             print("Models Available:", models_available)
         except Exception as e:
@@ -35,7 +35,7 @@ async def main():
                 },
             ]
 
-            agent_results = await client.run_agent_batch(agent_configs)
+            agent_results = await client.async_run_agent_batch(agent_configs)
             print("Batch Agent Results:", agent_results)
 
             # Batch Swarm Operations
@@ -70,7 +70,7 @@ async def main():
                 },
             ]
 
-            swarm_results = await client.run_swarm_batch(swarm_configs)
+            swarm_results = await client.async_run_swarm_batch(swarm_configs)
             print("Batch Swarm Results:", swarm_results)
 
         except Exception as e:
@@ -0,0 +1,81 @@
+"""
+Response Memory Benchmark
+
+This benchmark measures the memory held per result when tens of thousands of
+agent results are kept for aggregation, comparing decoded dicts with the lazy
+AgentResult objects returned when the client uses typed_responses=True.
+It runs offline on synthetic results shaped like agent completions.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from swarms_client import AgentResult, BatchResult
+from swarms_client.codec import get_codec
+
+
+def make_result(index: int) -> dict:
+    return {
+        "id": f"agent-{index:08d}",
+        "success": True,
+        "name": "market_researcher",
+        "description": "Researches market trends",
+        "temperature": 0.7,
+        "outputs": [
+            {"role": "user", "content": "Research market trends in AI"},
+            {"role": "market_researcher", "content": "Analysis " * 40},
+        ],
+        "usage": {"input_tokens": 12, "output_tokens": 320, "total_tokens": 332},
+        "timestamp": "2025-01-01T00:00:00Z",
+    }
+
+
+def measure(label: str, build, count: int) -> None:
+    # Time without tracing, which slows allocation-heavy code unevenly
+    start_time = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start_time
+
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:<32} {current / count:>9.0f} B/item held "
+        f"{peak / count:>9.0f} B/item peak {elapsed * 1000:>8.1f} ms"
+    )
+    del held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    codec = get_codec("auto")
+    body = codec.dumps([make_result(index) for index in range(args.count)])
+    print(f"{args.count} results, {len(body) / args.count:.0f} B/item of JSON\n")
+
+    def decoded_dicts():
+        return codec.loads(body)
+
+    def lazy_results():
+        return list(BatchResult(body, codec.loads, item_type=AgentResult))
+
+    def lazy_results_with_usage():
+        results = list(BatchResult(body, codec.loads, item_type=AgentResult))
+        total_tokens = sum(result.usage["total_tokens"] for result in results)
+        assert total_tokens == 332 * args.count
+        return results
+
+    measure("dict", decoded_dicts, args.count)
+    measure("AgentResult", lazy_results, args.count)
+    measure("AgentResult, usage accessed", lazy_results_with_usage, args.count)
+
+
+if __name__ == "__main__":
+    main()
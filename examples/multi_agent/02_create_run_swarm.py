@@ -36,7 +36,7 @@ async def main():
 
         try:
             # Create and run a swarm
-            swarm_result = await client.create_swarm(
+            swarm_result = await client.async_create_swarm(
                 name="research_team",
                 task="Analyze the latest trends in AI and create a summary report.",
                 agents=agents,
@@ -50,7 +50,7 @@ async def main():
 
             # Get swarm logs
             if "swarm_id" in swarm_result:
-                logs = await client.get_swarm_logs(swarm_result["swarm_id"])
+                logs = await client.async_get_swarm_logs(swarm_result["swarm_id"])
                 print("Swarm Logs:", logs)
 
         except Exception as e:
@@ -82,7 +82,7 @@ async def run_financial_analysis_swarm():
 
         try:
             # Create and run the financial analysis swarm
-            result = await client.create_swarm(
+            result = await client.async_create_swarm(
                 name="Financial Analysis Swarm",
                 task=f"""Analyze the following financial data and provide comprehensive analysis:
                 {financial_data}
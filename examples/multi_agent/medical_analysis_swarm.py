@@ -62,7 +62,7 @@ async def run_medical_analysis_swarm():
 
         try:
             # Create and run the medical analysis swarm
-            result = await client.create_swarm(
+            result = await client.async_create_swarm(
                 name="Medical Analysis Swarm",
                 task="""Investigate and analyze the latest advancements in cancer immunotherapy treatments.
 
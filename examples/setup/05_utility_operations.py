@@ -16,15 +16,15 @@ async def main():
     async with SwarmsClient(api_key=api_key) as client:
         try:
             # Get available models
-            models = await client.get_available_models()
+            models = await client.async_get_available_models()
             print("Available Models:", models)
 
             # Get available swarm types
-            swarm_types = await client.get_swarm_types()
+            swarm_types = await client.async_get_swarm_types()
             print("Available Swarm Types:", swarm_types)
 
             # Get API logs
-            api_logs = await client.get_api_logs()
+            api_logs = await client.async_get_api_logs()
             print("API Logs:", api_logs)
 
         except Exception as e:
@@ -24,7 +24,7 @@ async def main():
 
         try:
             # Run a single agent
-            result = await client.run_agent(
+            result = await client.async_run_agent(
                 agent_name="research_assistant",
                 task="Research the latest developments in quantum computing",
                 model_name="gpt-4",
@@ -17,7 +17,7 @@ async def run_code_developer():
 
     async with SwarmsClient(api_key=api_key) as client:
         # Configure the code developer with code executor tool
-        result = await client.run_agent(
+        result = await client.async_run_agent(
             agent_name="code_developer",
             task="""Create a Python function that implements a binary search algorithm.
             The function should be well-documented and include test cases.""",
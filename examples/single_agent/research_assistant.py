@@ -17,7 +17,7 @@ async def run_research_assistant():
 
     async with SwarmsClient(api_key=api_key) as client:
         # Configure the research assistant with search tool
-        result = await client.run_agent(
+        result = await client.async_run_agent(
             agent_name="research_assistant",
             task="Research the latest advancements in quantum computing and summarize key findings",
             model_name="gpt-4",
@@ -9,19 +9,71 @@ from .client import (
     SwarmsError,
     AuthenticationError,
     RateLimitError,
-    ValidationError,
     APIError,
 )
+from .batching import BatchItem
+from .cache import (
+    CacheBackend,
+    CompletionCache,
+    MemoryCacheBackend,
+    NamespacedCache,
+    SQLiteCacheBackend,
+    TieredCache,
+)
+from .circuit_breaker import CircuitBreakerRegistry, CircuitState
+from .coalescing import RequestCoalescer
+from .compression import CompressionPolicy, train_zstd_dictionary
 from .config import SwarmsConfig
+from .connector import SharedConnector
+from .engine import AsyncEngine
+from .exceptions import BatchError, CircuitOpenError, ValidationError
+from .hedging import HedgingPolicy
+from .idempotency import IdempotencyLog
+from .incremental import IncrementalJSONParser, SpilledField
+from .jobs import JobStore, run_job
+from .pool import SyncConnectionPool
+from .registry import AgentHandle, AgentRegistry
+from .responses import AgentResult, BatchResult, LogEntry, SwarmResult
+from .retry import RetryBudget
 
 __all__ = [
     "SwarmsClient",
     "SwarmsConfig",
+    "SharedConnector",
+    "AsyncEngine",
+    "RequestCoalescer",
+    "CompressionPolicy",
+    "train_zstd_dictionary",
+    "CacheBackend",
+    "CompletionCache",
+    "MemoryCacheBackend",
+    "NamespacedCache",
+    "SQLiteCacheBackend",
+    "TieredCache",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    "HedgingPolicy",
+    "IdempotencyLog",
+    "IncrementalJSONParser",
+    "SpilledField",
+    "JobStore",
+    "run_job",
+    "SyncConnectionPool",
+    "AgentResult",
+    "SwarmResult",
+    "LogEntry",
+    "BatchResult",
+    "BatchItem",
+    "AgentHandle",
+    "AgentRegistry",
+    "RetryBudget",
     "SwarmsError",
     "AuthenticationError",
     "RateLimitError",
     "ValidationError",
     "APIError",
+    "CircuitOpenError",
+    "BatchError",
 ]
 
 __version__ = "0.1.0"
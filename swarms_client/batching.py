@@ -0,0 +1,285 @@
+"""
+Batching module for Swarms API client.
+
+This module collects concurrent single-agent completions issued from
+independent coroutines and sends them together through the batch endpoint,
+and splits large batches into requests of bounded size.
+"""
+
+import asyncio
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from loguru import logger
+
+from .config import SwarmsConfig
+from .exceptions import APIError, SwarmsError
+from .loops import LoopLocal
+
+# Keys under which batch endpoints may return their list of results
+BATCH_RESULT_KEYS = ("results", "agents", "swarms", "outputs")
+
+# Weight of the newest inter-arrival sample in the arrival-gap average
+ARRIVAL_EWMA_WEIGHT = 0.2
+
+
+class BatchItem(NamedTuple):
+    """Outcome of one item of a batch run."""
+
+    # Position of the item in the submitted batch
+    index: int
+
+    # The item's result, None if it failed
+    result: Any
+
+    # The item's error, None if it succeeded
+    error: Optional[Exception]
+
+
+def split_batch_response(response: Any, expected: int) -> List[Any]:
+    """
+    Split a batch endpoint response into one result per submitted item.
+
+    Args:
+        response (Any): Decoded batch response
+        expected (int): Number of items that were submitted
+
+    Returns:
+        List[Any]: Results in submission order
+
+    Raises:
+        SwarmsError: If the response does not contain one result per item
+    """
+    results = response
+    if isinstance(response, dict):
+        for key in BATCH_RESULT_KEYS:
+            if isinstance(response.get(key), list):
+                results = response[key]
+                break
+
+    if not isinstance(results, list) or len(results) != expected:
+        count = len(results) if isinstance(results, list) else "no"
+        raise SwarmsError(
+            f"Batch response contained {count} results, expected {expected}"
+        )
+
+    return results
+
+
+def chunk_payloads(sizes: List[int], max_items: int, max_bytes: int) -> List[List[int]]:
+    """
+    Group batch items into chunks of bounded count and encoded size.
+
+    Items are kept in order, and an item larger than max_bytes is sent in a
+    chunk of its own.
+
+    Args:
+        sizes (List[int]): Encoded size of each item
+        max_items (int): Maximum number of items per chunk
+        max_bytes (int): Maximum encoded size of the items of a chunk
+
+    Returns:
+        List[List[int]]: Indices of the items of each chunk
+    """
+    chunks: List[List[int]] = []
+    chunk: List[int] = []
+    chunk_size = 0
+    for index, size in enumerate(sizes):
+        if chunk and (len(chunk) >= max_items or chunk_size + size > max_bytes):
+            chunks.append(chunk)
+            chunk, chunk_size = [], 0
+        chunk.append(index)
+        chunk_size += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def get_item_error(result: Any) -> Optional[SwarmsError]:
+    """
+    Get the error reported for a single item of a batch response.
+
+    Args:
+        result (Any): One item of a batch response
+
+    Returns:
+        Optional[SwarmsError]: The item's error, or None if it succeeded
+    """
+    if not isinstance(result, dict):
+        return None
+
+    status = result.get("status")
+    error = result.get("error")
+    if status in ("error", "failed") or (error and status != "success"):
+        detail = error or result.get("detail") or "Unknown error"
+        if isinstance(detail, dict):
+            detail = detail.get("detail") or detail.get("message") or str(detail)
+        return APIError(
+            f"Batch item failed: {detail}",
+            result.get("status_code", 500),
+            result,
+        )
+
+    return None
+
+
+class _PendingBatch:
+    """Items collected for the next batch on one event loop."""
+
+    __slots__ = ("items", "size", "timer", "tasks")
+
+    def __init__(self):
+        self.items: List[Tuple[bytes, "asyncio.Future[Any]"]] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.tasks: Set["asyncio.Task[None]"] = set()
+
+
+class AgentMicroBatcher:
+    """Collects concurrent agent completions into batch requests."""
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[bytes]], Awaitable[Any]],
+        max_batch_size: int = SwarmsConfig.DEFAULT_MICRO_BATCH_MAX_SIZE,
+        max_batch_bytes: int = SwarmsConfig.DEFAULT_MICRO_BATCH_MAX_BYTES,
+        max_wait: float = SwarmsConfig.DEFAULT_MICRO_BATCH_MAX_WAIT,
+    ):
+        """
+        Initialize the micro-batcher.
+
+        The collection window adapts to load: it is sized to the time the
+        current arrival rate needs to fill a batch, capped at max_wait, and
+        drops to zero when calls arrive too rarely to share a batch, so a
+        lone caller is never delayed.
+
+        Args:
+            send_batch (Callable): Coroutine function sending a list of
+                encoded completion payloads to the batch endpoint
+            max_batch_size (int): Maximum number of items per batch
+            max_batch_bytes (int): Maximum encoded payload size per batch
+            max_wait (float): Maximum time in seconds an item waits for a batch
+        """
+        self.send_batch = send_batch
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_wait = max_wait
+
+        # Items are batched per event loop, since their futures are bound to it
+        self._pending: LoopLocal[_PendingBatch] = LoopLocal(_PendingBatch)
+        self._last_arrival: Optional[float] = None
+        self._arrival_gap = max_wait
+
+        # Track batching statistics
+        self.stats: Dict[str, int] = {
+            "submitted": 0,
+            "batches": 0,
+            "full_flushes": 0,
+            "window_flushes": 0,
+        }
+
+    @property
+    def window(self) -> float:
+        """Current collection window in seconds."""
+        if self._arrival_gap >= self.max_wait:
+            return 0.0
+        return min(self.max_wait, self._arrival_gap * (self.max_batch_size - 1))
+
+    async def submit(self, payload: bytes) -> Any:
+        """
+        Submit a single completion payload and wait for its own result.
+
+        Args:
+            payload (bytes): JSON-encoded agent completion payload
+
+        Returns:
+            Any: The result for this payload
+
+        Raises:
+            SwarmsError: If the batch request or this item failed
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get()
+        size = len(payload)
+        self._record_arrival()
+
+        if pending.items and pending.size + size > self.max_batch_bytes:
+            self._flush(pending, full=True)
+
+        future = loop.create_future()
+        pending.items.append((payload, future))
+        pending.size += size
+        self.stats["submitted"] += 1
+
+        if (
+            len(pending.items) >= self.max_batch_size
+            or pending.size >= self.max_batch_bytes
+        ):
+            self._flush(pending, full=True)
+        elif pending.timer is None:
+            window = self.window
+            if window <= 0:
+                self._flush(pending, full=False)
+            else:
+                pending.timer = loop.call_later(window, self._flush, pending, False)
+
+        return await future
+
+    def _record_arrival(self) -> None:
+        """Update the average gap between submissions."""
+        now = time.monotonic()
+        if self._last_arrival is not None:
+            gap = min(now - self._last_arrival, self.max_wait)
+            self._arrival_gap += ARRIVAL_EWMA_WEIGHT * (gap - self._arrival_gap)
+        self._last_arrival = now
+
+    def _flush(self, pending: _PendingBatch, full: bool) -> None:
+        """Send all pending items of a loop as one batch."""
+        if pending.timer is not None:
+            pending.timer.cancel()
+            pending.timer = None
+
+        if not pending.items:
+            return
+
+        items = pending.items
+        pending.items = []
+        pending.size = 0
+
+        self.stats["batches"] += 1
+        self.stats["full_flushes" if full else "window_flushes"] += 1
+
+        task = asyncio.ensure_future(self._send(items))
+        pending.tasks.add(task)
+        task.add_done_callback(pending.tasks.discard)
+
+    async def _send(self, items: List[Tuple[bytes, "asyncio.Future[Any]"]]) -> None:
+        """Send one batch and resolve each caller's future."""
+        logger.debug(f"Sending micro-batch of {len(items)} agents")
+        try:
+            response = await self.send_batch([payload for payload, _ in items])
+            results = split_batch_response(response, len(items))
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(items, results):
+            if future.done():
+                continue
+            error = get_item_error(result)
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
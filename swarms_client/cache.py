@@ -0,0 +1,720 @@
+"""
+Response cache module for Swarms API client.
+
+This module defines the cache backend interface behind ``SwarmsClient.cache``
+with an in-memory backend, a SQLite backend in WAL mode that several
+processes can share and that keeps warm entries across restarts, a
+tiered cache using the in-memory backend as an L1 in front of another, and a
+namespaced view letting several caches share one backend. It also provides a
+content-addressed cache of completion results.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cachetools import TLRUCache
+from loguru import logger
+from pydantic import BaseModel
+
+from .codec import JSONCodec, get_codec
+from .coalescing import is_deterministic
+from .config import SwarmsConfig
+from .models import AgentCompletion, SwarmSpec
+
+# Writes between two passes removing expired entries and enforcing the size cap
+PRUNE_INTERVAL = 100
+
+# Fraction of the size cap kept after evicting, so eviction does not run on
+# every write once the cache is full
+EVICTION_TARGET = 0.9
+
+# Prefix of completion cache keys, followed by the model name and fingerprint
+COMPLETION_KEY_PREFIX = "completion:"
+
+# Model key used for requests that leave the model to the server
+DEFAULT_MODEL_KEY = "default"
+
+
+class CacheBackend(ABC):
+    """Interface of response cache backends."""
+
+    # Whether operations block on I/O, so the async methods run them off the
+    # event loop
+    blocking = False
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the backend.
+
+        Args:
+            ttl (float): Default time to live of entries in seconds
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[Any]: The value, or None if missing or expired
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key (str): Cache key
+            value (Any): JSON-serializable value
+            ttl (Optional[float]): Time to live in seconds, defaults to the
+                backend's TTL
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove a value if present.
+
+        Args:
+            key (str): Cache key
+        """
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Remove every value whose key starts with a prefix.
+
+        Args:
+            prefix (str): Key prefix
+
+        Returns:
+            int: Number of values removed
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every value."""
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+        pass
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        Get a cached value with its remaining time to live.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[Tuple[Any, Optional[float]]]: The value and its remaining
+                time to live in seconds, None if the backend does not track
+                it, or None if missing or expired
+        """
+        value = self.get(key)
+        return (value, None) if value is not None else None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run an operation, in the default executor if it blocks."""
+        if not self.blocking:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get a cached value without blocking the event loop."""
+        return await self._run(self.get, key)
+
+    async def aget_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """Get a cached value and its TTL without blocking the event loop."""
+        return await self._run(self.get_entry, key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value without blocking the event loop."""
+        await self._run(self.set, key, value, ttl)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.delete(key)
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with per-entry TTLs."""
+
+    def __init__(self, maxsize: int = 1000, ttl: Optional[float] = None):
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            maxsize (int): Maximum number of entries
+            ttl (Optional[float]): Default time to live in seconds. Defaults
+                to value from config.
+        """
+        super().__init__(ttl or SwarmsConfig.get_response_cache_ttl())
+        # Entries hold their expiry time on the cache's timer and the value
+        self._entries: "TLRUCache[str, Tuple[float, Any]]" = TLRUCache(
+            maxsize=maxsize, ttu=lambda key, entry, now: entry[0]
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._entries.timer()
+        return (entry[1], entry[0] - now) if entry is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            expires_at = self._entries.timer() + (ttl if ttl is not None else self.ttl)
+            self._entries[key] = (expires_at, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries.keys() if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Persistent cache in a SQLite database shared between processes."""
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = None,
+        max_bytes: int = SwarmsConfig.DEFAULT_CACHE_MAX_BYTES,
+        codec: Optional[JSONCodec] = None,
+    ):
+        """
+        Initialize the SQLite backend, creating the database if needed.
+
+        The database runs in WAL mode, so any number of processes can read
+        while one writes. Entries outlive the process until they expire.
+
+        Args:
+            path (str): Database file
+            ttl (Optional[float]): Default time to live in seconds. Defaults
+                to value from config.
+            max_bytes (int): Size cap for stored values. The oldest entries
+                are evicted beyond it.
+            codec (Optional[JSONCodec]): Codec for stored values. Defaults to
+                the fastest installed codec.
+        """
+        super().__init__(ttl or SwarmsConfig.get_response_cache_ttl())
+        self.path = path
+        self.max_bytes = max_bytes
+        self.codec = codec or get_codec("auto")
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS cache_created_at ON cache (created_at)"
+        )
+        self._prune()
+
+        logger.debug(f"Opened SQLite response cache at {self.path}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE expires_at > ?", (time.time(),)
+            ).fetchone()
+        return count
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return self.codec.loads(row[0]) if row is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        return (self.codec.loads(row[0]), row[1] - now) if row is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        encoded = self.codec.dumps(value)
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self.ttl)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(key, value, size, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, encoded, len(encoded), now, expires_at),
+            )
+            self._writes += 1
+            if self._writes % PRUNE_INTERVAL == 0:
+                self._prune()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> int:
+        # Match on the key range instead of LIKE, which treats _ and % as wildcards
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE key >= ? AND key < ?",
+                (prefix, prefix + "\U0010ffff"),
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def prune(self) -> None:
+        """Remove expired entries and evict the oldest beyond the size cap."""
+        with self._lock:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Prune the database. Callers must hold the lock."""
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        excess = total - int(self.max_bytes * EVICTION_TARGET)
+        evicted: List[Tuple[str]] = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM cache ORDER BY created_at"
+        ):
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} entries from {self.path}")
+
+
+class TieredCache(CacheBackend):
+    """In-memory L1 cache in front of a shared or persistent L2 backend."""
+
+    def __init__(self, l1: CacheBackend, l2: CacheBackend):
+        """
+        Initialize the tiered cache.
+
+        Values found only in L2 are copied into L1 on read, living there
+        until they expire in L2, and for at most L1's TTL. The async methods
+        run L2 operations off the event loop if L2 blocks.
+
+        Args:
+            l1 (CacheBackend): Fast in-process cache
+            l2 (CacheBackend): Slower shared or persistent cache
+        """
+        super().__init__(l2.ttl)
+        self.l1 = l1
+        self.l2 = l2
+
+        # Track hits per tier
+        self.stats: Dict[str, int] = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = self.l1.get_entry(key)
+        if entry is not None:
+            self.stats["l1_hits"] += 1
+            return entry
+        return self._promote(key, self.l2.get_entry(key))
+
+    async def aget(self, key: str) -> Optional[Any]:
+        entry = await self.aget_entry(key)
+        return entry[0] if entry is not None else None
+
+    async def aget_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = await self.l1.aget_entry(key)
+        if entry is not None:
+            self.stats["l1_hits"] += 1
+            return entry
+        return self._promote(key, await self.l2.aget_entry(key))
+
+    def _promote(
+        self, key: str, entry: Optional[Tuple[Any, Optional[float]]]
+    ) -> Optional[Tuple[Any, Optional[float]]]:
+        """Copy an L2 entry into L1 for the rest of its TTL."""
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["l2_hits"] += 1
+        value, remaining = entry
+        self.l1.set(key, value, self._l1_ttl(remaining))
+        return entry
+
+    def _l1_ttl(self, ttl: Optional[float]) -> Optional[float]:
+        """Cap a TTL at L1's."""
+        return min(ttl, self.l1.ttl) if ttl is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.l2.set(key, value, ttl)
+        self.l1.set(key, value, self._l1_ttl(ttl))
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self.l2.aset(key, value, ttl)
+        await self.l1.aset(key, value, self._l1_ttl(ttl))
+
+    def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        self.l1.delete_prefix(prefix)
+        return self.l2.delete_prefix(prefix)
+
+    def clear(self) -> None:
+        self.l1.clear()
+        self.l2.clear()
+
+    def close(self) -> None:
+        self.l1.close()
+        self.l2.close()
+
+
+class NamespacedCache(CacheBackend):
+    """View of a backend holding only the keys under one namespace."""
+
+    def __init__(self, backend: CacheBackend, namespace: str):
+        """
+        Initialize the namespaced view.
+
+        Keys are stored in the backend as ``<namespace>:<key>``, and clearing
+        the view only removes its own keys, so caches sharing the backend
+        under other namespaces keep their entries.
+
+        Args:
+            backend (CacheBackend): Shared backend
+            namespace (str): Namespace of the view's keys
+        """
+        super().__init__(backend.ttl)
+        self.backend = backend
+        self.prefix = f"{namespace}:"
+        self.blocking = backend.blocking
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.backend.get(self.prefix + key)
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        return self.backend.get_entry(self.prefix + key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.backend.set(self.prefix + key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self.backend.delete(self.prefix + key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        return self.backend.delete_prefix(self.prefix + prefix)
+
+    def clear(self) -> None:
+        self.backend.delete_prefix(self.prefix)
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+def fingerprint(request: BaseModel) -> str:
+    """
+    Compute a canonical fingerprint of a completion request.
+
+    Every field, including the sampling parameters, contributes to the
+    fingerprint, and field order does not matter.
+
+    Args:
+        request (BaseModel): An AgentCompletion or SwarmSpec
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON form of the request
+    """
+    canonical = json.dumps(
+        request.model_dump(mode="json", exclude_none=True),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def get_model_names(request: BaseModel) -> List[str]:
+    """
+    Get the models a completion request runs on.
+
+    Args:
+        request (BaseModel): An AgentCompletion or SwarmSpec
+
+    Returns:
+        List[str]: Sorted, unique model names
+    """
+    if isinstance(request, AgentCompletion):
+        agents = [request.agent_config]
+    elif isinstance(request, SwarmSpec):
+        agents = request.agents or []
+    else:
+        agents = []
+
+    return sorted({agent.model_name or DEFAULT_MODEL_KEY for agent in agents}) or [
+        DEFAULT_MODEL_KEY
+    ]
+
+
+class CompletionCache:
+    """Content-addressed cache of agent and swarm completion results."""
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = None,
+        deterministic_only: bool = True,
+    ):
+        """
+        Initialize the completion cache.
+
+        Results are stored under ``completion:<model>:<fingerprint>`` for each
+        model the request uses, the first entry holding the result and the
+        others a marker. A lookup hits only if every entry is present, so
+        invalidating any of the models invalidates the result.
+
+        Args:
+            backend (Optional[CacheBackend]): Backend holding the results.
+                Defaults to an in-memory backend.
+            ttl (Optional[float]): Default expiry of results in seconds.
+                Defaults to value from config.
+            deterministic_only (bool): Whether only requests sampling with
+                temperature 0 are cached
+        """
+        self.ttl = ttl or SwarmsConfig.get_completion_cache_ttl()
+        self.backend = backend or MemoryCacheBackend(maxsize=10000, ttl=self.ttl)
+        self.deterministic_only = deterministic_only
+
+        # Track completion cache statistics
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "skipped": 0,
+            "stores": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups served from the cache."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the cache's statistics.
+
+        Returns:
+            Dict[str, Any]: Hit rate and counters
+        """
+        return {"hit_rate": self.hit_rate, **self.stats}
+
+    def is_cacheable(self, request: BaseModel) -> bool:
+        """
+        Check whether a request's result may be cached.
+
+        Args:
+            request (BaseModel): An AgentCompletion or SwarmSpec
+
+        Returns:
+            bool: True if the request is cacheable
+        """
+        if not isinstance(request, (AgentCompletion, SwarmSpec)):
+            return False
+        if getattr(request, "stream", None):
+            return False
+        return not self.deterministic_only or is_deterministic(request)
+
+    def _get_keys(self, request: BaseModel) -> List[str]:
+        """Get the cache key of a request for each of its models."""
+        digest = fingerprint(request)
+        return [
+            f"{COMPLETION_KEY_PREFIX}{model}:{digest}"
+            for model in get_model_names(request)
+        ]
+
+    def get(self, request: BaseModel) -> Optional[Any]:
+        """
+        Get the cached result of a request.
+
+        Args:
+            request (BaseModel): An AgentCompletion or SwarmSpec
+
+        Returns:
+            Optional[Any]: The cached result, or None on a miss or if the
+                request is not cacheable
+        """
+        if not self.is_cacheable(request):
+            self.stats["skipped"] += 1
+            return None
+
+        keys = self._get_keys(request)
+        result = self.backend.get(keys[0])
+        if result is None or any(self.backend.get(key) is None for key in keys[1:]):
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return result
+
+    async def aget(self, request: BaseModel) -> Optional[Any]:
+        """
+        Get the cached result of a request without blocking the event loop.
+
+        Args:
+            request (BaseModel): An AgentCompletion or SwarmSpec
+
+        Returns:
+            Optional[Any]: The cached result, or None on a miss or if the
+                request is not cacheable
+        """
+        if not self.is_cacheable(request):
+            self.stats["skipped"] += 1
+            return None
+
+        keys = self._get_keys(request)
+        result = await self.backend.aget(keys[0])
+        for key in keys[1:]:
+            if result is None:
+                break
+            if await self.backend.aget(key) is None:
+                result = None
+        if result is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return result
+
+    def set(self, request: BaseModel, result: Any, ttl: Optional[float] = None) -> None:
+        """
+        Cache the result of a request.
+
+        Args:
+            request (BaseModel): An AgentCompletion or SwarmSpec
+            result (Any): JSON-serializable result
+            ttl (Optional[float]): Expiry in seconds, defaults to the cache's
+        """
+        if not self.is_cacheable(request):
+            return
+
+        ttl = ttl if ttl is not None else self.ttl
+        keys = self._get_keys(request)
+        for key in keys[1:]:
+            self.backend.set(key, True, ttl)
+        self.backend.set(keys[0], result, ttl)
+        self.stats["stores"] += 1
+
+    async def aset(
+        self, request: BaseModel, result: Any, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Cache the result of a request without blocking the event loop.
+
+        Args:
+            request (BaseModel): An AgentCompletion or SwarmSpec
+            result (Any): JSON-serializable result
+            ttl (Optional[float]): Expiry in seconds, defaults to the cache's
+        """
+        if not self.is_cacheable(request):
+            return
+
+        ttl = ttl if ttl is not None else self.ttl
+        keys = self._get_keys(request)
+        for key in keys[1:]:
+            await self.backend.aset(key, True, ttl)
+        await self.backend.aset(keys[0], result, ttl)
+        self.stats["stores"] += 1
+
+    def invalidate_model(self, model_name: str) -> int:
+        """
+        Drop every cached result of requests using a model.
+
+        Args:
+            model_name (str): Name of the model
+
+        Returns:
+            int: Number of entries removed from the backend
+        """
+        removed = self.backend.delete_prefix(f"{COMPLETION_KEY_PREFIX}{model_name}:")
+        self.stats["invalidations"] += 1
+        logger.info(f"Invalidated {removed} cached completions for {model_name}")
+        return removed
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self.backend.delete_prefix(COMPLETION_KEY_PREFIX)
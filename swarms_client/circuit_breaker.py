@@ -0,0 +1,334 @@
+"""
+Circuit breaker module for Swarms API client.
+
+This module provides closed/open/half-open circuit breakers that stop calls to
+a failing endpoint or base URL and fail fast until a probe succeeds again.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import aiohttp
+import requests
+from cachetools import LRUCache
+from loguru import logger
+
+from .config import SwarmsConfig
+
+# Maximum number of endpoint breakers kept by a registry
+MAX_CIRCUIT_BREAKERS = 256
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Signature of state change listeners: (circuit name, old state, new state)
+StateListener = Callable[[str, CircuitState, CircuitState], None]
+
+
+def is_circuit_failure_status(status: int) -> bool:
+    """
+    Check whether an HTTP status code counts as a backend failure.
+
+    Args:
+        status (int): HTTP status code
+
+    Returns:
+        bool: True for 5xx and 408 responses
+    """
+    return status >= 500 or status == 408
+
+
+def is_circuit_failure(exception: BaseException) -> Optional[bool]:
+    """
+    Classify an exception for circuit breaking.
+
+    Args:
+        exception (BaseException): The exception raised by a request
+
+    Returns:
+        Optional[bool]: True if the backend failed (5xx, 408, timeouts,
+            connection failures), False if it answered (other HTTP errors,
+            including 429), None if the exception says nothing about it
+    """
+    status = getattr(exception, "status", None) or getattr(
+        exception, "status_code", None
+    )
+    if isinstance(status, int):
+        return is_circuit_failure_status(status)
+
+    if isinstance(
+        exception,
+        (
+            asyncio.TimeoutError,
+            TimeoutError,
+            ConnectionError,
+            aiohttp.ClientConnectionError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ),
+    ):
+        return True
+
+    return None
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one endpoint or base URL."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = SwarmsConfig.DEFAULT_CIRCUIT_FAILURE_RATE,
+        minimum_volume: int = SwarmsConfig.DEFAULT_CIRCUIT_MINIMUM_VOLUME,
+        window: float = SwarmsConfig.DEFAULT_CIRCUIT_WINDOW,
+        open_timeout: float = SwarmsConfig.DEFAULT_CIRCUIT_OPEN_TIMEOUT,
+        listeners: Optional[List[StateListener]] = None,
+    ):
+        """
+        Initialize the circuit breaker in the closed state.
+
+        Args:
+            name (str): Name of the circuit, e.g. a base URL or endpoint
+            failure_rate_threshold (float): Failure rate within the window at
+                which the circuit opens
+            minimum_volume (int): Minimum number of calls within the window
+                before the failure rate is evaluated
+            window (float): Sliding window in seconds for the failure rate
+            open_timeout (float): Seconds the circuit stays open before a
+                single probe call is let through
+            listeners (Optional[List[StateListener]]): Callbacks invoked on
+                every state transition
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_volume = minimum_volume
+        self.window = window
+        self.open_timeout = open_timeout
+        self.listeners = listeners if listeners is not None else []
+
+        self.state = CircuitState.CLOSED
+        self._calls: Deque[Tuple[float, bool]] = collections.deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        # Track circuit statistics
+        self.stats: Dict[str, int] = {
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    @property
+    def failure_rate(self) -> float:
+        """Failure rate over the calls in the current window."""
+        with self._lock:
+            self._trim(time.monotonic())
+            return self._failures / len(self._calls) if self._calls else 0.0
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(self._opened_at + self.open_timeout - time.monotonic(), 0.0)
+
+    def allow(self) -> Tuple[bool, bool]:
+        """
+        Check whether a call may proceed, reserving the probe when half-open.
+
+        Returns:
+            Tuple[bool, bool]: (allowed, probe) where probe is True if the
+                call is the single probe of a half-open circuit
+        """
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.open_timeout:
+                    self.stats["rejected"] += 1
+                    return False, False
+                self._transition(CircuitState.HALF_OPEN)
+
+            if self.state == CircuitState.HALF_OPEN:
+                if self._probe_in_flight:
+                    self.stats["rejected"] += 1
+                    return False, False
+                self._probe_in_flight = True
+                return True, True
+
+            return True, False
+
+    def record(self, failed: Optional[bool], probe: bool = False) -> None:
+        """
+        Record the outcome of an allowed call.
+
+        Args:
+            failed (Optional[bool]): True for a backend failure, False for a
+                success, None if the call ended without telling either way
+            probe (bool): Whether the call was the half-open probe
+        """
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+
+            if failed is None:
+                return
+
+            self.stats["failures" if failed else "successes"] += 1
+
+            if probe and self.state == CircuitState.HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self._calls.clear()
+                    self._failures = 0
+                    self._transition(CircuitState.CLOSED)
+                return
+
+            if self.state != CircuitState.CLOSED:
+                return
+
+            now = time.monotonic()
+            self._calls.append((now, failed))
+            self._failures += failed
+            self._trim(now)
+
+            if (
+                len(self._calls) >= self.minimum_volume
+                and self._failures / len(self._calls) >= self.failure_rate_threshold
+            ):
+                self._open()
+
+    def _trim(self, now: float) -> None:
+        """Drop calls that fell out of the sliding window."""
+        while self._calls and now - self._calls[0][0] > self.window:
+            _, failed = self._calls.popleft()
+            self._failures -= failed
+
+    def _open(self) -> None:
+        """Open the circuit."""
+        self._opened_at = time.monotonic()
+        self.stats["opened"] += 1
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        """Move to a new state and notify listeners."""
+        old_state = self.state
+        if old_state == new_state:
+            return
+
+        self.state = new_state
+        if new_state == CircuitState.OPEN:
+            logger.warning(
+                f"Circuit '{self.name}' opened, failing fast for {self.open_timeout:.1f}s"
+            )
+        else:
+            logger.info(f"Circuit '{self.name}' is now {new_state.value}")
+
+        for listener in self.listeners:
+            try:
+                listener(self.name, old_state, new_state)
+            except Exception as e:
+                logger.error(f"Circuit state listener failed: {str(e)}")
+
+
+class CircuitBreakerRegistry:
+    """Creates and holds circuit breakers keyed by base URL and endpoint."""
+
+    def __init__(
+        self,
+        failure_rate_threshold: Optional[float] = None,
+        minimum_volume: Optional[int] = None,
+        window: Optional[float] = None,
+        open_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            failure_rate_threshold (Optional[float]): Failure rate at which
+                circuits open. Defaults to value from config.
+            minimum_volume (Optional[int]): Minimum calls in the window before
+                circuits can open. Defaults to value from config.
+            window (Optional[float]): Sliding window in seconds. Defaults to
+                value from config.
+            open_timeout (Optional[float]): Seconds before an open circuit lets
+                a probe through. Defaults to value from config.
+        """
+        self.failure_rate_threshold = (
+            failure_rate_threshold or SwarmsConfig.get_circuit_failure_rate()
+        )
+        self.minimum_volume = (
+            minimum_volume or SwarmsConfig.get_circuit_minimum_volume()
+        )
+        self.window = window or SwarmsConfig.get_circuit_window()
+        self.open_timeout = open_timeout or SwarmsConfig.get_circuit_open_timeout()
+        self.listeners: List[StateListener] = []
+        self._breakers: "LRUCache[str, CircuitBreaker]" = LRUCache(
+            maxsize=MAX_CIRCUIT_BREAKERS
+        )
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: StateListener) -> None:
+        """
+        Register a callback invoked on every circuit state transition.
+
+        Args:
+            listener (StateListener): Called with (name, old_state, new_state)
+        """
+        self.listeners.append(listener)
+
+    def get(self, name: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker for a name, creating it if needed.
+
+        Args:
+            name (str): Base URL or endpoint identifying the circuit
+
+        Returns:
+            CircuitBreaker: The circuit breaker
+        """
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    name,
+                    failure_rate_threshold=self.failure_rate_threshold,
+                    minimum_volume=self.minimum_volume,
+                    window=self.window,
+                    open_timeout=self.open_timeout,
+                    listeners=self.listeners,
+                )
+                self._breakers[name] = breaker
+            return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every known circuit.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: State, failure rate and statistics per circuit
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+
+        return {
+            breaker.name: {
+                "state": breaker.state.value,
+                "failure_rate": breaker.failure_rate,
+                "retry_after": breaker.retry_after,
+                **breaker.stats,
+            }
+            for breaker in breakers
+        }
@@ -0,0 +1,299 @@
+"""
+Command-line interface for Swarms API client.
+
+This module provides the swarms-client command. Its run subcommand streams
+agent or swarm configurations from a JSONL file through the batch endpoints
+into a JSONL result file, as a durable job that resumes where it stopped
+when the same command is run again.
+"""
+
+import argparse
+import asyncio
+import bz2
+import gzip
+import hashlib
+import lzma
+import os
+import sys
+import time
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from .client import SwarmsClient
+from .codec import JSONCodec, get_codec
+from .config import SwarmsConfig
+from .exceptions import SwarmsError, ValidationError
+from .jobs import JobOutcome, JobStore, run_job
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Seconds between progress reports
+DEFAULT_PROGRESS_INTERVAL = 5.0
+
+
+def open_file(path: str, mode: str) -> IO[bytes]:
+    """
+    Open a file in binary mode, compressed according to its extension.
+
+    Args:
+        path (str): File path; .gz, .bz2, .xz and .zst files are compressed
+        mode (str): "rb" or "wb"
+
+    Returns:
+        IO[bytes]: The open file
+
+    Raises:
+        ImportError: If the file is .zst and zstandard is not installed
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    if path.endswith(".bz2"):
+        return bz2.open(path, mode)
+    if path.endswith(".xz"):
+        return lzma.open(path, mode)
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError(".zst files require `pip install zstandard`")
+        return zstandard.open(path, mode)
+    return open(path, mode)
+
+
+def read_jsonl(path: str, codec: JSONCodec) -> Iterator[Dict[str, Any]]:
+    """
+    Read the JSON objects of a JSONL file, skipping blank lines.
+
+    Args:
+        path (str): File path, optionally compressed
+        codec (JSONCodec): Codec decoding each line
+
+    Yields:
+        Dict[str, Any]: The object on each line
+
+    Raises:
+        ValidationError: If a line is not a JSON object
+    """
+    with open_file(path, "rb") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                item = codec.loads(line)
+            except ValueError as e:
+                raise ValidationError(f"{path}:{number}: invalid JSON: {e}")
+            if not isinstance(item, dict):
+                raise ValidationError(f"{path}:{number}: expected a JSON object")
+            yield item
+
+
+def format_outcome(outcome: JobOutcome) -> bytes:
+    """
+    Format a finished item as a line of the result file.
+
+    Args:
+        outcome (JobOutcome): Index, encoded result and encoded error
+
+    Returns:
+        bytes: {"index": ..., "result": ...} or {"index": ..., "error": ...}
+    """
+    index, result, error = outcome
+    if error is not None:
+        return b'{"index":%d,"error":%s}\n' % (index, error)
+    return b'{"index":%d,"result":%s}\n' % (index, result)
+
+
+def default_job_id(input_path: str, kind: str) -> str:
+    """
+    Derive a job identifier from the input file, so reruns resume the job.
+
+    Args:
+        input_path (str): Input file path
+        kind (str): "agent" or "swarm"
+
+    Returns:
+        str: Job identifier
+    """
+    path = os.path.abspath(input_path)
+    digest = hashlib.sha256(f"{kind}:{path}".encode()).hexdigest()[:12]
+    return f"{os.path.basename(path)}-{digest}"
+
+
+def _report(counts: Dict[str, int], started: float, done: int) -> None:
+    elapsed = max(time.monotonic() - started, 1e-9)
+    rate = done / elapsed
+    finished = counts["completed"] + counts["failed"]
+    remaining = counts["total"] - finished
+    eta = f"{remaining / rate:.0f}s" if rate > 0 else "unknown"
+    print(
+        f"{finished}/{counts['total']} items finished "
+        f"({counts['failed']} failed, {counts['in_flight']} in flight), "
+        f"{rate:.1f} items/s, ETA {eta}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+async def _run(args: argparse.Namespace) -> int:
+    """Run or resume a job and write its results."""
+    codec = get_codec("auto")
+    job_id = args.job_id or default_job_id(args.input, args.kind)
+    client = SwarmsClient(
+        api_key=args.api_key,
+        base_url=args.base_url,
+        max_concurrent_requests=args.concurrency,
+        typed_responses=True,
+    )
+    store = JobStore(args.state or f"{args.output}.jobs.db", codec=codec)
+
+    try:
+        if store.open_job(job_id, args.kind):
+            print(f"Resuming job {job_id}", file=sys.stderr)
+            if args.retry_failed:
+                retried = store.retry_failed(job_id)
+                print(f"Retrying {retried} failed items", file=sys.stderr)
+
+        with open_file(args.output, "wb") as out:
+            # The result file is rebuilt from the store on every run, so it
+            # holds each finished item exactly once however often the job
+            # was interrupted
+            for outcome in store.results(job_id):
+                out.write(format_outcome(outcome))
+
+            started = last_report = time.monotonic()
+            done = 0
+            async for outcome in run_job(
+                client,
+                store,
+                job_id,
+                args.kind,
+                read_jsonl(args.input, codec),
+                concurrency=args.concurrency,
+                chunk_size=args.chunk_size,
+                item_retries=args.item_retries,
+            ):
+                out.write(format_outcome(outcome))
+                done += 1
+                now = time.monotonic()
+                if now - last_report >= args.progress_interval:
+                    out.flush()
+                    counts = await asyncio.get_running_loop().run_in_executor(
+                        None, store.progress, job_id
+                    )
+                    _report(counts, started, done)
+                    last_report = now
+
+        counts = store.progress(job_id)
+        _report(counts, started, done)
+        return 1 if counts["failed"] else 0
+
+    finally:
+        await client.aclose()
+        client.close()
+        store.close()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="swarms-client", description="Command-line client for the Swarms API"
+    )
+    parser.add_argument(
+        "--log-level", default="WARNING", help="Log level (default: WARNING)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser(
+        "run",
+        help="Run a JSONL file of agents or swarms as a resumable job",
+        description=(
+            "Run the agent or swarm configurations of a JSONL file through "
+            "the batch endpoints and write one result per line. Progress is "
+            "recorded in a job database, and running the same command again "
+            "resumes an interrupted job. Files ending in .gz, .bz2, .xz or "
+            ".zst are compressed."
+        ),
+    )
+    run.add_argument("input", help="JSONL file with one configuration per line")
+    run.add_argument("output", help="JSONL file receiving the results")
+    run.add_argument(
+        "--kind",
+        choices=("agent", "swarm"),
+        default="agent",
+        help="What each line configures (default: agent)",
+    )
+    run.add_argument(
+        "--concurrency",
+        type=int,
+        default=SwarmsConfig.get_max_concurrent_requests(),
+        help="Batch requests in flight at once",
+    )
+    run.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Items per batch request (default: SWARMS_API_BATCH_CHUNK_SIZE)",
+    )
+    run.add_argument(
+        "--item-retries",
+        type=int,
+        default=None,
+        help="Resubmissions of each failed item "
+        "(default: SWARMS_API_BATCH_ITEM_RETRIES)",
+    )
+    run.add_argument(
+        "--job-id", default=None, help="Job identifier (default: from the input path)"
+    )
+    run.add_argument(
+        "--state",
+        default=None,
+        help="Job database (default: the output path with .jobs.db appended)",
+    )
+    run.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Run the failed items of a resumed job again",
+    )
+    run.add_argument(
+        "--progress-interval",
+        type=float,
+        default=DEFAULT_PROGRESS_INTERVAL,
+        help="Seconds between progress reports",
+    )
+    run.add_argument(
+        "--api-key", default=None, help="API key (default: SWARMS_API_KEY)"
+    )
+    run.add_argument(
+        "--base-url", default=None, help="API base URL (default: SWARMS_API_BASE_URL)"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the swarms-client command.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, defaults to
+            sys.argv[1:]
+
+    Returns:
+        int: Exit code; 1 if any item failed, 130 if interrupted
+    """
+    args = _build_parser().parse_args(argv)
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level.upper())
+
+    try:
+        return asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        print("Interrupted; run the same command again to resume", file=sys.stderr)
+        return 130
+    except (SwarmsError, ImportError, OSError) as e:
+        print(f"swarms-client: error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
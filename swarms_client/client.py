@@ -31,59 +31,127 @@ Example:
 
 import asyncio
 import concurrent.futures
+import functools
 import hashlib
+import inspect
 import json
-import threading
+import os
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import urljoin
 
 import aiohttp
 import requests
-from cachetools import TTLCache
 from loguru import logger
-from pydantic import ValidationError
 
+from swarms_client.batching import (
+    AgentMicroBatcher,
+    BatchItem,
+    chunk_payloads,
+    get_item_error,
+    split_batch_response,
+)
+from swarms_client.cache import (
+    CacheBackend,
+    CompletionCache,
+    MemoryCacheBackend,
+    NamespacedCache,
+    SQLiteCacheBackend,
+    TieredCache,
+)
+from swarms_client.circuit_breaker import CircuitBreakerRegistry
+from swarms_client.coalescing import RequestCoalescer, is_deterministic
+from swarms_client.codec import JSONCodec, dump_model, get_codec
+from swarms_client.compression import CompressionPolicy
 from swarms_client.config import SwarmsConfig
-from swarms_client.models import AgentCompletion, AgentSpec, SwarmSpec
-from swarms_client.retry import RetryHandler
-
-# Thread-local storage for sync client session
-_thread_local = threading.local()
-
-
-# Custom exceptions
-class SwarmsError(Exception):
-    """Base exception for all Swarms API errors."""
-
-    pass
-
-
-class AuthenticationError(SwarmsError):
-    """Raised when authentication fails."""
-
-    pass
-
-
-class RateLimitError(SwarmsError):
-    """Raised when rate limit is exceeded."""
-
-    pass
+from swarms_client.connector import SharedConnector
+from swarms_client.engine import AsyncEngine, get_engine
+from swarms_client.exceptions import (
+    APIError,
+    AuthenticationError,
+    BatchError,
+    RateLimitError,
+    SwarmsError,
+)
+from swarms_client.hedging import HedgingPolicy
+from swarms_client.idempotency import (
+    IDEMPOTENCY_HEADER,
+    IdempotencyLog,
+    new_idempotency_key,
+)
+from swarms_client.incremental import IncrementalJSONParser, has_spilled_fields
+from swarms_client.limiter import (
+    ConcurrencyLimiter,
+    create_limiter,
+    is_overload_error,
+)
+from swarms_client.loops import LoopLocal
+from swarms_client.models import AgentCompletion, AgentSpec, StreamEvent, SwarmSpec
+from swarms_client.pool import SyncConnectionPool
+from swarms_client.rate_limit import RateLimiter, parse_retry_after
+from swarms_client.registry import AgentHandle, AgentRegistry, create_handle
+from swarms_client.responses import (
+    AgentResult,
+    BatchResult,
+    LazyResult,
+    LogEntry,
+    SwarmResult,
+)
+from swarms_client.retry import RetryBudget, RetryHandler
+from swarms_client.sharding import (
+    DEFAULT_SHARD_CHUNK_SIZE,
+    ShardTask,
+    run_sharded,
+    split_limit,
+)
+from swarms_client.streaming import SSEParser
+
+# Marks the end of a stream in the event buffer
+_STREAM_END = object()
+
+
+def _engine_facade(func: Callable) -> Callable:
+    """
+    Run a sync method as its async counterpart when the client has an engine.
 
+    The async method of the same name with an async_ prefix must take the
+    same arguments. Sync generators iterate the async generator.
+    """
+    async_name = f"async_{func.__name__}"
 
-class ValidationError(SwarmsError):
-    """Raised when input validation fails."""
+    if inspect.isgeneratorfunction(func):
 
-    pass
+        @functools.wraps(func)
+        def generator_wrapper(self: "SwarmsClient", *args: Any, **kwargs: Any):
+            if self.engine is None:
+                yield from func(self, *args, **kwargs)
+            else:
+                yield from self.engine.iterate(
+                    getattr(self, async_name)(*args, **kwargs)
+                )
 
+        return generator_wrapper
 
-class APIError(SwarmsError):
-    """Raised when the API returns an error."""
+    @functools.wraps(func)
+    def wrapper(self: "SwarmsClient", *args: Any, **kwargs: Any):
+        if self.engine is None:
+            return func(self, *args, **kwargs)
+        return self.engine.run(getattr(self, async_name)(*args, **kwargs))
 
-    def __init__(self, message: str, status_code: int, response: Dict[str, Any]):
-        self.status_code = status_code
-        self.response = response
-        super().__init__(f"{message} (Status: {status_code})")
+    return wrapper
 
 
 class SwarmsClient:
@@ -99,8 +167,24 @@ class SwarmsClient:
         timeout (int): Request timeout in seconds
         max_retries (int): Maximum number of retries for failed requests
         max_concurrent_requests (int): Maximum number of concurrent requests
+        limiter (ConcurrencyLimiter): Gates the number of requests in flight
+        sync_pool (SyncConnectionPool): Connections shared by sync calls across threads
+        rate_limiter (Optional[RateLimiter]): Client-wide request rate limiter
+        hedging_policy (Optional[HedgingPolicy]): Hedges slow idempotent requests
+        idempotency_log (Optional[IdempotencyLog]): Local results by idempotency key
+        completion_cache (Optional[CompletionCache]): Cached completion results
+        codec (JSONCodec): Codec encoding request bodies and decoding responses
+        spill_threshold (Optional[int]): Size above which decoded fields spill to disk
+        typed_responses (bool): Whether results are returned as lazy result objects
+        compression (CompressionPolicy): Chooses how request bodies are compressed
         thread_pool_size (int): Maximum number of threads for sync operations
-        session (aiohttp.ClientSession): Async HTTP session for making requests
+        stream_buffer_size (int): Maximum number of buffered stream events
+        coalescer (RequestCoalescer): Shares identical in-flight requests
+        agent_registry (AgentRegistry): Agents validated and encoded once
+        micro_batcher (Optional[AgentMicroBatcher]): Batches concurrent agent runs
+        connector (SharedConnector): TCP connector of the async session, possibly shared
+        engine (Optional[AsyncEngine]): Background event loop running sync calls
+        async_session (Optional[aiohttp.ClientSession]): Running loop's async session, created on first use
     """
 
     def __init__(
@@ -116,6 +200,34 @@ class SwarmsClient:
         jitter: bool = True,
         enable_cache: bool = True,
         thread_pool_size: Optional[int] = None,
+        stream_buffer_size: Optional[int] = None,
+        enable_coalescing: bool = True,
+        coalesce_deterministic_requests: bool = False,
+        enable_micro_batching: bool = False,
+        micro_batch_max_size: Optional[int] = None,
+        micro_batch_max_bytes: Optional[int] = None,
+        micro_batch_max_wait: Optional[float] = None,
+        concurrency_limiter: Union[str, ConcurrencyLimiter, None] = None,
+        enable_rate_limiter: bool = True,
+        rate_limit: Optional[float] = None,
+        enable_circuit_breaker: bool = True,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        enable_hedging: bool = False,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        enable_retry_budget: bool = True,
+        retry_budget: Optional[RetryBudget] = None,
+        idempotency_log: Union[str, IdempotencyLog, None] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        cache_path: Optional[str] = None,
+        enable_completion_cache: bool = False,
+        completion_cache: Optional[CompletionCache] = None,
+        json_codec: Union[str, JSONCodec, None] = None,
+        spill_threshold: Optional[int] = None,
+        typed_responses: bool = False,
+        compression: Union[str, CompressionPolicy, None] = None,
+        compression_threshold: Optional[int] = None,
+        connector: Optional[SharedConnector] = None,
+        sync_engine: Union[bool, AsyncEngine, None] = None,
     ):
         """
         Initialize the Swarms API client with optimized settings.
@@ -133,6 +245,81 @@ class SwarmsClient:
             jitter (bool): Whether to add random jitter to retry delays.
             enable_cache (bool): Whether to enable response caching.
             thread_pool_size (Optional[int]): Maximum number of threads for sync operations.
+            stream_buffer_size (Optional[int]): Maximum number of stream events buffered
+                ahead of a slow consumer before reading from the connection pauses.
+            enable_coalescing (bool): Whether concurrent identical GET requests
+                share a single in-flight request.
+            coalesce_deterministic_requests (bool): Whether concurrent identical
+                agent and swarm completions with temperature 0 share a single
+                in-flight request.
+            enable_micro_batching (bool): Whether concurrent async_run_agent calls
+                are collected and sent together through the batch endpoint.
+            micro_batch_max_size (Optional[int]): Maximum agent calls per micro-batch.
+            micro_batch_max_bytes (Optional[int]): Maximum payload size per micro-batch.
+            micro_batch_max_wait (Optional[float]): Maximum time in seconds a call
+                waits for its micro-batch to fill.
+            concurrency_limiter (Union[str, ConcurrencyLimiter, None]): Limiter
+                gating requests in flight: "fixed", "aimd", "gradient" or an
+                instance. Adaptive limiters start at max_concurrent_requests.
+            enable_rate_limiter (bool): Whether all requests share a rate limiter
+                that follows Retry-After and X-RateLimit-* response headers.
+            rate_limit (Optional[float]): Client-side cap in requests per second
+                applied until the server advertises its own limit.
+            enable_circuit_breaker (bool): Whether calls fail fast with
+                CircuitOpenError while their base URL or endpoint is failing.
+            circuit_breakers (Optional[CircuitBreakerRegistry]): Registry holding
+                the circuit breakers. Defaults to one built from config.
+            enable_hedging (bool): Whether GET requests slower than the observed
+                p95 latency get a second attempt, sent to the alternate base URL.
+            hedging_policy (Optional[HedgingPolicy]): Custom hedging policy.
+                Passing one enables hedging. POST requests, which include
+                every completion, are only hedged when a completion method is
+                called with ``hedge=True``.
+            enable_retry_budget (bool): Whether retries are capped at a fraction
+                of recent successful requests, failing immediately beyond it.
+            retry_budget (Optional[RetryBudget]): Retry budget, which may be
+                shared between clients. Defaults to one built from config.
+            idempotency_log (Union[str, IdempotencyLog, None]): Path of a local
+                log, or a log instance, storing the results of POSTs sent with
+                an idempotency_key for SWARMS_API_IDEMPOTENCY_TTL seconds. A
+                request resubmitted with a logged key returns the stored result.
+            cache_backend (Optional[CacheBackend]): Shared or persistent cache
+                backend used behind the in-memory response cache. Responses
+                are kept under their own key namespace.
+            cache_path (Optional[str]): Path of a SQLite response cache shared
+                between processes and kept across restarts, used when no
+                cache_backend is given. Defaults to SWARMS_API_CACHE_PATH.
+            enable_completion_cache (bool): Whether results of deterministic
+                agent and swarm completions are cached by request fingerprint,
+                in the persistent cache backend when one is configured.
+            completion_cache (Optional[CompletionCache]): Custom completion
+                cache. Passing one enables completion caching.
+            json_codec (Union[str, JSONCodec, None]): JSON codec for request
+                and response bodies: "auto", "orjson", "msgspec", "json" or an
+                instance. "auto" picks the fastest installed codec.
+            spill_threshold (Optional[int]): Size in bytes above which a field
+                of a response is written to a temporary file while it is
+                decoded, and returned as a SpilledField. Enables incremental
+                decoding of every response. Defaults to SWARMS_API_SPILL_THRESHOLD.
+            typed_responses (bool): Whether agent, swarm, batch and log results
+                are returned as AgentResult, SwarmResult, BatchResult and
+                LogEntry objects, which keep the raw response bytes and decode
+                fields on first access, instead of dicts. Responses holding
+                fields spilled to disk are returned as dicts.
+            compression (Union[str, CompressionPolicy, None]): Request body
+                compression: "auto", "zstd", "br", "gzip", "none" or a policy.
+                "auto" uses zstd or brotli once the server advertises them in
+                Accept-Encoding, and gzip until then.
+            compression_threshold (Optional[int]): Request bodies smaller than
+                this many bytes are sent uncompressed.
+            connector (Optional[SharedConnector]): Connector shared with other
+                clients, which keeps it open until its own aclose(). By default
+                the client creates its own, closed by the client's aclose().
+            sync_engine (Union[bool, AsyncEngine, None]): Run sync methods on
+                the async implementation in a background event loop, so they
+                get its retries, limiter and coalescing and all threads share
+                one connection pool. True uses the engine shared by all
+                clients. Defaults to SWARMS_API_SYNC_ENGINE.
 
         Raises:
             AuthenticationError: If no API key is provided or found in environment.
@@ -159,17 +346,131 @@ class SwarmsClient:
             max_workers=self.thread_pool_size, thread_name_prefix="swarms_client_worker"
         )
 
-        # Initialize async semaphore
-        self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        # Initialize concurrency limiter
+        self.limiter = create_limiter(concurrency_limiter, self.max_concurrent_requests)
+
+        # Initialize connection pool shared by sync calls on all threads
+        self.sync_pool = SyncConnectionPool(
+            headers=self._get_headers(),
+            pool_size=self.limiter.max_limit,
+        )
+
+        # Initialize client-wide rate limiter
+        self.rate_limiter = (
+            RateLimiter(rate=rate_limit) if enable_rate_limiter else None
+        )
+
+        # Initialize hedging of slow idempotent requests
+        self.hedging_policy = hedging_policy
+        if enable_hedging and hedging_policy is None:
+            self.hedging_policy = HedgingPolicy(
+                hedge_base_url=SwarmsConfig.get_alternate_base_url()
+            )
+
+        # Initialize the local result log for duplicate submissions
+        self.idempotency_log = (
+            IdempotencyLog(idempotency_log)
+            if isinstance(idempotency_log, str)
+            else idempotency_log
+        )
+
+        # Initialize the async session's connector, created on first use
+        self._owns_connector = connector is None
+        self.connector = connector or SharedConnector(limit=self.limiter.max_limit)
+        # Initialize the background loop running sync calls, if enabled
+        if sync_engine is None:
+            sync_engine = SwarmsConfig.get_sync_engine()
+        if isinstance(sync_engine, AsyncEngine):
+            self.engine: Optional[AsyncEngine] = sync_engine
+        else:
+            self.engine = get_engine() if sync_engine else None
+
+        self._async_sessions: LoopLocal[aiohttp.ClientSession] = LoopLocal(
+            self._create_async_session, on_discard=lambda session: session.detach()
+        )
+
+        # Bound on events buffered between the connection and a stream consumer
+        self.stream_buffer_size = (
+            stream_buffer_size or SwarmsConfig.get_stream_buffer_size()
+        )
+
+        # Initialize the JSON codec
+        self.codec = get_codec(json_codec)
+        self.spill_threshold = spill_threshold or SwarmsConfig.get_spill_threshold()
+        self.typed_responses = typed_responses
 
-        # Initialize sessions
-        self.async_session = None
+        # Initialize request body compression
+        self.compression = (
+            compression
+            if isinstance(compression, CompressionPolicy)
+            else CompressionPolicy(compression, threshold=compression_threshold)
+        )
+
+        # Initialize the shared or persistent cache tier. Only cache tiers
+        # created here are closed with the client; a given backend may be
+        # shared with other clients.
+        self._owned_caches: List[CacheBackend] = []
+        cache_path = cache_path or SwarmsConfig.get_cache_path()
+        if (
+            cache_backend is None
+            and cache_path
+            and (enable_cache or enable_completion_cache)
+        ):
+            cache_backend = SQLiteCacheBackend(cache_path, codec=self.codec)
+            self._owned_caches.append(cache_backend)
 
         # Initialize response cache
         self.enable_cache = enable_cache
         if enable_cache:
-            self.cache = TTLCache(
-                maxsize=1000, ttl=SwarmsConfig.get_response_cache_ttl()
+            self.cache: CacheBackend = MemoryCacheBackend(maxsize=1000)
+            self._owned_caches.append(self.cache)
+            if cache_backend is not None:
+                # Clearing responses must leave stored completions alone
+                self.cache = TieredCache(
+                    self.cache, NamespacedCache(cache_backend, "response")
+                )
+
+        # Initialize completion cache
+        self.completion_cache = completion_cache
+        if enable_completion_cache and completion_cache is None:
+            # In-process copies expire quickly, so invalidations made by other
+            # processes on the shared tier take effect here soon
+            completion_l1 = MemoryCacheBackend(
+                maxsize=1000, ttl=SwarmsConfig.get_completion_cache_l1_ttl()
+            )
+            self.completion_cache = CompletionCache(
+                backend=(
+                    TieredCache(completion_l1, cache_backend)
+                    if cache_backend is not None
+                    else None
+                ),
+                ttl=SwarmsConfig.get_completion_cache_ttl(),
+            )
+            self._owned_caches.append(
+                completion_l1
+                if cache_backend is not None
+                else self.completion_cache.backend
+            )
+
+        # Initialize in-flight request coalescing
+        self.enable_coalescing = enable_coalescing
+        self.coalesce_deterministic_requests = coalesce_deterministic_requests
+        self.coalescer = RequestCoalescer()
+
+        # Initialize registry of pre-validated agents
+        self.agent_registry = AgentRegistry()
+
+        # Initialize micro-batching of single agent runs
+        self.micro_batcher = None
+        if enable_micro_batching:
+            self.micro_batcher = AgentMicroBatcher(
+                send_batch=self._send_agent_micro_batch,
+                max_batch_size=micro_batch_max_size
+                or SwarmsConfig.get_micro_batch_max_size(),
+                max_batch_bytes=micro_batch_max_bytes
+                or SwarmsConfig.get_micro_batch_max_bytes(),
+                max_wait=micro_batch_max_wait
+                or SwarmsConfig.get_micro_batch_max_wait(),
             )
 
         # Initialize retry handler
@@ -179,51 +480,85 @@ class SwarmsClient:
             max_retry_delay=max_retry_delay or SwarmsConfig.get_max_retry_delay(),
             retry_on_status=retry_on_status,
             jitter=jitter,
+            circuit_breakers=(
+                circuit_breakers or CircuitBreakerRegistry()
+                if enable_circuit_breaker
+                else None
+            ),
+            retry_budget=(
+                retry_budget or RetryBudget() if enable_retry_budget else None
+            ),
         )
 
         logger.info(f"Initialized SwarmsClient with base URL: {self.base_url}")
 
     def _get_sync_session(self) -> requests.Session:
-        """Get or create thread-local sync session."""
-        if not hasattr(_thread_local, "session"):
-            session = requests.Session()
-            session.headers.update(self._get_headers())
-            adapter = requests.adapters.HTTPAdapter(
-                pool_connections=self.max_concurrent_requests,
-                pool_maxsize=self.max_concurrent_requests,
-                max_retries=self.max_retries,
-                pool_block=False,
-            )
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            _thread_local.session = session
-        return _thread_local.session
+        """
+        Get the calling thread's session of this client's sync pool.
 
-    async def __aenter__(self):
-        """Create optimized aiohttp session when entering async context."""
-        tcp_connector = aiohttp.TCPConnector(
-            limit=self.max_concurrent_requests,
-            ttl_dns_cache=SwarmsConfig.get_dns_cache_ttl(),
-            use_dns_cache=True,
-            force_close=False,
-            enable_cleanup_closed=True,
-            tcp_nodelay=SwarmsConfig.get_tcp_nodelay(),
-            keepalive_timeout=SwarmsConfig.get_keepalive_timeout(),
-        )
-
-        self.async_session = aiohttp.ClientSession(
+        Sessions carry this client's headers, and all of them share one pool
+        of keep-alive connections bounded by the concurrency limit.
+        """
+        return self.sync_pool.session()
+
+    @property
+    def async_session(self) -> Optional[aiohttp.ClientSession]:
+        """The running loop's async session, if one was created."""
+        return self._async_sessions.peek()
+
+    def _create_async_session(self) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
             headers=self._get_headers(),
             timeout=aiohttp.ClientTimeout(total=self.timeout),
-            connector=tcp_connector,
-            json_serialize=json.dumps,
+            connector=self.connector.get(),
+            connector_owner=False,
             raise_for_status=True,
         )
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """
+        Get the running loop's async session, creating it if needed.
+
+        Sessions are created on first use, so async methods work without
+        `async with`, and one is kept per event loop, so the client can be
+        used from several loops. A closed session is replaced.
+        """
+        session = self._async_sessions.get()
+        if session.closed:
+            self._async_sessions.pop()
+            session = self._async_sessions.get()
+        return session
+
+    async def __aenter__(self):
+        """Create the async session when entering async context."""
+        self._get_async_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close the async session when exiting context."""
-        if self.async_session:
-            await self.async_session.close()
+        """Close the running loop's async session when exiting context."""
+        await self.aclose(all_loops=False)
+
+    async def aclose(self, all_loops: bool = True) -> None:
+        """
+        Close the async sessions, and the connector unless it is shared.
+
+        The running loop's session is closed before returning; those of other
+        running loops are closed on their own loops. The client stays usable
+        and opens a new session on its next call.
+
+        Args:
+            all_loops (bool): Whether to close the sessions of all loops, or
+                only the running loop's
+        """
+        current = self._async_sessions.pop()
+        if all_loops:
+            for loop, session in self._async_sessions.items():
+                if not session.closed:
+                    asyncio.run_coroutine_threadsafe(session.close(), loop)
+        if current is not None and not current.closed:
+            await current.close()
+        if self._owns_connector:
+            await self.connector.aclose(all_loops=all_loops)
 
     def __enter__(self):
         """Enter sync context."""
@@ -235,15 +570,19 @@ class SwarmsClient:
 
     def close(self):
         """Close all sessions and cleanup resources."""
-        if hasattr(_thread_local, "session"):
-            _thread_local.session.close()
-            delattr(_thread_local, "session")
+        self.sync_pool.close()
+
+        if self.engine is not None and self.engine.running:
+            self.engine.run(self.aclose())
 
         if self.thread_pool:
             self.thread_pool.shutdown(wait=False)
 
-        if self.async_session and not self.async_session.closed:
-            asyncio.create_task(self.async_session.close())
+        for cache in self._owned_caches:
+            cache.close()
+
+        if self.async_session is not None and not self.async_session.closed:
+            asyncio.create_task(self.aclose())
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
@@ -254,94 +593,330 @@ class SwarmsClient:
             "Connection": "keep-alive",
         }
 
+    def _update_rate_limit(
+        self, status: int, headers: Optional[Any]
+    ) -> Optional[float]:
+        """
+        Feed a response's rate limit headers to the rate limiter.
+
+        Returns:
+            Optional[float]: The server's Retry-After delay, if any
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(status, headers)
+        return parse_retry_after(headers.get("Retry-After")) if headers else None
+
+    def _get_logged_result(self, idempotency_key: str) -> Optional[Any]:
+        """Get the logged result of an earlier submission with the same key."""
+        if self.idempotency_log is None:
+            return None
+
+        stored_response = self.idempotency_log.get(idempotency_key)
+        if stored_response is not None:
+            logger.info(
+                f"Returning logged result for idempotency key {idempotency_key}"
+            )
+        return stored_response
+
+    def _get_circuit_keys(self, method: str, endpoint: str) -> Tuple[str, str]:
+        """Get the circuits guarding a request: its base URL and its endpoint."""
+        return self.base_url, f"{method} {urljoin(self.base_url, endpoint)}"
+
     def _get_cache_key(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict] = None,
+        data: Optional[bytes] = None,
         params: Optional[Dict] = None,
     ) -> str:
-        """Generate a unique cache key for the request."""
+        """Generate a unique cache key for the request from its encoded body."""
         key_parts = [method, endpoint]
         if params:
             key_parts.append(json.dumps(params, sort_keys=True))
+        hasher = hashlib.sha256("|".join(key_parts).encode())
         if data:
-            key_parts.append(json.dumps(data, sort_keys=True))
-        key_string = "|".join(key_parts)
-        return hashlib.sha256(key_string.encode()).hexdigest()
+            hasher.update(b"|")
+            hasher.update(data)
+        return hasher.hexdigest()
+
+    def _encode_body(self, data: Union[Dict[str, Any], bytes, None]) -> Optional[bytes]:
+        """Encode a request body with the client's codec, unless already encoded."""
+        if data is None or isinstance(data, bytes):
+            return data
+        return self.codec.dumps(data)
+
+    def _decode_response(self, body: bytes) -> Any:
+        """Decode a response body with the client's codec."""
+        return self.codec.loads(body) if body else None
+
+    def _as_data(self, response: Any) -> Any:
+        """Decode a response returned undecoded for a typed result."""
+        return self.codec.loads(response) if isinstance(response, bytes) else response
+
+    def _as_result(
+        self, response: Any, result_type: Type[LazyResult], **kwargs: Any
+    ) -> Any:
+        """Wrap a response in a typed result if typed responses are enabled."""
+        if not self.typed_responses:
+            return response
+        if not isinstance(response, bytes):
+            # Spilled fields live in temporary files and cannot be re-encoded
+            if has_spilled_fields(response):
+                return response
+            # Results from caches, logs and micro-batches arrive decoded
+            response = self.codec.dumps(response)
+        return result_type(response, self.codec.loads, **kwargs)
+
+    def _new_parser(
+        self, projection: Optional[Iterable[str]]
+    ) -> Optional[IncrementalJSONParser]:
+        """Create an incremental parser when a response should not be read whole."""
+        if projection is None and self.spill_threshold is None:
+            return None
+        return IncrementalJSONParser(
+            projection=projection,
+            spill_threshold=self.spill_threshold,
+            loads=self.codec.loads,
+        )
+
+    async def _async_decode_incremental(
+        self,
+        response: aiohttp.ClientResponse,
+        parser: IncrementalJSONParser,
+    ) -> Any:
+        """Decode a response body chunk by chunk as it arrives."""
+        async for chunk in response.content.iter_chunked(
+            SwarmsConfig.DEFAULT_DECODE_CHUNK_SIZE
+        ):
+            parser.feed(chunk)
+        return parser.close()
+
+    def _sync_decode_incremental(
+        self,
+        response: requests.Response,
+        parser: IncrementalJSONParser,
+    ) -> Any:
+        """Decode a streamed response body chunk by chunk as it arrives."""
+        for chunk in response.iter_content(SwarmsConfig.DEFAULT_DECODE_CHUNK_SIZE):
+            parser.feed(chunk)
+        return parser.close()
 
     async def _async_request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Union[Dict[str, Any], bytes, None] = None,
         params: Optional[Dict[str, Any]] = None,
         skip_cache: bool = False,
+        coalesce: Optional[bool] = None,
+        hedge: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        raw: bool = False,
     ) -> Dict[str, Any]:
-        """Make an optimized async HTTP request."""
+        """
+        Make an optimized async HTTP request.
+
+        The body may be passed already encoded, e.g. by ``dump_model``;
+        otherwise it is encoded once with the client's codec, before retries.
+
+        Every POST carries an idempotency key, generated unless given, that
+        stays the same across retries and hedges. With an idempotency log, the
+        results of POSTs with a given key are logged, and a POST whose key is
+        already logged returns the stored result.
+
+        Concurrent identical requests are coalesced into a single in-flight
+        request by default for GET requests; other methods must opt in with
+        ``coalesce=True`` and should only do so when the request is deterministic.
+
+        With a hedging policy, requests using one of the policy's methods are
+        hedged by default. Other requests, such as completion POSTs, are only
+        hedged with ``hedge=True``.
+
+        With a projection, or a spill threshold on the client, a successful
+        response is decoded incrementally as it arrives and only the projected
+        fields are kept. Such responses are never cached.
+
+        With ``raw=True``, a fetched response is returned undecoded as bytes
+        and is not cached either; results from the idempotency log are still
+        returned decoded.
+        """
         url = urljoin(self.base_url, endpoint)
+        body = self._encode_body(data)
+        incremental = projection is not None or self.spill_threshold is not None
+        raw = raw and not incremental
+        skip_cache = skip_cache or incremental or raw
+
+        if coalesce is None:
+            coalesce = self.enable_coalescing and method == "GET"
+        if hedge is None:
+            hedge = (
+                self.hedging_policy is not None
+                and method in self.hedging_policy.methods
+            )
+
+        headers = None
+        # Only a caller-chosen key can be resubmitted, so only it is logged
+        logged_key = idempotency_key if method == "POST" else None
+        if method == "POST":
+            headers = {IDEMPOTENCY_HEADER: idempotency_key or new_idempotency_key()}
+        if logged_key is not None:
+            stored_response = self._get_logged_result(logged_key)
+            if stored_response is not None:
+                return stored_response
 
         # Check cache for GET requests
         if self.enable_cache and method == "GET" and not skip_cache:
             cache_key = self._get_cache_key(method, endpoint, params=params)
-            cached_response = self.cache.get(cache_key)
+            cached_response = await self.cache.aget(cache_key)
             if cached_response is not None:
                 logger.debug(f"Cache hit for {url}")
                 return cached_response
 
-        async def _do_request() -> Tuple[Dict[str, Any], float]:
+        # Compress once, so retries and hedges resend the same bytes
+        payload, content_encoding = self.compression.compress(body)
+        if content_encoding is not None:
+            headers = {**(headers or {}), "Content-Encoding": content_encoding}
+
+        async def _do_attempt(request_url: str) -> Tuple[Dict[str, Any], float]:
             start_time = time.time()
-            async with self.semaphore:
-                async with self.async_session.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    params=params,
-                    compress=True,
-                ) as response:
-                    response_data = await response.json()
-                    request_time = time.time() - start_time
-
-                    if response.status == 200:
-                        return response_data, request_time
-                    elif response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    elif response.status == 429:
-                        raise RateLimitError("Rate limit exceeded")
-                    else:
-                        raise APIError(
-                            f"API request failed: {response_data.get('detail', 'Unknown error')}",
-                            response.status,
-                            response_data,
+            try:
+                async with self.limiter.acquire() as permit:
+                    # Wait for the rate limit only once a slot is held, so
+                    # queued requests see pauses that began while they queued
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire()
+                        permit.restart_timer()
+
+                    async with self._get_async_session().request(
+                        method=method,
+                        url=request_url,
+                        data=payload,
+                        params=params,
+                        headers=headers,
+                    ) as response:
+                        retry_after = self._update_rate_limit(
+                            response.status, response.headers
                         )
+                        self.compression.update(response.headers)
+                        parser = self._new_parser(projection)
+                        if parser is not None and response.status == 200:
+                            response_data = await self._async_decode_incremental(
+                                response, parser
+                            )
+                        elif raw and response.status == 200:
+                            response_data = await response.read()
+                        else:
+                            response_data = self._decode_response(await response.read())
+                        request_time = time.time() - start_time
+
+                        if response.status == 200:
+                            return response_data, request_time
+                        elif response.status == 401:
+                            raise AuthenticationError("Invalid API key")
+                        elif response.status == 429:
+                            raise RateLimitError(
+                                "Rate limit exceeded", retry_after=retry_after
+                            )
+                        else:
+                            raise APIError(
+                                f"API request failed: {response_data.get('detail', 'Unknown error')}",
+                                response.status,
+                                response_data,
+                            )
+            except aiohttp.ClientResponseError as e:
+                retry_after = self._update_rate_limit(e.status, e.headers)
+                if e.status == 415 and content_encoding is not None:
+                    self.compression.reject(content_encoding)
+                if e.status == 429:
+                    raise RateLimitError(
+                        "Rate limit exceeded", retry_after=retry_after
+                    ) from e
+                raise
 
-        try:
-            response_data, request_time = await self.retry_handler.execute_with_retry(
-                _do_request
+        async def _do_request() -> Tuple[Dict[str, Any], float]:
+            if not hedge or self.hedging_policy is None:
+                return await _do_attempt(url)
+
+            hedge_url = urljoin(
+                self.hedging_policy.hedge_base_url or self.base_url, endpoint
             )
+            return await self.hedging_policy.run(
+                f"{method} {endpoint}",
+                lambda is_hedge: _do_attempt(hedge_url if is_hedge else url),
+            )
+
+        async def _send() -> Dict[str, Any]:
+            try:
+                response_data, request_time = (
+                    await self.retry_handler.execute_with_retry(
+                        _do_request,
+                        circuit_keys=self._get_circuit_keys(method, endpoint),
+                    )
+                )
 
-            # Cache successful GET responses
-            if self.enable_cache and method == "GET" and not skip_cache:
-                cache_key = self._get_cache_key(method, endpoint, params=params)
-                self.cache[cache_key] = response_data
+                # Cache successful GET responses
+                if self.enable_cache and method == "GET" and not skip_cache:
+                    cache_key = self._get_cache_key(method, endpoint, params=params)
+                    await self.cache.aset(cache_key, response_data)
 
-            logger.debug(f"Request to {url} completed in {request_time:.2f}s")
-            return response_data
+                logger.debug(f"Request to {url} completed in {request_time:.2f}s")
+                return response_data
 
-        except aiohttp.ClientError as e:
-            logger.error(f"Network error: {str(e)}")
-            raise SwarmsError(f"Network error: {str(e)}")
+            except aiohttp.ClientError as e:
+                logger.error(f"Network error: {str(e)}")
+                raise SwarmsError(f"Network error: {str(e)}")
+
+        if coalesce:
+            coalesce_key = self._get_cache_key(
+                method, endpoint, data=body, params=params
+            )
+            if projection is not None:
+                coalesce_key += "|" + ",".join(sorted(projection))
+            elif raw:
+                coalesce_key += "|raw"
+            response_data = await self.coalescer.run(coalesce_key, _send)
+        else:
+            response_data = await _send()
+
+        # Spilled fields live in temporary files and cannot be logged
+        if (
+            logged_key is not None
+            and self.idempotency_log is not None
+            and self.spill_threshold is None
+        ):
+            await self.idempotency_log.arecord(
+                logged_key, self._as_data(response_data)
+            )
+        return response_data
 
     def _sync_request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Union[Dict[str, Any], bytes, None] = None,
         params: Optional[Dict[str, Any]] = None,
         skip_cache: bool = False,
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        raw: bool = False,
     ) -> Dict[str, Any]:
         """Make an optimized sync HTTP request."""
         url = urljoin(self.base_url, endpoint)
+        body = self._encode_body(data)
+        incremental = projection is not None or self.spill_threshold is not None
+        raw = raw and not incremental
+        skip_cache = skip_cache or incremental or raw
+
+        headers = None
+        # Only a caller-chosen key can be resubmitted, so only it is logged
+        logged_key = idempotency_key if method == "POST" else None
+        if method == "POST":
+            headers = {IDEMPOTENCY_HEADER: idempotency_key or new_idempotency_key()}
+        if logged_key is not None:
+            stored_response = self._get_logged_result(logged_key)
+            if stored_response is not None:
+                return stored_response
 
         # Check cache for GET requests
         if self.enable_cache and method == "GET" and not skip_cache:
@@ -351,43 +926,619 @@ class SwarmsClient:
                 logger.debug(f"Cache hit for {url}")
                 return cached_response
 
-        session = self._get_sync_session()
-        start_time = time.time()
+        payload, content_encoding = self.compression.compress(body)
+        if content_encoding is not None:
+            headers = {**(headers or {}), "Content-Encoding": content_encoding}
 
+        def _do_attempt() -> Any:
+            session = self._get_sync_session()
+            breakers = self.retry_handler.enter_circuits(
+                self._get_circuit_keys(method, endpoint)
+            )
+            with self.limiter.acquire() as permit:
+                # Wait for the rate limit only once a slot is held, as on the
+                # async path
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire_sync()
+                    permit.restart_timer()
+                start_time = time.time()
+
+                try:
+                    response = session.request(
+                        method=method,
+                        url=url,
+                        data=payload,
+                        params=params,
+                        headers=headers,
+                        timeout=self.timeout,
+                        stream=incremental,
+                    )
+                except BaseException as e:
+                    self.retry_handler.exit_circuits(breakers, exception=e)
+                    raise
+                self.retry_handler.exit_circuits(breakers, status=response.status_code)
+                retry_after = self._update_rate_limit(
+                    response.status_code, response.headers
+                )
+                self.compression.update(response.headers)
+                if response.status_code == 415 and content_encoding is not None:
+                    self.compression.reject(content_encoding)
+
+                parser = self._new_parser(projection)
+                if parser is not None and response.status_code == 200:
+                    with response:
+                        response_data = self._sync_decode_incremental(response, parser)
+                elif raw and response.status_code == 200:
+                    response_data = response.content
+                else:
+                    response_data = self._decode_response(response.content)
+                request_time = time.time() - start_time
+
+                if response.status_code == 200:
+                    logger.debug(f"Request to {url} completed in {request_time:.2f}s")
+                    return response_data
+                elif response.status_code == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif response.status_code == 429:
+                    raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
+                else:
+                    raise APIError(
+                        f"API request failed: {response_data.get('detail', 'Unknown error')}",
+                        response.status_code,
+                        response_data,
+                    )
+
+        # Network failures are retried like on the async path; POSTs resend
+        # the same idempotency key, so the server runs them at most once
         try:
-            response = session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                timeout=self.timeout,
+            response_data = self.retry_handler.execute_with_retry_sync(_do_attempt)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error: {str(e)}")
+            raise SwarmsError(f"Network error: {str(e)}")
+
+        # Cache successful GET responses
+        if self.enable_cache and method == "GET" and not skip_cache:
+            cache_key = self._get_cache_key(method, endpoint, params=params)
+            self.cache[cache_key] = response_data
+
+        # Spilled fields live in temporary files and cannot be logged
+        if (
+            logged_key is not None
+            and self.idempotency_log is not None
+            and self.spill_threshold is None
+        ):
+            self.idempotency_log.record(logged_key, self._as_data(response_data))
+        return response_data
+
+    async def _async_stream(
+        self,
+        method: str,
+        endpoint: str,
+        data: Union[Dict[str, Any], bytes, None] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Make an async HTTP request and yield server-sent events as they arrive.
+
+        Events are parsed by a reader task into a bounded buffer, so a slow
+        consumer stops the reader (and therefore the connection) instead of
+        letting unread events accumulate in memory.
+        """
+        url = urljoin(self.base_url, endpoint)
+        body, content_encoding = self.compression.compress(self._encode_body(data))
+        headers = {"Accept": "text/event-stream"}
+        if method == "POST":
+            headers[IDEMPOTENCY_HEADER] = new_idempotency_key()
+        if content_encoding is not None:
+            headers["Content-Encoding"] = content_encoding
+
+        async def _open() -> aiohttp.ClientResponse:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+
+            try:
+                response = await self._get_async_session().request(
+                    method=method,
+                    url=url,
+                    data=body,
+                    headers=headers,
+                )
+            except aiohttp.ClientResponseError as e:
+                retry_after = self._update_rate_limit(e.status, e.headers)
+                if e.status == 429:
+                    raise RateLimitError(
+                        "Rate limit exceeded", retry_after=retry_after
+                    ) from e
+                raise
+
+            self._update_rate_limit(response.status, response.headers)
+            self.compression.update(response.headers)
+            return response
+
+        async def _read(
+            response: aiohttp.ClientResponse, buffer: asyncio.Queue
+        ) -> None:
+            parser = SSEParser(loads=self.codec.loads)
+            try:
+                async for chunk in response.content.iter_any():
+                    for event in parser.feed(chunk):
+                        await buffer.put(event)
+                    if parser.done:
+                        break
+                for event in parser.flush():
+                    await buffer.put(event)
+                await buffer.put(_STREAM_END)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await buffer.put(e)
+
+        async with self.limiter.acquire(sample=False):
+            response = await self.retry_handler.execute_with_retry(
+                _open, circuit_keys=self._get_circuit_keys(method, endpoint)
+            )
+            buffer: asyncio.Queue = asyncio.Queue(maxsize=self.stream_buffer_size)
+            reader = asyncio.ensure_future(_read(response, buffer))
+            start_time = time.time()
+            first_event = True
+
+            try:
+                while True:
+                    item = await buffer.get()
+                    if item is _STREAM_END:
+                        break
+                    if isinstance(item, aiohttp.ClientError):
+                        logger.error(f"Network error: {str(item)}")
+                        raise SwarmsError(f"Network error: {str(item)}")
+                    if isinstance(item, Exception):
+                        raise item
+                    if item.event == "error":
+                        raise SwarmsError(
+                            f"Stream error: {item.data.get('detail', item.delta)}"
+                        )
+                    if first_event:
+                        first_event = False
+                        logger.debug(
+                            f"First event from {url} after {time.time() - start_time:.2f}s"
+                        )
+                    yield item
+            finally:
+                reader.cancel()
+                response.close()
+                logger.debug(
+                    f"Stream from {url} closed after {time.time() - start_time:.2f}s"
+                )
+
+    def _sync_stream(
+        self,
+        method: str,
+        endpoint: str,
+        data: Union[Dict[str, Any], bytes, None] = None,
+    ) -> Iterator[StreamEvent]:
+        """
+        Make a sync HTTP request and yield server-sent events as they arrive.
+
+        The body is read from the socket only as the caller consumes events,
+        so a slow consumer applies backpressure to the connection.
+        """
+        url = urljoin(self.base_url, endpoint)
+        body, content_encoding = self.compression.compress(self._encode_body(data))
+        headers = {"Accept": "text/event-stream"}
+        if method == "POST":
+            headers[IDEMPOTENCY_HEADER] = new_idempotency_key()
+        if content_encoding is not None:
+            headers["Content-Encoding"] = content_encoding
+
+        session = self._get_sync_session()
+        breakers = self.retry_handler.enter_circuits(
+            self._get_circuit_keys(method, endpoint)
+        )
+
+        # Hold a slot for the whole stream, as on the async path, without
+        # feeding its duration to the limit
+        with self.limiter.acquire(sample=False):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire_sync()
+
+            try:
+                response = session.request(
+                    method=method,
+                    url=url,
+                    data=body,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=True,
+                )
+            except requests.exceptions.RequestException as e:
+                self.retry_handler.exit_circuits(breakers, exception=e)
+                logger.error(f"Network error: {str(e)}")
+                raise SwarmsError(f"Network error: {str(e)}")
+            except BaseException as e:
+                self.retry_handler.exit_circuits(breakers, exception=e)
+                raise
+            self.retry_handler.exit_circuits(breakers, status=response.status_code)
+
+            try:
+                retry_after = self._update_rate_limit(
+                    response.status_code, response.headers
+                )
+                self.compression.update(response.headers)
+                if response.status_code == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif response.status_code == 429:
+                    raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
+                elif response.status_code != 200:
+                    try:
+                        response_data = self._decode_response(response.content)
+                    except ValueError:
+                        response_data = {"detail": response.text}
+                    raise APIError(
+                        f"API request failed: {response_data.get('detail', 'Unknown error')}",
+                        response.status_code,
+                        response_data,
+                    )
+
+                parser = SSEParser(loads=self.codec.loads)
+                for chunk in response.iter_content(chunk_size=None):
+                    for event in parser.feed(chunk):
+                        if event.event == "error":
+                            raise SwarmsError(
+                                f"Stream error: {event.data.get('detail', event.delta)}"
+                            )
+                        yield event
+                    if parser.done:
+                        break
+                for event in parser.flush():
+                    yield event
+
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Network error: {str(e)}")
+                raise SwarmsError(f"Network error: {str(e)}")
+            finally:
+                response.close()
+
+    async def _send_agent_micro_batch(self, agents: List[bytes]) -> Any:
+        """Send a micro-batch of encoded agent completions to the batch endpoint."""
+        return await self._async_request(
+            "POST",
+            "/v1/agent/batch/completions",
+            data=b'{"agents":[' + b",".join(agents) + b"]}",
+        )
+
+    def _split_batch_items(
+        self, response: Any, count: int, result_type: Type[LazyResult]
+    ) -> List[Tuple[Any, Optional[Exception]]]:
+        """Split a batch response into the result or error of each item."""
+        if not isinstance(response, bytes):
+            outcomes = []
+            for result in split_batch_response(response, count):
+                error = get_item_error(result)
+                if error is not None:
+                    outcomes.append((None, error))
+                else:
+                    outcomes.append((self._as_result(result, result_type), None))
+            return outcomes
+
+        batch = BatchResult(response, self.codec.loads, item_type=result_type)
+        if len(batch) != count:
+            raise SwarmsError(
+                f"Batch response contained {len(batch)} results, expected {count}"
             )
-            request_time = time.time() - start_time
+        outcomes = []
+        for item in batch:
+            # Only decode the items that may report an error
+            error = (
+                get_item_error(item.to_dict())
+                if b'"error"' in item.raw or b'"failed"' in item.raw
+                else None
+            )
+            outcomes.append((None, error) if error is not None else (item, None))
+        return outcomes
 
-            response_data = response.json()
+    def _batch_settings(
+        self,
+        chunk_size: Optional[int],
+        chunk_bytes: Optional[int],
+        item_retries: Optional[int],
+    ) -> Tuple[int, int, int]:
+        """Resolve the chunk size, chunk byte cap and item retries of a batch."""
+        return (
+            chunk_size or SwarmsConfig.get_batch_chunk_size(),
+            chunk_bytes or SwarmsConfig.get_batch_chunk_bytes(),
+            (
+                SwarmsConfig.get_batch_item_retries()
+                if item_retries is None
+                else item_retries
+            ),
+        )
 
-            if response.status_code == 200:
-                # Cache successful GET responses
-                if self.enable_cache and method == "GET" and not skip_cache:
-                    cache_key = self._get_cache_key(method, endpoint, params=params)
-                    self.cache[cache_key] = response_data
+    @staticmethod
+    def _chunk_batch(
+        payloads: List[bytes], indices: List[int], max_items: int, max_bytes: int
+    ) -> List[List[int]]:
+        """Group the given batch items into chunks of input indices."""
+        sizes = [len(payloads[index]) for index in indices]
+        return [
+            [indices[position] for position in chunk]
+            for chunk in chunk_payloads(sizes, max_items, max_bytes)
+        ]
 
-                logger.debug(f"Request to {url} completed in {request_time:.2f}s")
-                return response_data
-            elif response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            elif response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded")
+    @staticmethod
+    def _batch_chunk_request(
+        key: str,
+        payloads: List[bytes],
+        indices: List[int],
+        attempt: int,
+        idempotency_key: Optional[str],
+    ) -> Tuple[bytes, Optional[str]]:
+        """Build the body and idempotency key of one chunk request."""
+        body = (
+            b'{"'
+            + key.encode()
+            + b'":['
+            + b",".join(payloads[index] for index in indices)
+            + b"]}"
+        )
+        if idempotency_key:
+            idempotency_key = f"{idempotency_key}-{indices[0]}-{len(indices)}-{attempt}"
+        return body, idempotency_key
+
+    def _settle_batch_chunk(
+        self,
+        indices: List[int],
+        attempt: int,
+        outcomes: Union[List[Tuple[Any, Optional[Exception]]], Exception],
+        retries: int,
+        max_items: int,
+    ) -> Tuple[List[BatchItem], List[int], int]:
+        """
+        Sort the outcome of a chunk into finished items and items to resubmit.
+
+        Returns:
+            Tuple[List[BatchItem], List[int], int]: Finished items, indices of
+                the items to resubmit, and the chunk size to resubmit them in
+        """
+        chunk_failed = isinstance(outcomes, Exception)
+        if chunk_failed:
+            outcomes = [(None, outcomes)] * len(indices)
+
+        finished = []
+        failed = []
+        for index, (result, error) in zip(indices, outcomes):
+            if error is None:
+                finished.append(BatchItem(index, result, None))
+            elif attempt < retries and is_overload_error(error):
+                failed.append(BatchItem(index, None, error))
             else:
-                raise APIError(
-                    f"API request failed: {response_data.get('detail', 'Unknown error')}",
-                    response.status_code,
-                    response_data,
+                finished.append(BatchItem(index, None, error))
+
+        if not failed:
+            return finished, [], max_items
+        budget = self.retry_handler.retry_budget
+        if budget is not None and not budget.try_spend():
+            return finished + failed, [], max_items
+
+        logger.warning(
+            f"Resubmitting {len(failed)} failed batch items "
+            f"(attempt {attempt + 1}/{retries})"
+        )
+        # Resubmit the items of a failed chunk in halves, so requests too
+        # large to finish in time shrink
+        limit = (
+            (len(failed) + 1) // 2 if chunk_failed and len(failed) > 1 else max_items
+        )
+        return finished, [item.index for item in failed], limit
+
+    async def _async_iter_batch(
+        self,
+        endpoint: str,
+        key: str,
+        items: List[Dict[str, Any]],
+        result_type: Type[LazyResult],
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Run a batch as concurrent chunk requests, yielding items as they finish.
+
+        Items are encoded once and grouped into chunks of at most chunk_size
+        items and chunk_bytes bytes, which are all dispatched at once and
+        bounded by the concurrency limiter. Items that fail with a retryable
+        error, alone or with their whole chunk, are grouped into new chunks
+        and resubmitted after a backoff delay.
+
+        Yields:
+            BatchItem: Input index, result and error of each item, in
+                completion order
+        """
+        max_items, max_bytes, retries = self._batch_settings(
+            chunk_size, chunk_bytes, item_retries
+        )
+        payloads = [self.codec.dumps(item) for item in items]
+
+        async def _send_chunk(indices: List[int], attempt: int) -> Tuple[
+            List[int],
+            int,
+            Union[List[Tuple[Any, Optional[Exception]]], Exception],
+        ]:
+            if attempt:
+                await asyncio.sleep(self.retry_handler.calculate_delay(attempt))
+            body, chunk_key = self._batch_chunk_request(
+                key, payloads, indices, attempt, idempotency_key
+            )
+            try:
+                response = await self._async_request(
+                    "POST",
+                    endpoint,
+                    data=body,
+                    idempotency_key=chunk_key,
+                    projection=projection,
+                    raw=self.typed_responses,
+                )
+                return (
+                    indices,
+                    attempt,
+                    self._split_batch_items(response, len(indices), result_type),
                 )
+            except Exception as e:
+                return indices, attempt, e
+
+        def _dispatch(indices: List[int], attempt: int, limit: int) -> None:
+            for chunk in self._chunk_batch(payloads, indices, limit, max_bytes):
+                pending.add(asyncio.ensure_future(_send_chunk(chunk, attempt)))
+
+        pending: Set[asyncio.Future] = set()
+        _dispatch(list(range(len(items))), 0, max_items)
+        logger.debug(
+            f"Dispatched {len(items)} batch items to {endpoint} in "
+            f"{len(pending)} chunks"
+        )
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error: {str(e)}")
-            raise SwarmsError(f"Network error: {str(e)}")
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    indices, attempt, outcomes = future.result()
+                    finished, failed, limit = self._settle_batch_chunk(
+                        indices, attempt, outcomes, retries, max_items
+                    )
+                    for item in finished:
+                        yield item
+                    if failed:
+                        _dispatch(failed, attempt + 1, limit)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _iter_batch(
+        self,
+        endpoint: str,
+        key: str,
+        items: List[Dict[str, Any]],
+        result_type: Type[LazyResult],
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+    ) -> Iterator[BatchItem]:
+        """
+        Run a batch as chunk requests on the thread pool, yielding items as
+        they finish.
+
+        Chunks are built as in _async_iter_batch, and the items to resubmit
+        are sent in rounds, after each round's chunks have finished.
+
+        Yields:
+            BatchItem: Input index, result and error of each item, in
+                completion order
+        """
+        max_items, max_bytes, retries = self._batch_settings(
+            chunk_size, chunk_bytes, item_retries
+        )
+        payloads = [self.codec.dumps(item) for item in items]
+
+        def _send_chunk(
+            chunk: Tuple[List[int], int],
+        ) -> List[Tuple[Any, Optional[Exception]]]:
+            indices, attempt = chunk
+            body, chunk_key = self._batch_chunk_request(
+                key, payloads, indices, attempt, idempotency_key
+            )
+            response = self._sync_request(
+                "POST",
+                endpoint,
+                data=body,
+                idempotency_key=chunk_key,
+                projection=projection,
+                raw=self.typed_responses,
+            )
+            return self._split_batch_items(response, len(indices), result_type)
+
+        groups = [(list(range(len(items))), max_items)]
+        attempt = 0
+        while groups:
+            chunks = [
+                (chunk, attempt)
+                for indices, limit in groups
+                for chunk in self._chunk_batch(payloads, indices, limit, max_bytes)
+            ]
+            groups = []
+            if attempt:
+                time.sleep(self.retry_handler.calculate_delay(attempt))
+
+            for position, outcomes in self._map_in_thread_pool(_send_chunk, chunks):
+                finished, failed, limit = self._settle_batch_chunk(
+                    chunks[position][0], attempt, outcomes, retries, max_items
+                )
+                yield from finished
+                if failed:
+                    groups.append((failed, limit))
+            attempt += 1
+
+    async def _async_collect_batch(
+        self,
+        kind: str,
+        endpoint: str,
+        key: str,
+        items: List[Dict[str, Any]],
+        result_type: Type[LazyResult],
+        return_exceptions: bool,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Run a batch in chunks and merge its results in input order."""
+        logger.info(f"Running batch of {len(items)} {kind}")
+        results: List[Any] = [None] * len(items)
+        errors: Dict[int, Exception] = {}
+        async for index, result, error in self._async_iter_batch(
+            endpoint, key, items, result_type, **kwargs
+        ):
+            results[index] = result if error is None else error
+            if error is not None:
+                errors[index] = error
+        return self._finish_batch(kind, results, errors, return_exceptions)
+
+    def _collect_batch(
+        self,
+        kind: str,
+        endpoint: str,
+        key: str,
+        items: List[Dict[str, Any]],
+        result_type: Type[LazyResult],
+        return_exceptions: bool,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Run a batch in chunks on the thread pool and merge its results."""
+        logger.info(f"Running batch of {len(items)} {kind}")
+        results: List[Any] = [None] * len(items)
+        errors: Dict[int, Exception] = {}
+        for index, result, error in self._iter_batch(
+            endpoint, key, items, result_type, **kwargs
+        ):
+            results[index] = result if error is None else error
+            if error is not None:
+                errors[index] = error
+        return self._finish_batch(kind, results, errors, return_exceptions)
+
+    @staticmethod
+    def _finish_batch(
+        kind: str,
+        results: List[Any],
+        errors: Dict[int, Exception],
+        return_exceptions: bool,
+    ) -> List[Any]:
+        """Return merged batch results, or raise BatchError if items failed."""
+        if errors:
+            logger.warning(f"{len(errors)} of {len(results)} batch {kind} failed")
+            if not return_exceptions:
+                raise BatchError(results, errors)
+        else:
+            logger.info(f"Successfully ran batch of {len(results)} {kind}")
+        return results
 
     # Async methods
     async def async_get_health(self) -> Dict[str, Any]:
@@ -421,7 +1572,11 @@ class SwarmsClient:
         messages: Optional[List[Dict[str, Any]]] = None,
         stream: bool = False,
         service_tier: str = "standard",
-    ) -> Dict[str, Any]:
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        projection: Optional[Iterable[str]] = None,
+        hedge: Optional[bool] = None,
+    ) -> Union[Dict[str, Any], SwarmResult]:
         """
         Create and run a swarm with specified configuration asynchronously.
 
@@ -439,9 +1594,20 @@ class SwarmsClient:
             messages (Optional[List[Dict[str, Any]]]): List of messages
             stream (bool): Whether to stream output
             service_tier (str): Service tier for processing
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts. Generated if not given.
+            cache_ttl (Optional[float]): Expiry in seconds of this result in the
+                completion cache. Defaults to the completion cache's TTL.
+            projection (Optional[Iterable[str]]): Dotted paths of the result
+                fields to keep, e.g. ["output", "usage"]. The response is
+                decoded as it arrives and other fields are never materialized.
+            hedge (Optional[bool]): Whether this run may get a hedged second
+                attempt when slow. Only safe for deterministic runs or when the
+                server deduplicates by idempotency key. Defaults to the hedging
+                policy's methods, which exclude POST.
 
         Returns:
-            Dict[str, Any]: Swarm execution results
+            Union[Dict[str, Any], SwarmResult]: Swarm execution results
         """
         try:
             # Create swarm spec using Pydantic model for validation
@@ -461,40 +1627,148 @@ class SwarmsClient:
                 service_tier=service_tier,
             )
 
-            logger.info(f"Creating swarm: {name}")
-            response = await self._async_request(
-                "POST",
-                "/v1/swarm/completions",
-                data=swarm_spec.model_dump(exclude_none=True),
+            return await self._async_run_swarm_spec(
+                swarm_spec,
+                idempotency_key=idempotency_key,
+                cache_ttl=cache_ttl,
+                projection=projection,
+                hedge=hedge,
             )
-            logger.info(f"Successfully created swarm: {name}")
-            return response
 
         except Exception as e:
             logger.error(f"Error creating swarm: {str(e)}")
             raise
 
-    async def async_run_swarm(self, swarm_id: str) -> Dict[str, Any]:
+    async def _async_run_swarm_spec(
+        self,
+        swarm_spec: SwarmSpec,
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        projection: Optional[Iterable[str]] = None,
+        hedge: Optional[bool] = None,
+    ) -> Union[Dict[str, Any], SwarmResult]:
+        """Run a validated swarm spec, through the completion cache."""
+        # Projected results are partial, so they bypass the completion cache
+        use_completion_cache = self.completion_cache is not None and projection is None
+        if use_completion_cache:
+            cached_response = await self.completion_cache.aget(swarm_spec)
+            if cached_response is not None:
+                logger.info(f"Completion cache hit for swarm: {swarm_spec.name}")
+                return self._as_result(cached_response, SwarmResult)
+
+        logger.info(f"Creating swarm: {swarm_spec.name}")
+        response = await self._async_request(
+            "POST",
+            "/v1/swarm/completions",
+            data=dump_model(swarm_spec),
+            coalesce=self.coalesce_deterministic_requests
+            and is_deterministic(swarm_spec),
+            hedge=hedge,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            raw=self.typed_responses,
+        )
+        # Spilled fields live in temporary files and cannot be cached
+        if use_completion_cache and self.spill_threshold is None:
+            await self.completion_cache.aset(
+                swarm_spec, self._as_data(response), ttl=cache_ttl
+            )
+        logger.info(f"Successfully created swarm: {swarm_spec.name}")
+        return self._as_result(response, SwarmResult)
+
+    async def async_stream_swarm(
+        self,
+        name: str,
+        task: str,
+        agents: List[AgentSpec],
+        description: Optional[str] = None,
+        max_loops: int = 1,
+        swarm_type: Optional[str] = None,
+        rearrange_flow: Optional[str] = None,
+        return_history: bool = True,
+        rules: Optional[str] = None,
+        tasks: Optional[List[str]] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        service_tier: str = "standard",
+    ) -> AsyncIterator[StreamEvent]:
         """
-        Run a swarm with the specified ID asynchronously.
+        Create and run a swarm, yielding its output events as they arrive asynchronously.
 
         Args:
-            swarm_id (str): ID of the swarm to run
+            name (str): Name of the swarm
+            task (str): Main task for the swarm
+            agents (List[AgentSpec]): List of agent specifications
+            description (Optional[str]): Swarm description
+            max_loops (int): Maximum execution loops
+            swarm_type (Optional[str]): Type of swarm architecture
+            rearrange_flow (Optional[str]): Flow rearrangement instructions
+            return_history (bool): Whether to return execution history
+            rules (Optional[str]): Swarm behavior rules
+            tasks (Optional[List[str]]): List of tasks
+            messages (Optional[List[Dict[str, Any]]]): List of messages
+            service_tier (str): Service tier for processing
 
-        Returns:
-            Dict[str, Any]: Swarm execution results
+        Yields:
+            StreamEvent: Events carrying the agent name, step and token delta
         """
         try:
-            logger.info(f"Running swarm: {swarm_id}")
-            response = await self._async_request("POST", f"/v1/swarm/{swarm_id}/run")
-            logger.info(f"Successfully ran swarm: {swarm_id}")
-            return response
+            # Create swarm spec using Pydantic model for validation
+            swarm_spec = SwarmSpec(
+                name=name,
+                description=description,
+                agents=agents,
+                max_loops=max_loops,
+                swarm_type=swarm_type,
+                rearrange_flow=rearrange_flow,
+                task=task,
+                return_history=return_history,
+                rules=rules,
+                tasks=tasks,
+                messages=messages,
+                stream=True,
+                service_tier=service_tier,
+            )
+
+            logger.info(f"Streaming swarm: {name}")
+            async for event in self._async_stream(
+                "POST",
+                "/v1/swarm/completions",
+                data=dump_model(swarm_spec),
+            ):
+                yield event
+            logger.info(f"Successfully streamed swarm: {name}")
+
+        except Exception as e:
+            logger.error(f"Error streaming swarm: {str(e)}")
+            raise
+
+    async def async_run_swarm(
+        self, swarm_id: str
+    ) -> Union[Dict[str, Any], SwarmResult]:
+        """
+        Run a swarm with the specified ID asynchronously.
+
+        Args:
+            swarm_id (str): ID of the swarm to run
+
+        Returns:
+            Union[Dict[str, Any], SwarmResult]: Swarm execution results
+        """
+        try:
+            logger.info(f"Running swarm: {swarm_id}")
+            response = await self._async_request(
+                "POST", f"/v1/swarm/{swarm_id}/run", raw=self.typed_responses
+            )
+            logger.info(f"Successfully ran swarm: {swarm_id}")
+            return self._as_result(response, SwarmResult)
 
         except Exception as e:
             logger.error(f"Error running swarm {swarm_id}: {str(e)}")
             raise
 
-    async def async_get_swarm_logs(self, swarm_id: str) -> List[Dict[str, Any]]:
+    async def async_get_swarm_logs(
+        self, swarm_id: str
+    ) -> Union[List[Dict[str, Any]], BatchResult[LogEntry]]:
         """
         Get execution logs for a specific swarm asynchronously.
 
@@ -502,12 +1776,18 @@ class SwarmsClient:
             swarm_id (str): ID of the swarm
 
         Returns:
-            List[Dict[str, Any]]: List of log entries
+            Union[List[Dict[str, Any]], BatchResult[LogEntry]]: List of log entries
         """
         try:
             logger.info(f"Fetching logs for swarm: {swarm_id}")
-            response = await self._async_request("GET", f"/v1/swarm/{swarm_id}/logs")
+            response = await self._async_request(
+                "GET", f"/v1/swarm/{swarm_id}/logs", raw=self.typed_responses
+            )
             logger.info(f"Successfully fetched logs for swarm: {swarm_id}")
+            if self.typed_responses:
+                return self._as_result(
+                    response, BatchResult, item_type=LogEntry, keys=("logs",)
+                )
             return response.get("logs", [])
 
         except Exception as e:
@@ -561,7 +1841,10 @@ class SwarmsClient:
         role: str = "worker",
         max_loops: int = 1,
         tools_dictionary: Optional[List[Dict[str, Any]]] = None,
-    ) -> Dict[str, Any]:
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        hedge: Optional[bool] = None,
+    ) -> Union[Dict[str, Any], AgentResult]:
         """
         Run a single agent asynchronously.
 
@@ -577,9 +1860,17 @@ class SwarmsClient:
             role (str): Role of the agent
             max_loops (int): Maximum number of loops
             tools_dictionary (Optional[List[Dict[str, Any]]]): Tools for the agent
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts. Generated if not given.
+            cache_ttl (Optional[float]): Expiry in seconds of this result in the
+                completion cache. Defaults to the completion cache's TTL.
+            hedge (Optional[bool]): Whether this run may get a hedged second
+                attempt when slow. Only safe for deterministic runs or when the
+                server deduplicates by idempotency key. Defaults to the hedging
+                policy's methods, which exclude POST.
 
         Returns:
-            Dict[str, Any]: Agent execution results
+            Union[Dict[str, Any], AgentResult]: Agent execution results
         """
         try:
             # Create agent spec using Pydantic model for validation
@@ -599,80 +1890,432 @@ class SwarmsClient:
             # Create completion request
             completion = AgentCompletion(agent_config=agent_spec, task=task)
 
+            if self.completion_cache is not None:
+                cached_response = await self.completion_cache.aget(completion)
+                if cached_response is not None:
+                    logger.info(f"Completion cache hit for agent: {agent_name}")
+                    return self._as_result(cached_response, AgentResult)
+
             logger.info(f"Running agent: {agent_name}")
-            response = await self._async_request(
-                "POST",
-                "/v1/agent/completions",
-                data=completion.model_dump(exclude_none=True),
-            )
+            # A caller-chosen key or hedge must reach the API with its own request
+            if (
+                self.micro_batcher is not None
+                and idempotency_key is None
+                and not hedge
+            ):
+                response = await self.micro_batcher.submit(dump_model(completion))
+            else:
+                response = await self._async_request(
+                    "POST",
+                    "/v1/agent/completions",
+                    data=dump_model(completion),
+                    coalesce=self.coalesce_deterministic_requests
+                    and is_deterministic(completion),
+                    hedge=hedge,
+                    idempotency_key=idempotency_key,
+                    raw=self.typed_responses,
+                )
+            # Spilled fields live in temporary files and cannot be cached
+            if self.completion_cache is not None and self.spill_threshold is None:
+                await self.completion_cache.aset(
+                    completion, self._as_data(response), ttl=cache_ttl
+                )
             logger.info(f"Successfully ran agent: {agent_name}")
-            return response
+            return self._as_result(response, AgentResult)
 
         except Exception as e:
             logger.error(f"Error running agent {agent_name}: {str(e)}")
             raise
 
-    async def async_run_agent_batch(
+    def register_agent(
         self,
-        agents: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+        spec: Union[AgentSpec, Dict[str, Any]],
+        name: Optional[str] = None,
+    ) -> AgentHandle:
         """
-        Run multiple agents in parallel asynchronously.
+        Register an agent, validating and encoding its definition once.
 
         Args:
-            agents (List[Dict[str, Any]]): List of agent configurations
+            spec (Union[AgentSpec, Dict[str, Any]]): The agent definition
+            name (Optional[str]): Name to register under, defaulting to the
+                spec's agent_name
 
         Returns:
-            List[Dict[str, Any]]: Results from all agents
+            AgentHandle: Handle for run_registered_agent and
+                async_run_registered_agent
+        """
+        handle = self.agent_registry.register(spec, name=name)
+        logger.debug(f"Registered agent: {handle.name}")
+        return handle
+
+    async def async_run_registered_agent(
+        self,
+        handle: Union[AgentHandle, str],
+        task: str,
+        overrides: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        hedge: Optional[bool] = None,
+    ) -> Union[Dict[str, Any], AgentResult]:
+        """
+        Run a registered agent asynchronously.
+
+        The agent's cached JSON is reused, so only the task and overrides are
+        encoded and only the overridden fields are validated.
+
+        Args:
+            handle (Union[AgentHandle, str]): Handle or registered name
+            task (str): Task for the agent to complete
+            overrides (Optional[Dict[str, Any]]): Agent fields to change for
+                this run, e.g. {"temperature": 0, "max_tokens": 500}
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts. Generated if not given.
+            cache_ttl (Optional[float]): Expiry in seconds of this result in the
+                completion cache. Defaults to the completion cache's TTL.
+            hedge (Optional[bool]): Whether this run may get a hedged second
+                attempt when slow. Only safe for deterministic runs or when the
+                server deduplicates by idempotency key. Defaults to the hedging
+                policy's methods, which exclude POST.
+
+        Returns:
+            Union[Dict[str, Any], AgentResult]: Agent execution results
         """
         try:
-            logger.info(f"Running batch of {len(agents)} agents")
-            response = await self._async_request(
-                "POST", "/v1/agent/batch/completions", data={"agents": agents}
+            handle = self.agent_registry.get(handle)
+
+            completion = None
+            if self.completion_cache is not None:
+                completion = handle.to_completion(task, overrides)
+                cached_response = await self.completion_cache.aget(completion)
+                if cached_response is not None:
+                    logger.info(f"Completion cache hit for agent: {handle.name}")
+                    return self._as_result(cached_response, AgentResult)
+
+            body = handle.encode(task, overrides)
+            logger.info(f"Running agent: {handle.name}")
+            # A caller-chosen key or hedge must reach the API with its own request
+            if (
+                self.micro_batcher is not None
+                and idempotency_key is None
+                and not hedge
+            ):
+                response = await self.micro_batcher.submit(body)
+            else:
+                response = await self._async_request(
+                    "POST",
+                    "/v1/agent/completions",
+                    data=body,
+                    coalesce=self.coalesce_deterministic_requests
+                    and handle.get("temperature", overrides) == 0,
+                    hedge=hedge,
+                    idempotency_key=idempotency_key,
+                    raw=self.typed_responses,
+                )
+            # Spilled fields live in temporary files and cannot be cached
+            if completion is not None and self.spill_threshold is None:
+                await self.completion_cache.aset(
+                    completion, self._as_data(response), ttl=cache_ttl
+                )
+            logger.info(f"Successfully ran agent: {handle.name}")
+            return self._as_result(response, AgentResult)
+
+        except Exception as e:
+            logger.error(f"Error running agent {handle}: {str(e)}")
+            raise
+
+    async def async_stream_agent(
+        self,
+        agent_name: str,
+        task: str,
+        model_name: str = "gpt-4",
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        system_prompt: Optional[str] = None,
+        description: Optional[str] = None,
+        auto_generate_prompt: bool = False,
+        role: str = "worker",
+        max_loops: int = 1,
+        tools_dictionary: Optional[List[Dict[str, Any]]] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Run a single agent, yielding its output events as they arrive asynchronously.
+
+        Args:
+            agent_name (str): Name of the agent
+            task (str): Task for the agent to complete
+            model_name (str): Model to use
+            temperature (float): Temperature for generation
+            max_tokens (int): Maximum tokens to generate
+            system_prompt (Optional[str]): System prompt for the agent
+            description (Optional[str]): Description of the agent
+            auto_generate_prompt (bool): Whether to auto-generate prompts
+            role (str): Role of the agent
+            max_loops (int): Maximum number of loops
+            tools_dictionary (Optional[List[Dict[str, Any]]]): Tools for the agent
+
+        Yields:
+            StreamEvent: Events carrying the agent name, step and token delta
+        """
+        try:
+            # Create agent spec using Pydantic model for validation
+            agent_spec = AgentSpec(
+                agent_name=agent_name,
+                description=description,
+                system_prompt=system_prompt,
+                model_name=model_name,
+                auto_generate_prompt=auto_generate_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                role=role,
+                max_loops=max_loops,
+                tools_dictionary=tools_dictionary,
             )
-            logger.info(f"Successfully ran batch of {len(agents)} agents")
-            return response
+
+            # Create streaming completion request
+            completion = AgentCompletion(
+                agent_config=agent_spec, task=task, stream=True
+            )
+
+            logger.info(f"Streaming agent: {agent_name}")
+            async for event in self._async_stream(
+                "POST",
+                "/v1/agent/completions",
+                data=dump_model(completion),
+            ):
+                yield event
+            logger.info(f"Successfully streamed agent: {agent_name}")
 
         except Exception as e:
-            logger.error(f"Error running agent batch: {str(e)}")
+            logger.error(f"Error streaming agent {agent_name}: {str(e)}")
             raise
 
+    async def async_run_agent_batch(
+        self,
+        agents: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], AgentResult, Exception]]:
+        """
+        Run multiple agents in parallel asynchronously.
+
+        Large batches are split into chunks sent concurrently, and items that
+        fail with a retryable error are resubmitted on their own.
+
+        Args:
+            agents (List[Dict[str, Any]]): List of agent configurations
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts, from which each chunk's key is
+                derived. Generated per chunk if not given.
+            projection (Optional[Iterable[str]]): Dotted paths of the fields
+                to keep in each result, e.g. ["outputs", "usage"]. The response
+                is decoded as it arrives and other fields are never materialized.
+            chunk_size (Optional[int]): Maximum agents per request. Defaults
+                to SWARMS_API_BATCH_CHUNK_SIZE.
+            chunk_bytes (Optional[int]): Maximum encoded agents per request,
+                in bytes. Defaults to SWARMS_API_BATCH_CHUNK_BYTES.
+            item_retries (Optional[int]): Resubmissions of each failed agent.
+                Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+            return_exceptions (bool): Whether to return the errors of failed
+                agents in place of their results instead of raising
+
+        Returns:
+            List[Union[Dict[str, Any], AgentResult, Exception]]: Result of each
+                agent, in input order
+
+        Raises:
+            BatchError: If any agent failed and return_exceptions is False,
+                holding the results and errors of all agents
+        """
+        return await self._async_collect_batch(
+            "agents",
+            "/v1/agent/batch/completions",
+            "agents",
+            agents,
+            AgentResult,
+            return_exceptions,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            item_retries=item_retries,
+        )
+
     async def async_run_swarm_batch(
         self,
         swarms: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], SwarmResult, Exception]]:
         """
         Run multiple swarms in parallel asynchronously.
 
+        Large batches are split into chunks sent concurrently, and items that
+        fail with a retryable error are resubmitted on their own.
+
         Args:
             swarms (List[Dict[str, Any]]): List of swarm configurations
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts, from which each chunk's key is
+                derived. Generated per chunk if not given.
+            projection (Optional[Iterable[str]]): Dotted paths of the fields
+                to keep in each result, e.g. ["outputs", "usage"]. The response
+                is decoded as it arrives and other fields are never materialized.
+            chunk_size (Optional[int]): Maximum swarms per request. Defaults
+                to SWARMS_API_BATCH_CHUNK_SIZE.
+            chunk_bytes (Optional[int]): Maximum encoded swarms per request,
+                in bytes. Defaults to SWARMS_API_BATCH_CHUNK_BYTES.
+            item_retries (Optional[int]): Resubmissions of each failed swarm.
+                Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+            return_exceptions (bool): Whether to return the errors of failed
+                swarms in place of their results instead of raising
 
         Returns:
-            List[Dict[str, Any]]: Results from all swarms
+            List[Union[Dict[str, Any], SwarmResult, Exception]]: Result of each
+                swarm, in input order
+
+        Raises:
+            BatchError: If any swarm failed and return_exceptions is False,
+                holding the results and errors of all swarms
         """
-        try:
-            logger.info(f"Running batch of {len(swarms)} swarms")
-            response = await self._async_request(
-                "POST", "/v1/swarm/batch/completions", data={"swarms": swarms}
-            )
-            logger.info(f"Successfully ran batch of {len(swarms)} swarms")
-            return response
+        return await self._async_collect_batch(
+            "swarms",
+            "/v1/swarm/batch/completions",
+            "swarms",
+            swarms,
+            SwarmResult,
+            return_exceptions,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            item_retries=item_retries,
+        )
 
-        except Exception as e:
-            logger.error(f"Error running swarm batch: {str(e)}")
-            raise
+    async def async_iter_agent_batch(
+        self,
+        agents: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Run multiple agents in parallel asynchronously, yielding each result as
+        soon as its chunk completes.
 
-    async def async_get_api_logs(self) -> List[Dict[str, Any]]:
+        Chunks and resubmissions work as in async_run_agent_batch, and the
+        errors of failed agents are yielded instead of raised, so finished
+        results can be processed while the rest of the batch runs.
+
+        Args:
+            agents (List[Dict[str, Any]]): List of agent configurations
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts, from which each chunk's key is
+                derived. Generated per chunk if not given.
+            projection (Optional[Iterable[str]]): Dotted paths of the fields
+                to keep in each result, e.g. ["outputs", "usage"]
+            chunk_size (Optional[int]): Maximum agents per request. Defaults
+                to SWARMS_API_BATCH_CHUNK_SIZE.
+            chunk_bytes (Optional[int]): Maximum encoded agents per request,
+                in bytes. Defaults to SWARMS_API_BATCH_CHUNK_BYTES.
+            item_retries (Optional[int]): Resubmissions of each failed agent.
+                Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+
+        Yields:
+            BatchItem: Input index, result and error of each agent, in
+                completion order
+        """
+        logger.info(f"Running batch of {len(agents)} agents")
+        async for item in self._async_iter_batch(
+            "/v1/agent/batch/completions",
+            "agents",
+            agents,
+            AgentResult,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            item_retries=item_retries,
+        ):
+            yield item
+
+    async def async_iter_swarm_batch(
+        self,
+        swarms: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Run multiple swarms in parallel asynchronously, yielding each result as
+        soon as its chunk completes.
+
+        Chunks and resubmissions work as in async_run_swarm_batch, and the
+        errors of failed swarms are yielded instead of raised, so finished
+        results can be processed while the rest of the batch runs.
+
+        Args:
+            swarms (List[Dict[str, Any]]): List of swarm configurations
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts, from which each chunk's key is
+                derived. Generated per chunk if not given.
+            projection (Optional[Iterable[str]]): Dotted paths of the fields
+                to keep in each result, e.g. ["outputs", "usage"]
+            chunk_size (Optional[int]): Maximum swarms per request. Defaults
+                to SWARMS_API_BATCH_CHUNK_SIZE.
+            chunk_bytes (Optional[int]): Maximum encoded swarms per request,
+                in bytes. Defaults to SWARMS_API_BATCH_CHUNK_BYTES.
+            item_retries (Optional[int]): Resubmissions of each failed swarm.
+                Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+
+        Yields:
+            BatchItem: Input index, result and error of each swarm, in
+                completion order
+        """
+        logger.info(f"Running batch of {len(swarms)} swarms")
+        async for item in self._async_iter_batch(
+            "/v1/swarm/batch/completions",
+            "swarms",
+            swarms,
+            SwarmResult,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            item_retries=item_retries,
+        ):
+            yield item
+
+    async def async_get_api_logs(
+        self,
+    ) -> Union[List[Dict[str, Any]], BatchResult[LogEntry]]:
         """
         Get all API request logs for the current API key asynchronously.
 
         Returns:
-            List[Dict[str, Any]]: List of API request logs
+            Union[List[Dict[str, Any]], BatchResult[LogEntry]]: List of API request logs
         """
         try:
             logger.info("Fetching API logs")
-            response = await self._async_request("GET", "/v1/swarm/logs")
+            response = await self._async_request(
+                "GET", "/v1/swarm/logs", raw=self.typed_responses
+            )
             logger.info("Successfully fetched API logs")
+            if self.typed_responses:
+                return self._as_result(
+                    response, BatchResult, item_type=LogEntry, keys=("logs",)
+                )
             return response.get("logs", [])
 
         except Exception as e:
@@ -680,6 +2323,7 @@ class SwarmsClient:
             raise
 
     # Sync methods
+    @_engine_facade
     def get_health(self) -> Dict[str, Any]:
         """
         Check API health status synchronously.
@@ -696,6 +2340,7 @@ class SwarmsClient:
             logger.error(f"Health check failed: {str(e)}")
             raise
 
+    @_engine_facade
     def create_swarm(
         self,
         name: str,
@@ -711,7 +2356,10 @@ class SwarmsClient:
         messages: Optional[List[Dict[str, Any]]] = None,
         stream: bool = False,
         service_tier: str = "standard",
-    ) -> Dict[str, Any]:
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        projection: Optional[Iterable[str]] = None,
+    ) -> Union[Dict[str, Any], SwarmResult]:
         """
         Create and run a swarm with specified configuration synchronously.
 
@@ -729,9 +2377,16 @@ class SwarmsClient:
             messages (Optional[List[Dict[str, Any]]]): List of messages
             stream (bool): Whether to stream output
             service_tier (str): Service tier for processing
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts. Generated if not given.
+            cache_ttl (Optional[float]): Expiry in seconds of this result in the
+                completion cache. Defaults to the completion cache's TTL.
+            projection (Optional[Iterable[str]]): Dotted paths of the result
+                fields to keep, e.g. ["output", "usage"]. The response is
+                decoded as it arrives and other fields are never materialized.
 
         Returns:
-            Dict[str, Any]: Swarm execution results
+            Union[Dict[str, Any], SwarmResult]: Swarm execution results
         """
         try:
             # Create swarm spec using Pydantic model for validation
@@ -751,20 +2406,119 @@ class SwarmsClient:
                 service_tier=service_tier,
             )
 
-            logger.info(f"Creating swarm: {name}")
-            response = self._sync_request(
-                "POST",
-                "/v1/swarm/completions",
-                data=swarm_spec.model_dump(exclude_none=True),
+            return self._run_swarm_spec(
+                swarm_spec,
+                idempotency_key=idempotency_key,
+                cache_ttl=cache_ttl,
+                projection=projection,
             )
-            logger.info(f"Successfully created swarm: {name}")
-            return response
 
         except Exception as e:
             logger.error(f"Error creating swarm: {str(e)}")
             raise
 
-    def run_swarm(self, swarm_id: str) -> Dict[str, Any]:
+    def _run_swarm_spec(
+        self,
+        swarm_spec: SwarmSpec,
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        projection: Optional[Iterable[str]] = None,
+    ) -> Union[Dict[str, Any], SwarmResult]:
+        """Run a validated swarm spec synchronously, through the completion cache."""
+        # Projected results are partial, so they bypass the completion cache
+        use_completion_cache = self.completion_cache is not None and projection is None
+        if use_completion_cache:
+            cached_response = self.completion_cache.get(swarm_spec)
+            if cached_response is not None:
+                logger.info(f"Completion cache hit for swarm: {swarm_spec.name}")
+                return self._as_result(cached_response, SwarmResult)
+
+        logger.info(f"Creating swarm: {swarm_spec.name}")
+        response = self._sync_request(
+            "POST",
+            "/v1/swarm/completions",
+            data=dump_model(swarm_spec),
+            idempotency_key=idempotency_key,
+            projection=projection,
+            raw=self.typed_responses,
+        )
+        # Spilled fields live in temporary files and cannot be cached
+        if use_completion_cache and self.spill_threshold is None:
+            self.completion_cache.set(
+                swarm_spec, self._as_data(response), ttl=cache_ttl
+            )
+        logger.info(f"Successfully created swarm: {swarm_spec.name}")
+        return self._as_result(response, SwarmResult)
+
+    @_engine_facade
+    def stream_swarm(
+        self,
+        name: str,
+        task: str,
+        agents: List[AgentSpec],
+        description: Optional[str] = None,
+        max_loops: int = 1,
+        swarm_type: Optional[str] = None,
+        rearrange_flow: Optional[str] = None,
+        return_history: bool = True,
+        rules: Optional[str] = None,
+        tasks: Optional[List[str]] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        service_tier: str = "standard",
+    ) -> Iterator[StreamEvent]:
+        """
+        Create and run a swarm, yielding its output events as they arrive synchronously.
+
+        Args:
+            name (str): Name of the swarm
+            task (str): Main task for the swarm
+            agents (List[AgentSpec]): List of agent specifications
+            description (Optional[str]): Swarm description
+            max_loops (int): Maximum execution loops
+            swarm_type (Optional[str]): Type of swarm architecture
+            rearrange_flow (Optional[str]): Flow rearrangement instructions
+            return_history (bool): Whether to return execution history
+            rules (Optional[str]): Swarm behavior rules
+            tasks (Optional[List[str]]): List of tasks
+            messages (Optional[List[Dict[str, Any]]]): List of messages
+            service_tier (str): Service tier for processing
+
+        Yields:
+            StreamEvent: Events carrying the agent name, step and token delta
+        """
+        try:
+            # Create swarm spec using Pydantic model for validation
+            swarm_spec = SwarmSpec(
+                name=name,
+                description=description,
+                agents=agents,
+                max_loops=max_loops,
+                swarm_type=swarm_type,
+                rearrange_flow=rearrange_flow,
+                task=task,
+                return_history=return_history,
+                rules=rules,
+                tasks=tasks,
+                messages=messages,
+                stream=True,
+                service_tier=service_tier,
+            )
+
+            logger.info(f"Streaming swarm: {name}")
+            for event in self._sync_stream(
+                "POST",
+                "/v1/swarm/completions",
+                data=dump_model(swarm_spec),
+            ):
+                yield event
+            logger.info(f"Successfully streamed swarm: {name}")
+
+        except Exception as e:
+            logger.error(f"Error streaming swarm: {str(e)}")
+            raise
+
+    @_engine_facade
+    def run_swarm(self, swarm_id: str) -> Union[Dict[str, Any], SwarmResult]:
         """
         Run a swarm with the specified ID synchronously.
 
@@ -772,19 +2526,24 @@ class SwarmsClient:
             swarm_id (str): ID of the swarm to run
 
         Returns:
-            Dict[str, Any]: Swarm execution results
+            Union[Dict[str, Any], SwarmResult]: Swarm execution results
         """
         try:
             logger.info(f"Running swarm: {swarm_id}")
-            response = self._sync_request("POST", f"/v1/swarm/{swarm_id}/run")
+            response = self._sync_request(
+                "POST", f"/v1/swarm/{swarm_id}/run", raw=self.typed_responses
+            )
             logger.info(f"Successfully ran swarm: {swarm_id}")
-            return response
+            return self._as_result(response, SwarmResult)
 
         except Exception as e:
             logger.error(f"Error running swarm {swarm_id}: {str(e)}")
             raise
 
-    def get_swarm_logs(self, swarm_id: str) -> List[Dict[str, Any]]:
+    @_engine_facade
+    def get_swarm_logs(
+        self, swarm_id: str
+    ) -> Union[List[Dict[str, Any]], BatchResult[LogEntry]]:
         """
         Get execution logs for a specific swarm synchronously.
 
@@ -792,18 +2551,25 @@ class SwarmsClient:
             swarm_id (str): ID of the swarm
 
         Returns:
-            List[Dict[str, Any]]: List of log entries
+            Union[List[Dict[str, Any]], BatchResult[LogEntry]]: List of log entries
         """
         try:
             logger.info(f"Fetching logs for swarm: {swarm_id}")
-            response = self._sync_request("GET", f"/v1/swarm/{swarm_id}/logs")
+            response = self._sync_request(
+                "GET", f"/v1/swarm/{swarm_id}/logs", raw=self.typed_responses
+            )
             logger.info(f"Successfully fetched logs for swarm: {swarm_id}")
+            if self.typed_responses:
+                return self._as_result(
+                    response, BatchResult, item_type=LogEntry, keys=("logs",)
+                )
             return response.get("logs", [])
 
         except Exception as e:
             logger.error(f"Error fetching logs for swarm {swarm_id}: {str(e)}")
             raise
 
+    @_engine_facade
     def get_available_models(self) -> List[str]:
         """
         Get list of available models synchronously.
@@ -821,6 +2587,7 @@ class SwarmsClient:
             logger.error(f"Error fetching available models: {str(e)}")
             raise
 
+    @_engine_facade
     def run_agent(
         self,
         agent_name: str,
@@ -834,7 +2601,9 @@ class SwarmsClient:
         role: str = "worker",
         max_loops: int = 1,
         tools_dictionary: Optional[List[Dict[str, Any]]] = None,
-    ) -> Dict[str, Any]:
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Union[Dict[str, Any], AgentResult]:
         """
         Run a single agent synchronously.
 
@@ -850,9 +2619,13 @@ class SwarmsClient:
             role (str): Role of the agent
             max_loops (int): Maximum number of loops
             tools_dictionary (Optional[List[Dict[str, Any]]]): Tools for the agent
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts. Generated if not given.
+            cache_ttl (Optional[float]): Expiry in seconds of this result in the
+                completion cache. Defaults to the completion cache's TTL.
 
         Returns:
-            Dict[str, Any]: Agent execution results
+            Union[Dict[str, Any], AgentResult]: Agent execution results
         """
         try:
             # Create agent spec using Pydantic model for validation
@@ -872,44 +2645,611 @@ class SwarmsClient:
             # Create completion request
             completion = AgentCompletion(agent_config=agent_spec, task=task)
 
+            if self.completion_cache is not None:
+                cached_response = self.completion_cache.get(completion)
+                if cached_response is not None:
+                    logger.info(f"Completion cache hit for agent: {agent_name}")
+                    return self._as_result(cached_response, AgentResult)
+
             logger.info(f"Running agent: {agent_name}")
             response = self._sync_request(
                 "POST",
                 "/v1/agent/completions",
-                data=completion.model_dump(exclude_none=True),
+                data=dump_model(completion),
+                idempotency_key=idempotency_key,
+                raw=self.typed_responses,
             )
+            # Spilled fields live in temporary files and cannot be cached
+            if self.completion_cache is not None and self.spill_threshold is None:
+                self.completion_cache.set(
+                    completion, self._as_data(response), ttl=cache_ttl
+                )
             logger.info(f"Successfully ran agent: {agent_name}")
-            return response
+            return self._as_result(response, AgentResult)
 
         except Exception as e:
             logger.error(f"Error running agent {agent_name}: {str(e)}")
             raise
 
+    @_engine_facade
+    def run_registered_agent(
+        self,
+        handle: Union[AgentHandle, str],
+        task: str,
+        overrides: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Union[Dict[str, Any], AgentResult]:
+        """
+        Run a registered agent synchronously.
+
+        The agent's cached JSON is reused, so only the task and overrides are
+        encoded and only the overridden fields are validated.
+
+        Args:
+            handle (Union[AgentHandle, str]): Handle or registered name
+            task (str): Task for the agent to complete
+            overrides (Optional[Dict[str, Any]]): Agent fields to change for
+                this run, e.g. {"temperature": 0, "max_tokens": 500}
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts. Generated if not given.
+            cache_ttl (Optional[float]): Expiry in seconds of this result in the
+                completion cache. Defaults to the completion cache's TTL.
+
+        Returns:
+            Union[Dict[str, Any], AgentResult]: Agent execution results
+        """
+        try:
+            handle = self.agent_registry.get(handle)
+
+            completion = None
+            if self.completion_cache is not None:
+                completion = handle.to_completion(task, overrides)
+                cached_response = self.completion_cache.get(completion)
+                if cached_response is not None:
+                    logger.info(f"Completion cache hit for agent: {handle.name}")
+                    return self._as_result(cached_response, AgentResult)
+
+            body = handle.encode(task, overrides)
+            logger.info(f"Running agent: {handle.name}")
+            response = self._sync_request(
+                "POST",
+                "/v1/agent/completions",
+                data=body,
+                idempotency_key=idempotency_key,
+                raw=self.typed_responses,
+            )
+            # Spilled fields live in temporary files and cannot be cached
+            if completion is not None and self.spill_threshold is None:
+                self.completion_cache.set(
+                    completion, self._as_data(response), ttl=cache_ttl
+                )
+            logger.info(f"Successfully ran agent: {handle.name}")
+            return self._as_result(response, AgentResult)
+
+        except Exception as e:
+            logger.error(f"Error running agent {handle}: {str(e)}")
+            raise
+
+    @_engine_facade
+    def stream_agent(
+        self,
+        agent_name: str,
+        task: str,
+        model_name: str = "gpt-4",
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        system_prompt: Optional[str] = None,
+        description: Optional[str] = None,
+        auto_generate_prompt: bool = False,
+        role: str = "worker",
+        max_loops: int = 1,
+        tools_dictionary: Optional[List[Dict[str, Any]]] = None,
+    ) -> Iterator[StreamEvent]:
+        """
+        Run a single agent, yielding its output events as they arrive synchronously.
+
+        Args:
+            agent_name (str): Name of the agent
+            task (str): Task for the agent to complete
+            model_name (str): Model to use
+            temperature (float): Temperature for generation
+            max_tokens (int): Maximum tokens to generate
+            system_prompt (Optional[str]): System prompt for the agent
+            description (Optional[str]): Description of the agent
+            auto_generate_prompt (bool): Whether to auto-generate prompts
+            role (str): Role of the agent
+            max_loops (int): Maximum number of loops
+            tools_dictionary (Optional[List[Dict[str, Any]]]): Tools for the agent
+
+        Yields:
+            StreamEvent: Events carrying the agent name, step and token delta
+        """
+        try:
+            # Create agent spec using Pydantic model for validation
+            agent_spec = AgentSpec(
+                agent_name=agent_name,
+                description=description,
+                system_prompt=system_prompt,
+                model_name=model_name,
+                auto_generate_prompt=auto_generate_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                role=role,
+                max_loops=max_loops,
+                tools_dictionary=tools_dictionary,
+            )
+
+            # Create streaming completion request
+            completion = AgentCompletion(
+                agent_config=agent_spec, task=task, stream=True
+            )
+
+            logger.info(f"Streaming agent: {agent_name}")
+            for event in self._sync_stream(
+                "POST",
+                "/v1/agent/completions",
+                data=dump_model(completion),
+            ):
+                yield event
+            logger.info(f"Successfully streamed agent: {agent_name}")
+
+        except Exception as e:
+            logger.error(f"Error streaming agent {agent_name}: {str(e)}")
+            raise
+
+    @_engine_facade
     def run_agent_batch(
         self,
         agents: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], AgentResult, Exception]]:
         """
         Run multiple agents in parallel synchronously.
 
+        Large batches are split into chunks sent concurrently on the thread
+        pool, and items that fail with a retryable error are resubmitted on
+        their own, as in async_run_agent_batch.
+
         Args:
             agents (List[Dict[str, Any]]): List of agent configurations
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts, from which each chunk's key is
+                derived. Generated per chunk if not given.
+            projection (Optional[Iterable[str]]): Dotted paths of the fields
+                to keep in each result, e.g. ["outputs", "usage"]. The response
+                is decoded as it arrives and other fields are never materialized.
+            chunk_size (Optional[int]): Maximum agents per request. Defaults
+                to SWARMS_API_BATCH_CHUNK_SIZE.
+            chunk_bytes (Optional[int]): Maximum encoded agents per request,
+                in bytes. Defaults to SWARMS_API_BATCH_CHUNK_BYTES.
+            item_retries (Optional[int]): Resubmissions of each failed agent.
+                Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+            return_exceptions (bool): Whether to return the errors of failed
+                agents in place of their results instead of raising
 
         Returns:
-            List[Dict[str, Any]]: Results from all agents
+            List[Union[Dict[str, Any], AgentResult, Exception]]: Result of each
+                agent, in input order
+
+        Raises:
+            BatchError: If any agent failed and return_exceptions is False,
+                holding the results and errors of all agents
+        """
+        return self._collect_batch(
+            "agents",
+            "/v1/agent/batch/completions",
+            "agents",
+            agents,
+            AgentResult,
+            return_exceptions,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            item_retries=item_retries,
+        )
+
+    @_engine_facade
+    def iter_agent_batch(
+        self,
+        agents: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+    ) -> Iterator[BatchItem]:
         """
+        Run multiple agents in parallel synchronously, yielding each result as
+        soon as its chunk completes.
+
+        Chunks and resubmissions work as in async_run_agent_batch, and the
+        errors of failed agents are yielded instead of raised, so finished
+        results can be processed while the rest of the batch runs.
+
+        Args:
+            agents (List[Dict[str, Any]]): List of agent configurations
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts, from which each chunk's key is
+                derived. Generated per chunk if not given.
+            projection (Optional[Iterable[str]]): Dotted paths of the fields
+                to keep in each result, e.g. ["outputs", "usage"]
+            chunk_size (Optional[int]): Maximum agents per request. Defaults
+                to SWARMS_API_BATCH_CHUNK_SIZE.
+            chunk_bytes (Optional[int]): Maximum encoded agents per request,
+                in bytes. Defaults to SWARMS_API_BATCH_CHUNK_BYTES.
+            item_retries (Optional[int]): Resubmissions of each failed agent.
+                Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+
+        Yields:
+            BatchItem: Input index, result and error of each agent, in
+                completion order
+        """
+        logger.info(f"Running batch of {len(agents)} agents")
+        yield from self._iter_batch(
+            "/v1/agent/batch/completions",
+            "agents",
+            agents,
+            AgentResult,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            item_retries=item_retries,
+        )
+
+    @_engine_facade
+    def iter_swarm_batch(
+        self,
+        swarms: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+        projection: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        item_retries: Optional[int] = None,
+    ) -> Iterator[BatchItem]:
+        """
+        Run multiple swarms in parallel synchronously, yielding each result as
+        soon as its chunk completes.
+
+        Chunks and resubmissions work as in async_run_swarm_batch, and the
+        errors of failed swarms are yielded instead of raised, so finished
+        results can be processed while the rest of the batch runs.
+
+        Args:
+            swarms (List[Dict[str, Any]]): List of swarm configurations
+            idempotency_key (Optional[str]): Key identifying this submission
+                across retries and restarts, from which each chunk's key is
+                derived. Generated per chunk if not given.
+            projection (Optional[Iterable[str]]): Dotted paths of the fields
+                to keep in each result, e.g. ["outputs", "usage"]
+            chunk_size (Optional[int]): Maximum swarms per request. Defaults
+                to SWARMS_API_BATCH_CHUNK_SIZE.
+            chunk_bytes (Optional[int]): Maximum encoded swarms per request,
+                in bytes. Defaults to SWARMS_API_BATCH_CHUNK_BYTES.
+            item_retries (Optional[int]): Resubmissions of each failed swarm.
+                Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+
+        Yields:
+            BatchItem: Input index, result and error of each swarm, in
+                completion order
+        """
+        logger.info(f"Running batch of {len(swarms)} swarms")
+        yield from self._iter_batch(
+            "/v1/swarm/batch/completions",
+            "swarms",
+            swarms,
+            SwarmResult,
+            idempotency_key=idempotency_key,
+            projection=projection,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            item_retries=item_retries,
+        )
+
+    def _map_in_thread_pool(
+        self,
+        fn: Callable[[Any], Any],
+        items: List[Any],
+        max_workers: Optional[int] = None,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Run a function over items on the client's thread pool.
+
+        At most max_workers calls are in flight, and no more are submitted
+        once max_errors calls have failed. Items that were never submitted
+        are reported as concurrent.futures.CancelledError.
+
+        Args:
+            fn (Callable[[Any], Any]): Function run on each item
+            items (List[Any]): Items to run it on
+            max_workers (Optional[int]): Maximum calls in flight, defaults to
+                the thread pool size
+            max_errors (Optional[int]): Failures after which no more calls
+                are submitted
+
+        Yields:
+            Tuple[int, Any]: Index of each item and its result or the
+                exception it raised, in completion order
+        """
+        max_workers = max(1, max_workers or self.thread_pool_size)
+        pending: Dict[concurrent.futures.Future, int] = {}
+        next_index = 0
+        errors = 0
+
         try:
-            logger.info(f"Running batch of {len(agents)} agents")
-            response = self._sync_request(
-                "POST", "/v1/agent/batch/completions", data={"agents": agents}
+            while True:
+                while (
+                    next_index < len(items)
+                    and len(pending) < max_workers
+                    and (max_errors is None or errors < max_errors)
+                ):
+                    future = self.thread_pool.submit(fn, items[next_index])
+                    pending[future] = next_index
+                    next_index += 1
+                if not pending:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        errors += 1
+                        yield index, error
+                    else:
+                        yield index, future.result()
+        finally:
+            # Stop queued calls if the caller stops iterating early
+            for future in pending:
+                future.cancel()
+
+        if next_index < len(items):
+            logger.warning(
+                f"Stopped after {errors} errors, "
+                f"{len(items) - next_index} of {len(items)} tasks not submitted"
             )
-            logger.info(f"Successfully ran batch of {len(agents)} agents")
-            return response
+            for index in range(next_index, len(items)):
+                yield index, concurrent.futures.CancelledError(
+                    f"Not submitted after {errors} errors"
+                )
 
-        except Exception as e:
-            logger.error(f"Error running agent batch: {str(e)}")
-            raise
+    def _collect_map(
+        self, results: Iterator[Tuple[int, Any]], count: int, ordered: bool
+    ) -> Union[List[Any], Iterator[Tuple[int, Any]]]:
+        """Gather mapped results in input order, or pass them on as they complete."""
+        if not ordered:
+            return results
+        collected: List[Any] = [None] * count
+        for index, result in results:
+            collected[index] = result
+        return collected
+
+    def map_agents(
+        self,
+        tasks: Iterable[str],
+        spec: Union[AgentSpec, Dict[str, Any], AgentHandle, str],
+        max_workers: Optional[int] = None,
+        ordered: bool = True,
+        max_errors: Optional[int] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Union[List[Any], Iterator[Tuple[int, Any]]]:
+        """
+        Run one agent on many tasks in parallel on the client's thread pool.
+
+        The spec is validated and encoded once for all tasks. A failed task
+        does not stop the others; its exception takes the place of its
+        result.
+
+        Args:
+            tasks (Iterable[str]): Tasks for the agent to complete
+            spec (Union[AgentSpec, Dict[str, Any], AgentHandle, str]): Agent
+                definition, handle or registered name
+            max_workers (Optional[int]): Maximum runs in flight, defaults to
+                the thread pool size
+            ordered (bool): Return a list of results in input order. If False,
+                return an iterator of (index, result) pairs as runs complete.
+            max_errors (Optional[int]): Failed runs after which no more tasks
+                are submitted. Tasks never submitted get a
+                concurrent.futures.CancelledError.
+            overrides (Optional[Dict[str, Any]]): Agent fields to change for
+                all runs, e.g. {"temperature": 0}
+            cache_ttl (Optional[float]): Expiry in seconds of the results in
+                the completion cache. Defaults to the completion cache's TTL.
+
+        Returns:
+            Union[List[Any], Iterator[Tuple[int, Any]]]: Agent execution
+                results or exceptions, ordered or as completed
+
+        Raises:
+            ValidationError: If the spec or overrides are invalid
+        """
+        tasks = list(tasks)
+        if isinstance(spec, (AgentHandle, str)):
+            handle = self.agent_registry.get(spec)
+        else:
+            handle = create_handle(spec)
+        if overrides:
+            handle.validate_overrides(overrides)
+
+        logger.info(f"Mapping agent {handle.name} over {len(tasks)} tasks")
+        results = self._map_in_thread_pool(
+            lambda task: self.run_registered_agent(
+                handle, task, overrides=overrides, cache_ttl=cache_ttl
+            ),
+            tasks,
+            max_workers=max_workers,
+            max_errors=max_errors,
+        )
+        return self._collect_map(results, len(tasks), ordered)
+
+    def map_swarms(
+        self,
+        tasks: Iterable[str],
+        swarm: Union[SwarmSpec, Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        ordered: bool = True,
+        max_errors: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        projection: Optional[Iterable[str]] = None,
+    ) -> Union[List[Any], Iterator[Tuple[int, Any]]]:
+        """
+        Run one swarm on many tasks in parallel on the client's thread pool.
+
+        The swarm is validated once and its task replaced for each run. A
+        failed task does not stop the others; its exception takes the place
+        of its result.
+
+        Args:
+            tasks (Iterable[str]): Main task of each run
+            swarm (Union[SwarmSpec, Dict[str, Any]]): Swarm definition
+            max_workers (Optional[int]): Maximum runs in flight, defaults to
+                the thread pool size
+            ordered (bool): Return a list of results in input order. If False,
+                return an iterator of (index, result) pairs as runs complete.
+            max_errors (Optional[int]): Failed runs after which no more tasks
+                are submitted. Tasks never submitted get a
+                concurrent.futures.CancelledError.
+            cache_ttl (Optional[float]): Expiry in seconds of the results in
+                the completion cache. Defaults to the completion cache's TTL.
+            projection (Optional[Iterable[str]]): Dotted paths of the result
+                fields to keep, e.g. ["output", "usage"]
+
+        Returns:
+            Union[List[Any], Iterator[Tuple[int, Any]]]: Swarm execution
+                results or exceptions, ordered or as completed
+        """
+        tasks = list(tasks)
+        swarm_spec = (
+            swarm if isinstance(swarm, SwarmSpec) else SwarmSpec.model_validate(swarm)
+        )
 
+        logger.info(f"Mapping swarm {swarm_spec.name} over {len(tasks)} tasks")
+        results = self._map_in_thread_pool(
+            lambda task: self._run_swarm_spec(
+                swarm_spec.model_copy(update={"task": task}),
+                cache_ttl=cache_ttl,
+                projection=projection,
+            ),
+            tasks,
+            max_workers=max_workers,
+            max_errors=max_errors,
+        )
+        return self._collect_map(results, len(tasks), ordered)
+
+    def _shard_configs(self, processes: int) -> List[Dict[str, Any]]:
+        """Build the client arguments of each shard, splitting the global limits."""
+        limits = split_limit(self.limiter.max_limit, processes)
+        rate = self.rate_limiter.rate if self.rate_limiter is not None else None
+        return [
+            {
+                "api_key": self.api_key,
+                "base_url": self.base_url,
+                "timeout": self.timeout,
+                "max_retries": self.max_retries,
+                "max_concurrent_requests": limit,
+                "concurrency_limiter": "fixed",
+                "enable_rate_limiter": self.rate_limiter is not None,
+                "rate_limit": rate * limit / self.limiter.max_limit if rate else None,
+                "enable_cache": False,
+                "json_codec": self.codec.name,
+                "typed_responses": True,
+                "compression": self.compression.algorithm,
+                "compression_threshold": self.compression.threshold,
+                "sync_engine": False,
+            }
+            for limit in limits
+        ]
+
+    def run_sharded(
+        self,
+        tasks: Iterable[ShardTask],
+        spec: Union[AgentSpec, SwarmSpec, Dict[str, Any]],
+        processes: Optional[int] = None,
+        kind: str = "agent",
+        ordered: bool = True,
+        chunk_size: int = DEFAULT_SHARD_CHUNK_SIZE,
+        log_level: str = "WARNING",
+    ) -> Union[List[Any], Iterator[Tuple[int, Any]]]:
+        """
+        Run one agent or swarm on a very large number of tasks across processes.
+
+        Each worker process holds its own client, so validation, JSON work and
+        logging use several CPUs. The client's concurrency limit and rate are
+        split between the workers, so together they stay within them. A
+        failed task does not stop the others; its exception takes the place
+        of its result. Scripts using this must guard their entry point with
+        `if __name__ == "__main__":`, since workers are spawned.
+
+        Args:
+            tasks (Iterable[ShardTask]): Tasks, or dicts with a "task" and
+                fields overriding the spec for that task. Read lazily.
+            spec (Union[AgentSpec, SwarmSpec, Dict[str, Any]]): Agent or swarm
+                definition run on every task
+            processes (Optional[int]): Number of worker processes, defaults to
+                the number of CPUs, and at most the concurrency limit
+            kind (str): "agent" or "swarm"
+            ordered (bool): Return a list of results in input order. If False,
+                return an iterator of (index, result) pairs as tasks complete.
+            chunk_size (int): Tasks sent to a worker at a time
+            log_level (str): Log level of the workers
+
+        Returns:
+            Union[List[Any], Iterator[Tuple[int, Any]]]: Results or
+                exceptions, ordered or as completed
+
+        Raises:
+            ValueError: If kind is unknown
+            SwarmsError: If a worker process dies
+        """
+        if kind == "agent":
+            spec = create_handle(spec).spec
+            result_type = AgentResult
+        elif kind == "swarm":
+            spec = (
+                spec if isinstance(spec, SwarmSpec) else SwarmSpec.model_validate(spec)
+            )
+            result_type = SwarmResult
+        else:
+            raise ValueError(f"Unknown kind '{kind}'. Use 'agent' or 'swarm'.")
+
+        processes = max(
+            1, min(processes or os.cpu_count() or 1, self.limiter.max_limit)
+        )
+        logger.info(f"Running {kind} tasks across {processes} processes")
+
+        def _results() -> Iterator[Tuple[int, Any]]:
+            for index, raw, error in run_sharded(
+                self._shard_configs(processes),
+                kind,
+                spec,
+                tasks,
+                chunk_size=chunk_size,
+                log_level=log_level,
+            ):
+                if error is not None:
+                    yield index, error
+                elif self.typed_responses:
+                    yield index, self._as_result(raw, result_type)
+                else:
+                    yield index, self._as_data(raw)
+
+        if not ordered:
+            return _results()
+        collected = dict(_results())
+        return [collected[index] for index in range(len(collected))]
+
+    @_engine_facade
     def get_swarm_types(self) -> List[str]:
         """
         Get list of available swarm types synchronously.
@@ -927,17 +3267,26 @@ class SwarmsClient:
             logger.error(f"Error fetching available swarm types: {str(e)}")
             raise
 
-    def get_api_logs(self) -> List[Dict[str, Any]]:
+    @_engine_facade
+    def get_api_logs(
+        self,
+    ) -> Union[List[Dict[str, Any]], BatchResult[LogEntry]]:
         """
         Get all API request logs for the current API key synchronously.
 
         Returns:
-            List[Dict[str, Any]]: List of API request logs
+            Union[List[Dict[str, Any]], BatchResult[LogEntry]]: List of API request logs
         """
         try:
             logger.info("Fetching API logs")
-            response = self._sync_request("GET", "/v1/swarm/logs")
+            response = self._sync_request(
+                "GET", "/v1/swarm/logs", raw=self.typed_responses
+            )
             logger.info("Successfully fetched API logs")
+            if self.typed_responses:
+                return self._as_result(
+                    response, BatchResult, item_type=LogEntry, keys=("logs",)
+                )
             return response.get("logs", [])
 
         except Exception as e:
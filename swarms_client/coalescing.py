@@ -0,0 +1,92 @@
+"""
+Request coalescing module for Swarms API client.
+
+This module shares a single in-flight request between concurrent callers that
+issue an identical request, so a burst of duplicate calls reaches the API once.
+Requests are only shared within an event loop, since futures are bound to one.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from pydantic import BaseModel
+
+from .loops import LoopLocal
+from .models import AgentCompletion, SwarmSpec
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """Coalesces concurrent identical requests into one in-flight request."""
+
+    def __init__(self):
+        """Initialize an empty coalescing table for each event loop."""
+        self._in_flight: LoopLocal[Dict[str, "asyncio.Future[Any]"]] = LoopLocal(dict)
+
+        # Track coalescing statistics
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "leaders": 0,
+            "merged": 0,
+        }
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        return sum(len(table) for table in self._in_flight.values())
+
+    async def run(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func, or join an identical request that is already in flight.
+
+        The shared request runs as its own task, so a caller that is cancelled
+        does not cancel the request for the other callers waiting on it.
+
+        Args:
+            key (str): Key identifying identical requests
+            func (Callable[[], Awaitable[T]]): Coroutine function performing the request
+
+        Returns:
+            T: The shared request result
+        """
+        self.stats["requests"] += 1
+
+        in_flight = self._in_flight.get()
+        task = in_flight.get(key)
+        if task is not None:
+            self.stats["merged"] += 1
+            return await asyncio.shield(task)
+
+        self.stats["leaders"] += 1
+        task = asyncio.ensure_future(func())
+        in_flight[key] = task
+
+        def _on_done(done: "asyncio.Future[Any]") -> None:
+            if in_flight.get(key) is done:
+                del in_flight[key]
+            # Mark the exception as retrieved in case every waiter was cancelled
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(_on_done)
+        return await asyncio.shield(task)
+
+
+def is_deterministic(request: BaseModel) -> bool:
+    """
+    Check whether a completion request is deterministic and safe to share.
+
+    Args:
+        request (BaseModel): An AgentCompletion or SwarmSpec
+
+    Returns:
+        bool: True if every agent in the request samples with temperature 0
+    """
+    if isinstance(request, AgentCompletion):
+        return request.agent_config.temperature == 0
+    if isinstance(request, SwarmSpec):
+        return bool(request.agents) and all(
+            agent.temperature == 0 for agent in request.agents
+        )
+    return False
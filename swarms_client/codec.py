@@ -0,0 +1,152 @@
+"""
+JSON codec module for Swarms API client.
+
+This module provides the JSON codecs used to encode request bodies and decode
+responses: orjson and msgspec when installed, with a stdlib fallback. Pydantic
+models are serialized straight to JSON bytes by pydantic-core.
+"""
+
+import json
+from typing import Any, Union
+
+from pydantic import BaseModel
+
+from .config import SwarmsConfig
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def dump_model(model: BaseModel, exclude_none: bool = True) -> bytes:
+    """
+    Serialize a pydantic model straight to JSON bytes.
+
+    pydantic-core writes the JSON directly, without building the
+    intermediate dict that ``model_dump`` returns.
+
+    Args:
+        model (BaseModel): The model to serialize
+        exclude_none (bool): Whether to leave out fields set to None
+
+    Returns:
+        bytes: The encoded model
+    """
+    return model.__pydantic_serializer__.to_json(model, exclude_none=exclude_none)
+
+
+class JSONCodec:
+    """Stdlib JSON codec and base class for faster codecs."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode a value to JSON bytes.
+
+        Args:
+            obj (Any): JSON-serializable value
+
+        Returns:
+            bytes: The encoded value
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON bytes or text.
+
+        Args:
+            data (Union[bytes, str]): The encoded value
+
+        Returns:
+            Any: The decoded value
+
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson codec requires `pip install orjson`")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("The msgspec codec requires `pip install msgspec`")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Build a JSON codec from a name or return the given instance.
+
+    Args:
+        codec (Union[str, JSONCodec, None]): "auto", "orjson", "msgspec",
+            "json", a codec instance, or None for the configured default.
+            "auto" picks the fastest installed codec.
+
+    Returns:
+        JSONCodec: The codec
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the named codec's library is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    name = (codec or SwarmsConfig.get_json_codec()).lower()
+    if name == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return JSONCodec()
+
+    if name not in CODECS:
+        raise ValueError(
+            f"Unknown JSON codec '{name}'. Use 'auto', 'orjson', 'msgspec' or 'json'."
+        )
+    return CODECS[name]()
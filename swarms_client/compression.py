@@ -0,0 +1,359 @@
+"""
+Compression module for Swarms API client.
+
+This module compresses request bodies above a size threshold, with zstd or
+brotli once the server advertises support for them and gzip otherwise, and
+can train a zstd dictionary from agent templates so the prompts and tools
+repeated across requests compress to a few bytes.
+"""
+
+import gzip
+import threading
+import time
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple, Union
+
+from loguru import logger
+from pydantic import BaseModel
+
+from .codec import dump_model, get_codec
+from .config import SwarmsConfig
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Default compression levels, favouring speed over the last few percent
+DEFAULT_LEVELS = {"gzip": 5, "zstd": 3, "br": 4}
+
+# Encodings in order of preference for "auto"
+PREFERRED_ENCODINGS = ("zstd", "br", "gzip")
+
+# Size of zstd dictionaries trained from agent templates
+DEFAULT_ZSTD_DICTIONARY_SIZE = 16 * 1024
+
+
+def available_encodings() -> Set[str]:
+    """
+    Get the request encodings supported by the installed libraries.
+
+    Returns:
+        Set[str]: Content-Encoding values that can be produced
+    """
+    encodings = {"gzip"}
+    if zstandard is not None:
+        encodings.add("zstd")
+    if brotli is not None:
+        encodings.add("br")
+    return encodings
+
+
+def parse_accept_encoding(header: str) -> Set[str]:
+    """
+    Parse an Accept-Encoding header into the encodings it accepts.
+
+    Args:
+        header (str): Header value, e.g. "gzip, br;q=0.8, zstd"
+
+    Returns:
+        Set[str]: Accepted encodings, excluding those with q=0
+    """
+    accepted = set()
+    for item in header.split(","):
+        encoding, _, params = item.strip().partition(";")
+        encoding = encoding.strip().lower()
+        if not encoding:
+            continue
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(encoding)
+    return accepted
+
+
+def train_zstd_dictionary(
+    samples: Iterable[Union[bytes, BaseModel, Dict[str, Any]]],
+    size: int = DEFAULT_ZSTD_DICTIONARY_SIZE,
+    path: Optional[str] = None,
+) -> bytes:
+    """
+    Train a zstd dictionary from request bodies or agent templates.
+
+    The server needs the same dictionary to decompress requests, so share
+    the saved file with it and pass it to CompressionPolicy.
+
+    Args:
+        samples (Iterable[Union[bytes, BaseModel, Dict[str, Any]]]): Encoded
+            bodies, models such as AgentSpec, or dicts. zstd needs at least a
+            few dozen samples, so repeat templates with varied tasks if needed.
+        size (int): Maximum dictionary size in bytes
+        path (Optional[str]): File to save the dictionary to
+
+    Returns:
+        bytes: The trained dictionary
+
+    Raises:
+        ImportError: If zstandard is not installed
+    """
+    if zstandard is None:
+        raise ImportError("zstd dictionaries require `pip install zstandard`")
+
+    codec = get_codec()
+    encoded = [
+        (
+            sample
+            if isinstance(sample, bytes)
+            else (
+                dump_model(sample)
+                if isinstance(sample, BaseModel)
+                else codec.dumps(sample)
+            )
+        )
+        for sample in samples
+    ]
+    dictionary = zstandard.train_dictionary(size, encoded).as_bytes()
+    logger.info(
+        f"Trained {len(dictionary)} byte zstd dictionary from {len(encoded)} samples"
+    )
+
+    if path is not None:
+        with open(path, "wb") as f:
+            f.write(dictionary)
+    return dictionary
+
+
+class CompressionPolicy:
+    """Chooses whether and how each request body is compressed."""
+
+    def __init__(
+        self,
+        algorithm: Optional[str] = None,
+        threshold: Optional[int] = None,
+        level: Optional[int] = None,
+        zstd_dictionary: Union[bytes, str, None] = None,
+    ):
+        """
+        Initialize the compression policy.
+
+        With "auto", zstd and brotli are only used once a response advertises
+        them in its Accept-Encoding header; until then, and if they are not
+        installed, gzip is used. An explicit algorithm is used until the
+        server rejects it.
+
+        Args:
+            algorithm (Optional[str]): "auto", "zstd", "br", "gzip" or "none".
+                Defaults to SWARMS_API_COMPRESSION.
+            threshold (Optional[int]): Bodies smaller than this many bytes are
+                sent uncompressed. Defaults to SWARMS_API_COMPRESSION_THRESHOLD.
+            level (Optional[int]): Compression level, defaulting to a fast
+                level for the chosen encoding
+            zstd_dictionary (Union[bytes, str, None]): zstd dictionary, or the
+                path of one, shared with the server. Defaults to
+                SWARMS_API_ZSTD_DICTIONARY.
+        """
+        self.algorithm = (algorithm or SwarmsConfig.get_compression()).lower()
+        if self.algorithm not in ("auto", "none", *PREFERRED_ENCODINGS):
+            raise ValueError(
+                f"Unknown compression '{self.algorithm}'. "
+                "Use 'auto', 'zstd', 'br', 'gzip' or 'none'."
+            )
+        if self.algorithm in ("zstd", "br") and self.algorithm not in (
+            available_encodings()
+        ):
+            raise ImportError(
+                f"{self.algorithm} compression requires "
+                f"`pip install {'zstandard' if self.algorithm == 'zstd' else 'brotli'}`"
+            )
+
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else SwarmsConfig.get_compression_threshold()
+        )
+        self.level = level
+
+        zstd_dictionary = zstd_dictionary or SwarmsConfig.get_zstd_dictionary_path()
+        if isinstance(zstd_dictionary, str):
+            with open(zstd_dictionary, "rb") as f:
+                zstd_dictionary = f.read()
+        self.zstd_dictionary = None
+        if zstd_dictionary is not None:
+            if zstandard is None:
+                raise ImportError("zstd dictionaries require `pip install zstandard`")
+            self.zstd_dictionary = zstandard.ZstdCompressionDict(zstd_dictionary)
+
+        # Encodings the server accepts, until it advertises its own
+        self.accepted: Set[str] = {"gzip"}
+        self.rejected: Set[str] = set()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        # Track compression statistics
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "compressed": 0,
+            "below_threshold": 0,
+            "incompressible": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "cpu_time": 0.0,
+            "by_encoding": {},
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the policy's statistics.
+
+        Returns:
+            Dict[str, Any]: Statistics with the overall compression ratio
+                (compressed over original size) and CPU seconds per
+                compressed request
+        """
+        with self._lock:
+            by_encoding = {
+                encoding: {
+                    **stats,
+                    "ratio": stats["bytes_out"] / stats["bytes_in"],
+                    "cpu_time_per_request": stats["cpu_time"] / stats["requests"],
+                }
+                for encoding, stats in self.stats["by_encoding"].items()
+            }
+            return {
+                **self.stats,
+                "by_encoding": by_encoding,
+                "accepted": sorted(self.accepted),
+                "ratio": (
+                    self.stats["bytes_out"] / self.stats["bytes_in"]
+                    if self.stats["bytes_in"]
+                    else None
+                ),
+                "cpu_time_per_request": (
+                    self.stats["cpu_time"] / self.stats["compressed"]
+                    if self.stats["compressed"]
+                    else None
+                ),
+            }
+
+    def update(self, headers: Optional[Mapping[str, str]]) -> None:
+        """
+        Learn the encodings the server accepts from a response's headers.
+
+        Args:
+            headers (Optional[Mapping[str, str]]): Response headers
+        """
+        header = headers.get("Accept-Encoding") if headers else None
+        if not header:
+            return
+
+        accepted = parse_accept_encoding(header)
+        if accepted != self.accepted:
+            logger.debug(f"Server accepts request encodings: {sorted(accepted)}")
+            self.accepted = accepted
+
+    def reject(self, encoding: str) -> None:
+        """
+        Stop using an encoding the server refused, e.g. with a 415.
+
+        Args:
+            encoding (str): The refused Content-Encoding
+        """
+        if encoding not in self.rejected:
+            logger.warning(f"Server rejected {encoding} request bodies")
+            self.rejected = self.rejected | {encoding}
+
+    def choose(self, size: int) -> Optional[str]:
+        """
+        Choose the encoding for a body.
+
+        Args:
+            size (int): Body size in bytes
+
+        Returns:
+            Optional[str]: Content-Encoding to use, or None to send the body
+                uncompressed
+        """
+        if self.algorithm == "none" or size < self.threshold:
+            return None
+        if self.algorithm != "auto":
+            return self.algorithm if self.algorithm not in self.rejected else None
+
+        usable = (self.accepted - self.rejected) & available_encodings()
+        for encoding in PREFERRED_ENCODINGS:
+            if encoding in usable:
+                return encoding
+        return None
+
+    def _compress_with(self, encoding: str, body: bytes) -> bytes:
+        """Compress a body with the given encoding."""
+        level = self.level if self.level is not None else DEFAULT_LEVELS[encoding]
+        if encoding == "gzip":
+            return gzip.compress(body, compresslevel=level)
+        if encoding == "br":
+            return brotli.compress(body, quality=level)
+
+        # zstd compressors are not thread-safe, so each thread keeps its own
+        compressor = getattr(self._local, "zstd", None)
+        if compressor is None:
+            compressor = self._local.zstd = zstandard.ZstdCompressor(
+                level=level, dict_data=self.zstd_dictionary
+            )
+        return compressor.compress(body)
+
+    def compress(self, body: Optional[bytes]) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Compress a request body if it is worth it.
+
+        Args:
+            body (Optional[bytes]): Encoded request body
+
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: The body to send and its
+                Content-Encoding, None if it is sent uncompressed
+        """
+        if body is None:
+            return None, None
+
+        encoding = self.choose(len(body))
+        if encoding is None:
+            with self._lock:
+                self.stats["requests"] += 1
+                self.stats["below_threshold"] += 1
+            return body, None
+
+        start_time = time.thread_time()
+        compressed = self._compress_with(encoding, body)
+        cpu_time = time.thread_time() - start_time
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["cpu_time"] += cpu_time
+            if len(compressed) >= len(body):
+                self.stats["incompressible"] += 1
+                return body, None
+
+            self.stats["compressed"] += 1
+            self.stats["bytes_in"] += len(body)
+            self.stats["bytes_out"] += len(compressed)
+            encoding_stats = self.stats["by_encoding"].setdefault(
+                encoding,
+                {"requests": 0, "bytes_in": 0, "bytes_out": 0, "cpu_time": 0.0},
+            )
+            encoding_stats["requests"] += 1
+            encoding_stats["bytes_in"] += len(body)
+            encoding_stats["bytes_out"] += len(compressed)
+            encoding_stats["cpu_time"] += cpu_time
+
+        logger.debug(
+            f"Compressed request body from {len(body)} to {len(compressed)} "
+            f"bytes with {encoding} in {cpu_time * 1000:.2f}ms"
+        )
+        return compressed, encoding
@@ -23,11 +23,42 @@ class SwarmsConfig:
     DEFAULT_RETRY_DELAY = 0.5  # Reduced initial delay
     DEFAULT_MAX_RETRY_DELAY = 10  # Reduced max delay
     DEFAULT_RETRY_ON_STATUS = [408, 429, 500, 502, 503, 504]  # Added 408 timeout
+    DEFAULT_RETRY_BUDGET_RATIO = 0.2  # Retries allowed per recent success
+    DEFAULT_RETRY_BUDGET_WINDOW = 10.0  # Sliding window for the retry budget
+    DEFAULT_RETRY_BUDGET_MIN_PER_SECOND = 1.0  # Retries always allowed at low traffic
+    DEFAULT_RATE_LIMIT_PAUSE = 1.0  # Pause after a 429 without timing headers
+    DEFAULT_RATE_LIMIT_PROBE_TIMEOUT = 30.0  # Wait for a probe before sending another
+    DEFAULT_CIRCUIT_FAILURE_RATE = 0.5  # Failure rate that opens a circuit
+    DEFAULT_CIRCUIT_MINIMUM_VOLUME = 20  # Calls needed before a circuit can open
+    DEFAULT_CIRCUIT_WINDOW = 30.0  # Sliding window for circuit failure rates
+    DEFAULT_CIRCUIT_OPEN_TIMEOUT = 15.0  # Time an open circuit fails fast
+    DEFAULT_HEDGE_PERCENTILE = 95.0  # Latency percentile that triggers a hedge
+    DEFAULT_HEDGE_MAX_EXTRA_LOAD = 0.05  # Hedges add at most 5% extra requests
+    DEFAULT_HEDGE_MIN_SAMPLES = 20  # Samples needed before an endpoint is hedged
     DEFAULT_KEEPALIVE_TIMEOUT = 30  # Keep connections alive
     DEFAULT_MAX_CONCURRENT_REQUESTS = 25  # Increased concurrency
+    DEFAULT_CONCURRENCY_LIMITER = "fixed"  # One of fixed, aimd, gradient
+    DEFAULT_JSON_CODEC = "auto"  # One of auto, orjson, msgspec, json
+    DEFAULT_SYNC_ENGINE = False  # Run sync calls on the background event loop
+    DEFAULT_COMPRESSION = "auto"  # One of auto, zstd, br, gzip, none
+    DEFAULT_COMPRESSION_THRESHOLD = 1024  # Smaller request bodies are not compressed
+    DEFAULT_MAX_ADAPTIVE_CONCURRENCY = 200  # Upper bound for adaptive limiters
     DEFAULT_DNS_CACHE_TTL = 300  # 5 minutes DNS cache
     DEFAULT_TCP_NODELAY = True  # Disable Nagle's algorithm
     DEFAULT_RESPONSE_CACHE_TTL = 60  # 1 minute response cache
+    DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB persistent cache cap
+    DEFAULT_IDEMPOTENCY_LOG_MAX_BYTES = 16 * 1024 * 1024  # 16 MB before compaction
+    DEFAULT_IDEMPOTENCY_TTL = 86400  # 1 day of logged results by idempotency key
+    DEFAULT_COMPLETION_CACHE_TTL = 86400  # 1 day completion cache
+    DEFAULT_COMPLETION_CACHE_L1_TTL = 60  # In-process copies of shared completions
+    DEFAULT_STREAM_BUFFER_SIZE = 64  # Max buffered stream events per consumer
+    DEFAULT_DECODE_CHUNK_SIZE = 64 * 1024  # Bytes read per incremental decode step
+    DEFAULT_MICRO_BATCH_MAX_SIZE = 32  # Max agent calls per micro-batch
+    DEFAULT_MICRO_BATCH_MAX_BYTES = 1_000_000  # 1 MB max micro-batch payload
+    DEFAULT_MICRO_BATCH_MAX_WAIT = 0.01  # 10ms max micro-batch window
+    DEFAULT_BATCH_CHUNK_SIZE = 100  # Max items per batch request
+    DEFAULT_BATCH_CHUNK_BYTES = 2_000_000  # 2 MB max batch request body
+    DEFAULT_BATCH_ITEM_RETRIES = 2  # Resubmissions of failed batch items
 
     @staticmethod
     def get_api_key() -> Optional[str]:
@@ -49,6 +80,18 @@ class SwarmsConfig:
         """
         return os.getenv("SWARMS_API_BASE_URL", SwarmsConfig.DEFAULT_BASE_URL)
 
+    @staticmethod
+    def get_alternate_base_url() -> str:
+        """
+        Get alternate base URL from environment variables or use default.
+
+        Returns:
+            str: Alternate base URL, e.g. for hedged requests
+        """
+        return os.getenv(
+            "SWARMS_API_ALTERNATE_BASE_URL", SwarmsConfig.ALTERNATE_BASE_URL
+        )
+
     @staticmethod
     def get_timeout() -> int:
         """
@@ -97,6 +140,36 @@ class SwarmsConfig:
             )
         )
 
+    @staticmethod
+    def get_retry_budget_ratio() -> float:
+        """Get retry budget ratio from environment variables or use default."""
+        return float(
+            os.getenv(
+                "SWARMS_API_RETRY_BUDGET_RATIO",
+                SwarmsConfig.DEFAULT_RETRY_BUDGET_RATIO,
+            )
+        )
+
+    @staticmethod
+    def get_retry_budget_window() -> float:
+        """Get retry budget window from environment variables or use default."""
+        return float(
+            os.getenv(
+                "SWARMS_API_RETRY_BUDGET_WINDOW",
+                SwarmsConfig.DEFAULT_RETRY_BUDGET_WINDOW,
+            )
+        )
+
+    @staticmethod
+    def get_retry_budget_min_per_second() -> float:
+        """Get retry budget minimum rate from environment variables or use default."""
+        return float(
+            os.getenv(
+                "SWARMS_API_RETRY_BUDGET_MIN_PER_SECOND",
+                SwarmsConfig.DEFAULT_RETRY_BUDGET_MIN_PER_SECOND,
+            )
+        )
+
     @staticmethod
     def get_keepalive_timeout() -> int:
         """Get keepalive timeout from environment variables or use default."""
@@ -116,6 +189,28 @@ class SwarmsConfig:
             )
         )
 
+    @staticmethod
+    def get_concurrency_limiter() -> str:
+        """Get concurrency limiter type from environment variables or use default."""
+        return os.getenv(
+            "SWARMS_API_CONCURRENCY_LIMITER", SwarmsConfig.DEFAULT_CONCURRENCY_LIMITER
+        )
+
+    @staticmethod
+    def get_json_codec() -> str:
+        """Get JSON codec name from environment variables or use default."""
+        return os.getenv("SWARMS_API_JSON_CODEC", SwarmsConfig.DEFAULT_JSON_CODEC)
+
+    @staticmethod
+    def get_max_adaptive_concurrency() -> int:
+        """Get adaptive concurrency ceiling from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_MAX_ADAPTIVE_CONCURRENCY",
+                SwarmsConfig.DEFAULT_MAX_ADAPTIVE_CONCURRENCY,
+            )
+        )
+
     @staticmethod
     def get_dns_cache_ttl() -> int:
         """Get DNS cache TTL from environment variables or use default."""
@@ -138,3 +233,175 @@ class SwarmsConfig:
                 "SWARMS_API_RESPONSE_CACHE_TTL", SwarmsConfig.DEFAULT_RESPONSE_CACHE_TTL
             )
         )
+
+    @staticmethod
+    def get_cache_path() -> Optional[str]:
+        """Get persistent response cache path from environment variables."""
+        return os.getenv("SWARMS_API_CACHE_PATH")
+
+    @staticmethod
+    def get_compression() -> str:
+        """Get request compression algorithm from environment variables or use default."""
+        return os.getenv("SWARMS_API_COMPRESSION", SwarmsConfig.DEFAULT_COMPRESSION)
+
+    @staticmethod
+    def get_compression_threshold() -> int:
+        """Get request compression threshold from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_COMPRESSION_THRESHOLD",
+                SwarmsConfig.DEFAULT_COMPRESSION_THRESHOLD,
+            )
+        )
+
+    @staticmethod
+    def get_zstd_dictionary_path() -> Optional[str]:
+        """Get zstd compression dictionary path from environment variables."""
+        return os.getenv("SWARMS_API_ZSTD_DICTIONARY")
+
+    @staticmethod
+    def get_sync_engine() -> bool:
+        """Get whether sync calls run on the background event loop from environment variables."""
+        value = os.getenv("SWARMS_API_SYNC_ENGINE")
+        if value is None:
+            return SwarmsConfig.DEFAULT_SYNC_ENGINE
+        return value.strip().lower() in ("1", "true", "yes", "on")
+
+    @staticmethod
+    def get_spill_threshold() -> Optional[int]:
+        """Get response field spill threshold in bytes from environment variables."""
+        threshold = os.getenv("SWARMS_API_SPILL_THRESHOLD")
+        return int(threshold) if threshold else None
+
+    @staticmethod
+    def get_idempotency_ttl() -> int:
+        """Get idempotency log TTL from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_IDEMPOTENCY_TTL", SwarmsConfig.DEFAULT_IDEMPOTENCY_TTL
+            )
+        )
+
+    @staticmethod
+    def get_completion_cache_ttl() -> int:
+        """Get completion cache TTL from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_COMPLETION_CACHE_TTL",
+                SwarmsConfig.DEFAULT_COMPLETION_CACHE_TTL,
+            )
+        )
+
+    @staticmethod
+    def get_completion_cache_l1_ttl() -> int:
+        """Get in-process TTL of shared completion cache entries from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_COMPLETION_CACHE_L1_TTL",
+                SwarmsConfig.DEFAULT_COMPLETION_CACHE_L1_TTL,
+            )
+        )
+
+    @staticmethod
+    def get_stream_buffer_size() -> int:
+        """Get stream event buffer size from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_STREAM_BUFFER_SIZE", SwarmsConfig.DEFAULT_STREAM_BUFFER_SIZE
+            )
+        )
+
+    @staticmethod
+    def get_micro_batch_max_size() -> int:
+        """Get micro-batch size cap from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_MICRO_BATCH_MAX_SIZE",
+                SwarmsConfig.DEFAULT_MICRO_BATCH_MAX_SIZE,
+            )
+        )
+
+    @staticmethod
+    def get_micro_batch_max_bytes() -> int:
+        """Get micro-batch byte cap from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_MICRO_BATCH_MAX_BYTES",
+                SwarmsConfig.DEFAULT_MICRO_BATCH_MAX_BYTES,
+            )
+        )
+
+    @staticmethod
+    def get_micro_batch_max_wait() -> float:
+        """Get micro-batch window cap from environment variables or use default."""
+        return float(
+            os.getenv(
+                "SWARMS_API_MICRO_BATCH_MAX_WAIT",
+                SwarmsConfig.DEFAULT_MICRO_BATCH_MAX_WAIT,
+            )
+        )
+
+    @staticmethod
+    def get_batch_chunk_size() -> int:
+        """Get batch chunk size from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_BATCH_CHUNK_SIZE", SwarmsConfig.DEFAULT_BATCH_CHUNK_SIZE
+            )
+        )
+
+    @staticmethod
+    def get_batch_chunk_bytes() -> int:
+        """Get batch chunk byte cap from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_BATCH_CHUNK_BYTES", SwarmsConfig.DEFAULT_BATCH_CHUNK_BYTES
+            )
+        )
+
+    @staticmethod
+    def get_batch_item_retries() -> int:
+        """Get batch item retries from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_BATCH_ITEM_RETRIES",
+                SwarmsConfig.DEFAULT_BATCH_ITEM_RETRIES,
+            )
+        )
+
+    @staticmethod
+    def get_circuit_failure_rate() -> float:
+        """Get circuit breaker failure rate from environment variables or use default."""
+        return float(
+            os.getenv(
+                "SWARMS_API_CIRCUIT_FAILURE_RATE",
+                SwarmsConfig.DEFAULT_CIRCUIT_FAILURE_RATE,
+            )
+        )
+
+    @staticmethod
+    def get_circuit_minimum_volume() -> int:
+        """Get circuit breaker minimum volume from environment variables or use default."""
+        return int(
+            os.getenv(
+                "SWARMS_API_CIRCUIT_MINIMUM_VOLUME",
+                SwarmsConfig.DEFAULT_CIRCUIT_MINIMUM_VOLUME,
+            )
+        )
+
+    @staticmethod
+    def get_circuit_window() -> float:
+        """Get circuit breaker window from environment variables or use default."""
+        return float(
+            os.getenv("SWARMS_API_CIRCUIT_WINDOW", SwarmsConfig.DEFAULT_CIRCUIT_WINDOW)
+        )
+
+    @staticmethod
+    def get_circuit_open_timeout() -> float:
+        """Get circuit breaker open timeout from environment variables or use default."""
+        return float(
+            os.getenv(
+                "SWARMS_API_CIRCUIT_OPEN_TIMEOUT",
+                SwarmsConfig.DEFAULT_CIRCUIT_OPEN_TIMEOUT,
+            )
+        )
@@ -0,0 +1,111 @@
+"""
+Connector module for Swarms API client.
+
+This module provides the TCP connector behind the async client's sessions. It
+is created lazily on first use, on the running event loop, so a client can be
+built at startup outside any loop, and it can be shared by several clients so
+they reuse the same keep-alive connections and DNS cache.
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+from loguru import logger
+
+from .config import SwarmsConfig
+from .loops import LoopLocal
+
+
+class SharedConnector:
+    """Lazily created aiohttp TCP connector that clients can share."""
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        ttl_dns_cache: Optional[int] = None,
+        keepalive_timeout: Optional[int] = None,
+    ):
+        """
+        Initialize the connector settings. No connection is made until a
+        client first uses the connector.
+
+        Connectors are bound to an event loop, so one is created for each
+        loop the connector is used from, and dropped when that loop closes.
+
+        Args:
+            limit (Optional[int]): Maximum connections open at once per loop,
+                across all clients using the connector. Defaults to
+                SWARMS_API_MAX_CONCURRENT_REQUESTS.
+            ttl_dns_cache (Optional[int]): Seconds DNS lookups are cached.
+                Defaults to SWARMS_API_DNS_CACHE_TTL.
+            keepalive_timeout (Optional[int]): Seconds idle connections are
+                kept open. Defaults to SWARMS_API_KEEPALIVE_TIMEOUT.
+        """
+        self.limit = limit or SwarmsConfig.get_max_concurrent_requests()
+        self.ttl_dns_cache = ttl_dns_cache or SwarmsConfig.get_dns_cache_ttl()
+        self.keepalive_timeout = (
+            keepalive_timeout or SwarmsConfig.get_keepalive_timeout()
+        )
+        self._connectors: LoopLocal[aiohttp.TCPConnector] = LoopLocal(
+            self._create_connector, on_discard=self._discard_connector
+        )
+
+    @property
+    def closed(self) -> bool:
+        """Whether there is no open connector on any loop."""
+        return all(connector.closed for connector in self._connectors.values())
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        logger.debug(f"Creating TCP connector with limit {self.limit}")
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            force_close=False,
+            enable_cleanup_closed=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+    @staticmethod
+    def _discard_connector(connector: aiohttp.TCPConnector) -> None:
+        # The loop has closed, so its connections can no longer be shut down
+        # gracefully; mark the connector closed and let the sockets be freed
+        connector._close()
+
+    def get(self) -> aiohttp.TCPConnector:
+        """
+        Get the running loop's connector, creating it if needed.
+
+        A connector that was closed is replaced.
+
+        Returns:
+            aiohttp.TCPConnector: The connector
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        connector = self._connectors.get()
+        if connector.closed:
+            self._connectors.pop()
+            connector = self._connectors.get()
+        return connector
+
+    async def aclose(self, all_loops: bool = True) -> None:
+        """
+        Close the connectors and their connections, for all clients using them.
+
+        The running loop's connector is closed before returning; those of
+        other running loops are closed on their own loops.
+
+        Args:
+            all_loops (bool): Whether to close the connectors of all loops, or
+                only the running loop's
+        """
+        current = self._connectors.pop()
+        if all_loops:
+            for loop, connector in self._connectors.items():
+                if not connector.closed:
+                    asyncio.run_coroutine_threadsafe(connector.close(), loop)
+        if current is not None and not current.closed:
+            await current.close()
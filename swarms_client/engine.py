@@ -0,0 +1,153 @@
+"""
+Engine module for Swarms API client.
+
+This module runs an event loop in a background thread, so the sync client can
+submit its calls to the async implementation and share its connection pool,
+concurrency limiter, retries and coalescing across all calling threads.
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+_default_engine: Optional["AsyncEngine"] = None
+_default_engine_lock = threading.Lock()
+
+
+class AsyncEngine:
+    """Event loop running in a daemon thread, shared by sync callers."""
+
+    def __init__(self, name: str = "swarms_client_engine"):
+        """
+        Initialize the engine. Its thread is started on first use.
+
+        Args:
+            name (str): Name of the engine's thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the engine's loop is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the engine's loop, starting its thread if needed.
+
+        Returns:
+            asyncio.AbstractEventLoop: The running loop of the engine
+        """
+        with self._lock:
+            if not self.running:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(self._loop,),
+                    name=self.name,
+                    daemon=True,
+                )
+                self._thread.start()
+                logger.debug(f"Started event loop thread {self.name}")
+            return self._loop
+
+    def _check_thread(self) -> None:
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "Sync calls cannot be made from the engine's own event loop; "
+                "use the async methods instead"
+            )
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the engine's loop and wait for its result.
+
+        Args:
+            coro (Coroutine[Any, Any, T]): Coroutine to run
+            timeout (Optional[float]): Seconds to wait before cancelling it
+
+        Returns:
+            T: The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the engine's own thread
+        """
+        try:
+            self._check_thread()
+        except RuntimeError:
+            coro.close()
+            raise
+        future = asyncio.run_coroutine_threadsafe(coro, self.get_loop())
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Timeouts and interrupts leave the coroutine running otherwise
+            future.cancel()
+            raise
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """
+        Iterate an async iterator on the engine's loop.
+
+        Args:
+            iterator (AsyncIterator[T]): Async iterator, e.g. an async generator
+
+        Yields:
+            T: The iterator's items
+        """
+        self._check_thread()
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None and self.running:
+                self.run(aclose())
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the engine's loop and wait for its thread to finish.
+
+        The engine starts again on its next use.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the thread
+        """
+        with self._lock:
+            if not self.running:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            thread = self._thread
+        thread.join(timeout)
+
+
+def get_engine() -> AsyncEngine:
+    """
+    Get the engine shared by all clients in the process.
+
+    Returns:
+        AsyncEngine: The shared engine
+    """
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = AsyncEngine()
+        return _default_engine
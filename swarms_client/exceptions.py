@@ -0,0 +1,62 @@
+"""
+Exceptions module for Swarms API client.
+
+This module defines the exception hierarchy raised by the client.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class SwarmsError(Exception):
+    """Base exception for all Swarms API errors."""
+
+    pass
+
+
+class AuthenticationError(SwarmsError):
+    """Raised when authentication fails."""
+
+    pass
+
+
+class RateLimitError(SwarmsError):
+    """Raised when rate limit is exceeded."""
+
+    status = 429
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class ValidationError(SwarmsError):
+    """Raised when input validation fails."""
+
+    pass
+
+
+class APIError(SwarmsError):
+    """Raised when the API returns an error."""
+
+    def __init__(self, message: str, status_code: int, response: Dict[str, Any]):
+        self.status_code = status_code
+        self.response = response
+        super().__init__(f"{message} (Status: {status_code})")
+
+
+class CircuitOpenError(SwarmsError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+
+    def __init__(self, circuit: str, retry_after: float):
+        self.circuit = circuit
+        self.retry_after = retry_after
+        super().__init__(f"Circuit '{circuit}' is open, retry in {retry_after:.1f}s")
+
+
+class BatchError(SwarmsError):
+    """Raised when some items of a batch failed."""
+
+    def __init__(self, results: List[Any], errors: Dict[int, Exception]):
+        self.results = results
+        self.errors = errors
+        super().__init__(f"{len(errors)} of {len(results)} batch items failed")
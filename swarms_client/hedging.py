@@ -0,0 +1,200 @@
+"""
+Hedging module for Swarms API client.
+
+This module sends a second, hedged attempt for requests that are slower than
+an observed latency percentile, taking whichever response arrives first.
+"""
+
+import asyncio
+import collections
+import math
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, TypeVar
+
+from loguru import logger
+
+from .config import SwarmsConfig
+
+T = TypeVar("T")
+
+# Number of latency samples kept per endpoint
+LATENCY_WINDOW = 500
+
+# Recompute the percentile after this many new samples
+PERCENTILE_REFRESH = 10
+
+# Maximum number of hedges that can be saved up while traffic is fast
+MAX_HEDGE_TOKENS = 10.0
+
+
+class _LatencyTracker:
+    """Sliding window of latencies for one endpoint."""
+
+    def __init__(self, percentile: float):
+        self.percentile = percentile
+        self.samples: Deque[float] = collections.deque(maxlen=LATENCY_WINDOW)
+        self.value: Optional[float] = None
+        self._since_refresh = 0
+
+    def record(self, latency: float) -> None:
+        self.samples.append(latency)
+        self._since_refresh += 1
+        if self.value is None or self._since_refresh >= PERCENTILE_REFRESH:
+            ordered = sorted(self.samples)
+            index = math.ceil(self.percentile / 100 * len(ordered)) - 1
+            self.value = ordered[max(index, 0)]
+            self._since_refresh = 0
+
+
+class HedgingPolicy:
+    """Decides when a slow request gets a hedged second attempt."""
+
+    def __init__(
+        self,
+        percentile: float = SwarmsConfig.DEFAULT_HEDGE_PERCENTILE,
+        max_extra_load: float = SwarmsConfig.DEFAULT_HEDGE_MAX_EXTRA_LOAD,
+        min_samples: int = SwarmsConfig.DEFAULT_HEDGE_MIN_SAMPLES,
+        min_delay: float = 0.005,
+        methods: Iterable[str] = ("GET",),
+        hedge_base_url: Optional[str] = None,
+    ):
+        """
+        Initialize the hedging policy.
+
+        Args:
+            percentile (float): Latency percentile, per endpoint, after which
+                a hedged attempt is sent
+            max_extra_load (float): Maximum hedged attempts as a fraction of
+                requests, e.g. 0.05 for at most 5% extra load
+            min_samples (int): Latency samples needed for an endpoint before
+                it is hedged
+            min_delay (float): Lower bound in seconds for the hedge delay
+            methods (Iterable[str]): HTTP methods hedged by default. Adding
+                POST hedges every POST, including non-idempotent swarm runs
+                and batch submissions; hedge single completions with their
+                ``hedge=True`` argument instead.
+            hedge_base_url (Optional[str]): Base URL for hedged attempts, e.g.
+                SwarmsConfig.ALTERNATE_BASE_URL. Defaults to the client's own.
+        """
+        self.percentile = percentile
+        self.max_extra_load = max_extra_load
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.methods = {method.upper() for method in methods}
+        self.hedge_base_url = hedge_base_url.rstrip("/") if hedge_base_url else None
+
+        self._trackers: Dict[str, _LatencyTracker] = {}
+        self._tokens = 0.0
+
+        # Track hedging statistics
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "budget_denied": 0,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the policy's state.
+
+        Returns:
+            Dict[str, Any]: Current hedge delay per endpoint and statistics
+        """
+        return {
+            "delays": {key: self.get_delay(key) for key in self._trackers},
+            **self.stats,
+        }
+
+    def get_delay(self, key: str) -> Optional[float]:
+        """
+        Get the time after which a request to an endpoint is hedged.
+
+        Args:
+            key (str): Endpoint key
+
+        Returns:
+            Optional[float]: Delay in seconds, or None while there are too few
+                samples to hedge the endpoint
+        """
+        tracker = self._trackers.get(key)
+        if tracker is None or len(tracker.samples) < self.min_samples:
+            return None
+        return max(tracker.value or 0.0, self.min_delay)
+
+    def record(self, key: str, latency: float) -> None:
+        """
+        Record the latency of a primary attempt.
+
+        Args:
+            key (str): Endpoint key
+            latency (float): Latency in seconds
+        """
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = self._trackers[key] = _LatencyTracker(self.percentile)
+        tracker.record(latency)
+
+    def _try_spend(self) -> bool:
+        """Take a hedge from the extra load budget."""
+        if self._tokens < 1:
+            self.stats["budget_denied"] += 1
+            return False
+        self._tokens -= 1
+        return True
+
+    async def run(
+        self,
+        key: str,
+        attempt: Callable[[bool], Awaitable[T]],
+    ) -> T:
+        """
+        Run a request, hedging it if it is slower than the percentile.
+
+        The first successful response wins and the other attempt is
+        cancelled. If one attempt fails, the other is still awaited.
+
+        Only primary attempts are sampled, so the percentile reflects the
+        latency of unhedged requests. When the hedge wins, the primary's
+        elapsed time is recorded as a lower bound on its latency; recording
+        the winner instead would pull the percentile down with every hedge.
+
+        Args:
+            key (str): Endpoint key for latency tracking
+            attempt (Callable[[bool], Awaitable[T]]): Coroutine function
+                performing one attempt, called with True for the hedge
+
+        Returns:
+            T: Result of the winning attempt
+        """
+        loop = asyncio.get_running_loop()
+        self.stats["requests"] += 1
+        self._tokens = min(self._tokens + self.max_extra_load, MAX_HEDGE_TOKENS)
+
+        start_time = loop.time()
+        primary = asyncio.ensure_future(attempt(False))
+        tasks = {primary}
+
+        try:
+            delay = self.get_delay(key)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._try_spend():
+                    self.stats["hedged"] += 1
+                    logger.debug(f"Hedging {key} after {delay:.3f}s")
+                    tasks.add(asyncio.ensure_future(attempt(True)))
+
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.stats["hedge_wins"] += 1
+                        if task is primary or not primary.done():
+                            self.record(key, loop.time() - start_time)
+                        return task.result()
+                    if not tasks:
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,212 @@
+"""
+Idempotency module for Swarms API client.
+
+This module generates the idempotency keys sent with every POST request, so a
+request retried after a network failure is not executed twice, and provides a
+local log of results keyed by idempotency key for duplicate submissions.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .config import SwarmsConfig
+
+# Header carrying the idempotency key of a request
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+def new_idempotency_key() -> str:
+    """
+    Generate a new idempotency key.
+
+    Returns:
+        str: A random UUID4 string
+    """
+    return str(uuid.uuid4())
+
+
+class IdempotencyLog:
+    """Local log of results keyed by idempotency key, kept in a JSONL file."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = None,
+        max_bytes: int = SwarmsConfig.DEFAULT_IDEMPOTENCY_LOG_MAX_BYTES,
+    ):
+        """
+        Initialize the log, loading results recorded by earlier runs.
+
+        Each result is appended to the file as one JSON line, so the log
+        survives restarts and a resubmitted request with the same key returns
+        the stored result instead of calling the API again.
+
+        The file is compacted, keeping one line per unexpired result, when
+        loading finds stale lines and whenever it grows past max_bytes.
+
+        Args:
+            path (str): Path of the JSONL log file
+            ttl (Optional[float]): Seconds a result is kept. Defaults to
+                value from config.
+            max_bytes (int): File size that triggers compaction. It is
+                doubled while the live results alone exceed it.
+        """
+        self.path = path
+        self.ttl = ttl or SwarmsConfig.get_idempotency_ttl()
+        self.max_bytes = max_bytes
+        self._results: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._size = 0
+        self._compact_at = max_bytes
+
+        # Track log statistics
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "recorded": 0,
+            "compactions": 0,
+        }
+
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _is_expired(self, recorded_at: float, now: float) -> bool:
+        """Check whether a result recorded at a time has outlived the TTL."""
+        return now - recorded_at > self.ttl
+
+    def _load(self) -> None:
+        """Read results recorded by earlier runs, compacting stale lines."""
+        if not os.path.exists(self.path):
+            return
+
+        lines = 0
+        now = time.time()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    self._results[entry["key"]] = (entry["time"], entry["result"])
+                except (ValueError, KeyError, TypeError):
+                    # A crash mid-write leaves a truncated last line behind
+                    logger.warning(
+                        f"Skipping malformed idempotency log line {line_number} in {self.path}"
+                    )
+
+        self._results = {
+            key: entry
+            for key, entry in self._results.items()
+            if not self._is_expired(entry[0], now)
+        }
+        self._size = os.path.getsize(self.path)
+        if lines > len(self._results):
+            self._compact()
+
+        logger.debug(f"Loaded {len(self._results)} results from {self.path}")
+
+    def _compact(self) -> None:
+        """
+        Rewrite the file with one line per unexpired result. Callers must
+        hold the file lock, or own the log exclusively.
+        """
+        now = time.time()
+        with self._lock:
+            for key in [
+                key
+                for key, (recorded_at, _) in self._results.items()
+                if self._is_expired(recorded_at, now)
+            ]:
+                del self._results[key]
+            entries = list(self._results.items())
+
+        # Write a new file and swap it in, so a crash leaves either log whole
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for key, (recorded_at, result) in entries:
+                f.write(
+                    json.dumps({"key": key, "time": recorded_at, "result": result})
+                    + "\n"
+                )
+        os.replace(temp_path, self.path)
+
+        self._size = os.path.getsize(self.path)
+        self._compact_at = max(self.max_bytes, 2 * self._size)
+        self.stats["compactions"] += 1
+        logger.debug(f"Compacted {self.path} to {len(entries)} results")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get the stored result for an idempotency key.
+
+        Args:
+            key (str): Idempotency key
+
+        Returns:
+            Optional[Any]: The stored result, or None if none is stored or it
+                has expired
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+
+            recorded_at, result = entry
+            if self._is_expired(recorded_at, time.time()):
+                del self._results[key]
+                return None
+
+            self.stats["hits"] += 1
+            return result
+
+    def _store(self, key: str, result: Any) -> str:
+        """Store a result in memory and return its log line."""
+        now = time.time()
+        line = json.dumps({"key": key, "time": now, "result": result}) + "\n"
+        with self._lock:
+            self._results[key] = (now, result)
+            self.stats["recorded"] += 1
+        return line
+
+    def _append(self, line: str) -> None:
+        """Append a line to the file, compacting it past the size limit."""
+        with self._file_lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self._size += len(line.encode("utf-8"))
+            if self._size > self._compact_at:
+                self._compact()
+
+    def record(self, key: str, result: Any) -> None:
+        """
+        Store the result of a request.
+
+        Args:
+            key (str): Idempotency key of the request
+            result (Any): JSON-serializable result
+        """
+        self._append(self._store(key, result))
+
+    async def arecord(self, key: str, result: Any) -> None:
+        """
+        Store the result of a request, writing the file off the event loop.
+
+        The result can be read back as soon as this is called.
+
+        Args:
+            key (str): Idempotency key of the request
+            result (Any): JSON-serializable result
+        """
+        line = self._store(key, result)
+        await asyncio.get_running_loop().run_in_executor(None, self._append, line)
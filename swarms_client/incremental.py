@@ -0,0 +1,564 @@
+"""
+Incremental decoding module for Swarms API client.
+
+This module parses JSON response bodies chunk by chunk as they arrive. A
+projection selects the fields to keep, so everything else is skipped without
+being materialized, and very large kept fields can spill to temporary files.
+"""
+
+import json
+import re
+import tempfile
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+# Paths are tuples of object keys; arrays are traversed transparently
+Path = Tuple[str, ...]
+
+# Parser generators yield whenever they need more input
+_Parse = Generator[None, None, Any]
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING_CHUNK = re.compile(rb'[^"\\]*')
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_SCALAR_END = re.compile(rb"[,\]} \t\n\r]")
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_SCALAR_BODY = re.compile(rb"[^,\]}]*")
+_CONTAINER_BODY = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+
+_QUOTE = ord('"')
+_COLON = ord(":")
+_COMMA = ord(",")
+_LBRACE = ord("{")
+_RBRACE = ord("}")
+_LBRACKET = ord("[")
+_RBRACKET = ord("]")
+
+_KEEP = "keep"
+_DESCEND = "descend"
+_SKIP = "skip"
+
+
+def parse_projection(projection: Iterable[str]) -> Set[Path]:
+    """
+    Parse a projection into paths.
+
+    Args:
+        projection (Iterable[str]): Dotted field paths such as "output" or
+            "usage.total_tokens". Arrays are traversed transparently, so
+            "results.output" keeps the output of every item of "results".
+
+    Returns:
+        Set[Path]: The paths to keep
+    """
+    return {tuple(field.split(".")) for field in projection}
+
+
+def _skip_value(data: bytes, pos: int) -> int:
+    """Return the end offset of the encoded value starting at pos."""
+    byte = data[pos]
+    if byte == _QUOTE:
+        string = _STRING_BODY.match(data, pos + 1)
+        if string is None:
+            raise ValueError("Unterminated string in JSON document")
+        return string.end()
+    if byte not in (_LBRACE, _LBRACKET):
+        return _SCALAR_BODY.match(data, pos).end()
+
+    # Jump from bracket to bracket, swallowing everything in between
+    depth = 0
+    while True:
+        byte = data[pos]
+        if byte in (_LBRACE, _LBRACKET):
+            depth += 1
+        elif byte in (_RBRACE, _RBRACKET):
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        else:
+            raise ValueError("Unterminated string in JSON document")
+        pos = _CONTAINER_BODY.match(data, pos + 1).end()
+
+
+def _skip_whitespace(data: bytes, pos: int) -> int:
+    return _WHITESPACE.match(data, pos).end()
+
+
+def _iter_object(data: bytes, pos: int) -> Iterator[Tuple[bytes, int]]:
+    """
+    Yield the raw key and value offset of each member of the object at pos.
+    """
+    pos = _skip_whitespace(data, pos + 1)
+    while data[pos] != _RBRACE:
+        key_end = _skip_value(data, pos)
+        raw_key = data[pos:key_end]
+        pos = _skip_whitespace(data, key_end)
+        if data[pos] != _COLON:
+            raise ValueError("Expected ':' in JSON object")
+        pos = _skip_whitespace(data, pos + 1)
+        yield raw_key, pos
+        pos = _skip_whitespace(data, _skip_value(data, pos))
+        if data[pos] == _COMMA:
+            pos = _skip_whitespace(data, pos + 1)
+        elif data[pos] != _RBRACE:
+            raise ValueError("Expected ',' or '}' in JSON object")
+
+
+def _key_matches(raw_key: bytes, encoded_key: bytes, key: str) -> bool:
+    """Compare an encoded object key with a key, decoding it only if escaped."""
+    if b"\\" in raw_key:
+        return json.loads(raw_key) == key
+    return raw_key == encoded_key
+
+
+def find_field(data: bytes, key: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate the value of a top-level field of an encoded JSON object without
+    decoding the document.
+
+    Args:
+        data (bytes): The encoded document
+        key (str): Field name
+
+    Returns:
+        Optional[Tuple[int, int]]: Start and end offset of the field's value
+            in data, or None if the document is not an object or lacks the key
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    encoded_key = json.dumps(key, ensure_ascii=False).encode("utf-8")
+    try:
+        pos = _skip_whitespace(data, 0)
+        if data[pos] != _LBRACE:
+            return None
+        for raw_key, value_pos in _iter_object(data, pos):
+            if _key_matches(raw_key, encoded_key, key):
+                return value_pos, _skip_value(data, value_pos)
+        return None
+    except IndexError:
+        raise ValueError("Unexpected end of JSON document") from None
+
+
+def split_array(data: bytes, keys: Iterable[str] = ()) -> List[Tuple[int, int]]:
+    """
+    Locate the items of an encoded JSON array without decoding them.
+
+    Args:
+        data (bytes): The encoded document
+        keys (Iterable[str]): If the document is an object, the keys to look
+            for the array under, in order of preference
+
+    Returns:
+        List[Tuple[int, int]]: Start and end offset of each item in data
+
+    Raises:
+        ValueError: If the document is not valid JSON or holds no array
+    """
+    try:
+        pos = _skip_whitespace(data, 0)
+        if data[pos] == _LBRACE:
+            arrays: Dict[str, int] = {}
+            for raw_key, value_pos in _iter_object(data, pos):
+                if data[value_pos] == _LBRACKET:
+                    arrays.setdefault(json.loads(raw_key), value_pos)
+
+            found = [arrays[key] for key in keys if key in arrays]
+            if not found:
+                raise ValueError(f"JSON object has no array under {list(keys)}")
+            pos = found[0]
+
+        if data[pos] != _LBRACKET:
+            raise ValueError("Expected a JSON array")
+
+        spans: List[Tuple[int, int]] = []
+        pos = _skip_whitespace(data, pos + 1)
+        if data[pos] == _RBRACKET:
+            return spans
+
+        while True:
+            end = _skip_value(data, pos)
+            spans.append((pos, end))
+            pos = _skip_whitespace(data, end)
+            if data[pos] == _RBRACKET:
+                return spans
+            if data[pos] != _COMMA:
+                raise ValueError("Expected ',' or ']' in JSON array")
+            pos = _skip_whitespace(data, pos + 1)
+    except IndexError:
+        raise ValueError("Unexpected end of JSON document") from None
+
+
+class SpilledField:
+    """A large response field spilled to a temporary file."""
+
+    __slots__ = ("file", "size", "_loads")
+
+    def __init__(self, file: IO[bytes], size: int, loads: Callable[[bytes], Any]):
+        """
+        Initialize the spilled field.
+
+        Args:
+            file (IO[bytes]): Temporary file holding the field's raw JSON
+            size (int): Size of the raw JSON in bytes
+            loads (Callable[[bytes], Any]): Decoder used by load()
+        """
+        self.file = file
+        self.size = size
+        self._loads = loads
+
+    def __repr__(self) -> str:
+        return f"SpilledField(size={self.size})"
+
+    def read(self) -> bytes:
+        """
+        Read the field's raw JSON.
+
+        Returns:
+            bytes: The raw JSON
+        """
+        self.file.seek(0)
+        return self.file.read()
+
+    def load(self) -> Any:
+        """
+        Decode the field into memory.
+
+        Returns:
+            Any: The decoded value
+        """
+        return self._loads(self.read())
+
+    def close(self) -> None:
+        """Delete the temporary file."""
+        self.file.close()
+
+
+def has_spilled_fields(value: Any) -> bool:
+    """
+    Check whether a decoded value holds fields spilled to temporary files.
+
+    Args:
+        value (Any): Decoded JSON value
+
+    Returns:
+        bool: True if any nested field is a SpilledField
+    """
+    if isinstance(value, SpilledField):
+        return True
+    if isinstance(value, dict):
+        return any(has_spilled_fields(item) for item in value.values())
+    if isinstance(value, list):
+        return any(has_spilled_fields(item) for item in value)
+    return False
+
+
+class _Sink:
+    """Collects the raw bytes of a kept value, spilling past a threshold."""
+
+    __slots__ = ("spill_threshold", "size", "_buffer", "_file")
+
+    def __init__(self, spill_threshold: Optional[int] = None):
+        self.spill_threshold = spill_threshold
+        self.size = 0
+        self._buffer = bytearray()
+        self._file: Optional[IO[bytes]] = None
+
+    def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self._file is not None:
+            self._file.write(data)
+            return
+
+        self._buffer += data
+        if self.spill_threshold is not None and self.size > self.spill_threshold:
+            self._file = tempfile.TemporaryFile()
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def result(self, loads: Callable[[bytes], Any]) -> Any:
+        if self._file is None:
+            return loads(self._buffer)
+        return SpilledField(self._file, self.size, loads)
+
+
+class IncrementalJSONParser:
+    """Resumable JSON parser fed with chunks of a response body."""
+
+    def __init__(
+        self,
+        projection: Optional[Iterable[str]] = None,
+        spill_threshold: Optional[int] = None,
+        loads: Callable[[bytes], Any] = json.loads,
+    ):
+        """
+        Initialize the parser.
+
+        Only the raw bytes of the chunk being parsed and of kept values are
+        held in memory; skipped values are scanned past without decoding.
+
+        Args:
+            projection (Optional[Iterable[str]]): Dotted field paths to keep,
+                None to keep the whole document
+            spill_threshold (Optional[int]): Size in bytes above which a kept
+                field is written to a temporary file and returned as a
+                SpilledField, None to keep everything in memory. Without a
+                projection, each top-level field (of each item, for a list)
+                spills on its own.
+            loads (Callable[[bytes], Any]): Decoder for kept values
+        """
+        self.paths = parse_projection(projection) if projection is not None else None
+        self.spill_threshold = spill_threshold
+        self.loads = loads
+
+        self._buf = bytearray()
+        self._pos = 0
+        self._eof = False
+        self._done = False
+        self._result: Any = None
+        self._modes: Dict[Path, str] = {}
+
+        # Track parsing statistics
+        self.stats: Dict[str, int] = {
+            "bytes": 0,
+            "skipped_fields": 0,
+            "spilled_fields": 0,
+        }
+
+        self._parser = self._parse_document()
+        next(self._parser)
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Parse the next chunk of the body.
+
+        Args:
+            chunk (bytes): Raw bytes as received from the connection
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        self.stats["bytes"] += len(chunk)
+        if self._done:
+            if chunk.strip():
+                raise ValueError("Extra data after JSON document")
+            return
+
+        # Drop consumed input; kept values were already copied to their sinks
+        if self._pos:
+            del self._buf[: self._pos]
+            self._pos = 0
+        self._buf += chunk
+        self._resume()
+
+    def close(self) -> Any:
+        """
+        Finish parsing at the end of the body.
+
+        Returns:
+            Any: The decoded, projected document
+
+        Raises:
+            ValueError: If the body ended before the document was complete
+        """
+        if not self._done:
+            self._eof = True
+            self._resume()
+        if not self._done:
+            raise ValueError("Truncated JSON document")
+        return self._result
+
+    def _resume(self) -> None:
+        """Run the parser until it needs more input or finishes."""
+        try:
+            self._parser.send(None)
+        except StopIteration as e:
+            self._done = True
+            self._result = e.value
+
+    def _mode(self, path: Path) -> str:
+        """Decide whether a value is kept, descended into or skipped."""
+        mode = self._modes.get(path)
+        if mode is not None:
+            return mode
+
+        if self.paths is None:
+            # Without a projection, the fields of the document spill one by one
+            mode = _KEEP if path else _DESCEND
+        elif any(path[: len(p)] == p for p in self.paths):
+            mode = _KEEP
+        elif any(p[: len(path)] == path for p in self.paths):
+            mode = _DESCEND
+        else:
+            mode = _SKIP
+        self._modes[path] = mode
+        return mode
+
+    def _more(self) -> Generator[None, None, bool]:
+        """Wait for more input, returning False at the end of the body."""
+        if self._eof:
+            return False
+        yield
+        return True
+
+    def _advance(self, end: int, sink: Optional[_Sink]) -> None:
+        """Consume input up to end, copying it to the sink if there is one."""
+        if sink is not None and end > self._pos:
+            sink.write(self._buf[self._pos : end])
+        self._pos = end
+
+    def _peek(self) -> Generator[None, None, int]:
+        """Skip whitespace and return the next byte without consuming it."""
+        while True:
+            self._advance(_WHITESPACE.match(self._buf, self._pos).end(), None)
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not (yield from self._more()):
+                raise ValueError("Unexpected end of JSON document")
+
+    def _expect(self, *expected: int) -> Generator[None, None, int]:
+        """Consume the next structural byte, which must be one of expected."""
+        byte = yield from self._peek()
+        if byte not in expected:
+            raise ValueError(
+                f"Unexpected {chr(byte)!r} in JSON document, "
+                f"expected one of {''.join(chr(b) for b in expected)!r}"
+            )
+        self._advance(self._pos + 1, None)
+        return byte
+
+    def _scan_string(self, sink: Optional[_Sink]) -> _Parse:
+        """Consume a string, starting at its opening quote."""
+        self._advance(self._pos + 1, sink)
+        while True:
+            self._advance(_STRING_CHUNK.match(self._buf, self._pos).end(), sink)
+            if self._pos < len(self._buf):
+                if self._buf[self._pos] == _QUOTE:
+                    self._advance(self._pos + 1, sink)
+                    return
+                # A backslash escapes the next byte, which may not be here yet
+                if self._pos + 1 < len(self._buf):
+                    self._advance(self._pos + 2, sink)
+                    continue
+            if not (yield from self._more()):
+                raise ValueError("Unterminated string in JSON document")
+
+    def _scan_scalar(self, sink: Optional[_Sink]) -> _Parse:
+        """Consume a number, true, false or null."""
+        while True:
+            match = _SCALAR_END.search(self._buf, self._pos)
+            if match is not None:
+                self._advance(match.start(), sink)
+                return
+            self._advance(len(self._buf), sink)
+            if not (yield from self._more()):
+                return
+
+    def _scan_value(self, sink: Optional[_Sink]) -> _Parse:
+        """Consume a whole value without decoding it."""
+        byte = yield from self._peek()
+        if byte == _QUOTE:
+            yield from self._scan_string(sink)
+            return
+        if byte not in (_LBRACE, _LBRACKET):
+            yield from self._scan_scalar(sink)
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buf, self._pos)
+            if match is None:
+                self._advance(len(self._buf), sink)
+                if not (yield from self._more()):
+                    raise ValueError("Unexpected end of JSON document")
+                continue
+
+            self._advance(match.start(), sink)
+            byte = self._buf[self._pos]
+            if byte == _QUOTE:
+                yield from self._scan_string(sink)
+                continue
+
+            self._advance(self._pos + 1, sink)
+            depth += 1 if byte in (_LBRACE, _LBRACKET) else -1
+            if depth == 0:
+                return
+
+    def _parse_value(self, path: Path) -> _Parse:
+        """Parse a value that is kept or contains kept fields."""
+        if self._mode(path) == _DESCEND:
+            byte = yield from self._peek()
+            if byte == _LBRACE:
+                return (yield from self._parse_object(path))
+            if byte == _LBRACKET:
+                return (yield from self._parse_array(path))
+
+        sink = _Sink(self.spill_threshold)
+        yield from self._scan_value(sink)
+        value = sink.result(self.loads)
+        if isinstance(value, SpilledField):
+            self.stats["spilled_fields"] += 1
+        return value
+
+    def _parse_object(self, path: Path) -> _Parse:
+        """Parse an object, keeping only projected keys."""
+        yield from self._expect(_LBRACE)
+        result: Dict[str, Any] = {}
+        if (yield from self._peek()) == _RBRACE:
+            self._advance(self._pos + 1, None)
+            return result
+
+        while True:
+            if (yield from self._peek()) != _QUOTE:
+                raise ValueError("Expected a key in JSON object")
+            key_sink = _Sink()
+            yield from self._scan_string(key_sink)
+            key = key_sink.result(json.loads)
+            yield from self._expect(_COLON)
+
+            child = path + (key,)
+            if self._mode(child) == _SKIP:
+                self.stats["skipped_fields"] += 1
+                yield from self._scan_value(None)
+            else:
+                result[key] = yield from self._parse_value(child)
+
+            if (yield from self._expect(_COMMA, _RBRACE)) == _RBRACE:
+                return result
+
+    def _parse_array(self, path: Path) -> _Parse:
+        """Parse an array, projecting each item with the array's path."""
+        yield from self._expect(_LBRACKET)
+        result = []
+        if (yield from self._peek()) == _RBRACKET:
+            self._advance(self._pos + 1, None)
+            return result
+
+        while True:
+            result.append((yield from self._parse_value(path)))
+            if (yield from self._expect(_COMMA, _RBRACKET)) == _RBRACKET:
+                return result
+
+    def _parse_document(self) -> _Parse:
+        """Parse the whole body."""
+        # Wait for the first chunk before parsing
+        yield
+        value = yield from self._parse_value(())
+
+        while True:
+            self._advance(_WHITESPACE.match(self._buf, self._pos).end(), None)
+            if self._pos < len(self._buf):
+                raise ValueError("Extra data after JSON document")
+            if not (yield from self._more()):
+                return value
@@ -0,0 +1,447 @@
+"""
+Jobs module for Swarms API client.
+
+This module runs bulk agent and swarm workloads as durable jobs. Every item
+of a job, its state and its result are recorded in a SQLite database as the
+job runs, so a job that was interrupted resumes where it stopped instead of
+paying again for the items that already completed.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from loguru import logger
+
+from .batching import BatchItem
+from .codec import JSONCodec, get_codec
+from .config import SwarmsConfig
+from .exceptions import SwarmsError
+from .responses import LazyResult
+
+if TYPE_CHECKING:
+    from .client import SwarmsClient
+
+# States of a job item
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Items inserted per transaction while a job's input is submitted
+SUBMIT_BATCH_SIZE = 1000
+
+# Index, encoded result and encoded error of a finished item
+JobOutcome = Tuple[int, Optional[bytes], Optional[bytes]]
+
+
+class JobStore:
+    """Durable record of bulk jobs and their items in a SQLite database."""
+
+    def __init__(self, path: str, codec: Optional[JSONCodec] = None):
+        """
+        Initialize the job store, creating the database if needed.
+
+        The database runs in WAL mode, and every state change is committed
+        before the call returns, so nothing that completed is lost if the
+        process dies.
+
+        Args:
+            path (str): Database file
+            codec (Optional[JSONCodec]): Codec for item payloads and errors.
+                Defaults to the fastest installed codec.
+        """
+        self.path = path
+        self.codec = codec or get_codec("auto")
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, "
+            "submitted INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "job_id TEXT NOT NULL, idx INTEGER NOT NULL, payload BLOB NOT NULL, "
+            "state TEXT NOT NULL, result BLOB, error BLOB, "
+            "attempts INTEGER NOT NULL DEFAULT 0, updated_at REAL NOT NULL, "
+            "PRIMARY KEY (job_id, idx))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS items_state ON items (job_id, state, idx)"
+        )
+
+        logger.debug(f"Opened job store at {self.path}")
+
+    def open_job(self, job_id: str, kind: str) -> bool:
+        """
+        Create a job, or resume an existing one.
+
+        Items left in flight by an interrupted run are returned to pending.
+
+        Args:
+            job_id (str): Identifier of the job
+            kind (str): "agent" or "swarm"
+
+        Returns:
+            bool: Whether the job already existed
+
+        Raises:
+            SwarmsError: If the job exists with a different kind
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                self._conn.execute(
+                    "INSERT INTO jobs (job_id, kind, created_at) VALUES (?, ?, ?)",
+                    (job_id, kind, time.time()),
+                )
+                return False
+            if row[0] != kind:
+                raise SwarmsError(f"Job {job_id} is a {row[0]} job, not {kind}")
+            cursor = self._conn.execute(
+                "UPDATE items SET state = ?, updated_at = ? "
+                "WHERE job_id = ? AND state = ?",
+                (PENDING, time.time(), job_id, IN_FLIGHT),
+            )
+        if cursor.rowcount:
+            logger.info(f"Returned {cursor.rowcount} in-flight items of {job_id}")
+        return True
+
+    def is_submitted(self, job_id: str) -> bool:
+        """
+        Check whether all items of a job have been submitted.
+
+        Args:
+            job_id (str): Identifier of the job
+
+        Returns:
+            bool: Whether submit finished for the job
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT submitted FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def submit(self, job_id: str, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Record the items of a job as pending, in input order.
+
+        Items already recorded by an earlier, interrupted submit keep their
+        state, so submitting the same input again is safe.
+
+        Args:
+            job_id (str): Identifier of the job
+            items (Iterable[Dict[str, Any]]): Agent or swarm configurations
+
+        Returns:
+            int: Number of items in the job
+        """
+        count = 0
+        rows: List[Tuple[str, int, bytes, str, float]] = []
+        for index, item in enumerate(items):
+            rows.append((job_id, index, self.codec.dumps(item), PENDING, time.time()))
+            count = index + 1
+            if len(rows) >= SUBMIT_BATCH_SIZE:
+                self._insert(rows)
+                rows = []
+        self._insert(rows)
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET submitted = 1 WHERE job_id = ?", (job_id,)
+            )
+        logger.info(f"Submitted {count} items to job {job_id}")
+        return count
+
+    def _insert(self, rows: List[Tuple[str, int, bytes, str, float]]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO items "
+                "(job_id, idx, payload, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+
+    def claim(
+        self, job_id: str, limit: int
+    ) -> List[Tuple[int, Dict[str, Any], int]]:
+        """
+        Mark the next pending items of a job as in flight.
+
+        Args:
+            job_id (str): Identifier of the job
+            limit (int): Maximum number of items to claim
+
+        Returns:
+            List[Tuple[int, Dict[str, Any], int]]: Index, configuration and
+                attempt of each claimed item, empty when no item is pending.
+                The attempt counts retry_failed calls that returned the item.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT idx, payload, attempts FROM items "
+                "WHERE job_id = ? AND state = ? ORDER BY idx LIMIT ?",
+                (job_id, PENDING, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE items SET state = ?, updated_at = ? "
+                "WHERE job_id = ? AND idx = ?",
+                [(IN_FLIGHT, time.time(), job_id, index) for index, _, _ in rows],
+            )
+            self._conn.execute("COMMIT")
+        return [
+            (index, self.codec.loads(payload), attempts)
+            for index, payload, attempts in rows
+        ]
+
+    def complete(self, job_id: str, outcomes: List[JobOutcome]) -> None:
+        """
+        Record the results and errors of finished items.
+
+        Args:
+            job_id (str): Identifier of the job
+            outcomes (List[JobOutcome]): Index, encoded result and encoded
+                error of each finished item
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE items SET state = ?, result = ?, error = ?, updated_at = ? "
+                "WHERE job_id = ? AND idx = ?",
+                [
+                    (
+                        FAILED if error is not None else COMPLETED,
+                        result,
+                        error,
+                        now,
+                        job_id,
+                        index,
+                    )
+                    for index, result, error in outcomes
+                ],
+            )
+            self._conn.execute("COMMIT")
+
+    def retry_failed(self, job_id: str) -> int:
+        """
+        Return the failed items of a job to pending, as their next attempt.
+
+        Items resumed after an interruption keep their attempt, so they are
+        resent with the same idempotency key, while retried items get a new
+        one that a server does not answer with the recorded failure.
+
+        Args:
+            job_id (str): Identifier of the job
+
+        Returns:
+            int: Number of items returned to pending
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE items SET state = ?, error = NULL, "
+                "attempts = attempts + 1, updated_at = ? "
+                "WHERE job_id = ? AND state = ?",
+                (PENDING, time.time(), job_id, FAILED),
+            )
+        return cursor.rowcount
+
+    def results(self, job_id: str) -> Iterator[JobOutcome]:
+        """
+        Iterate over the finished items of a job, in input order.
+
+        Args:
+            job_id (str): Identifier of the job
+
+        Yields:
+            JobOutcome: Index, encoded result and encoded error of each item
+        """
+        last = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT idx, result, error FROM items "
+                    "WHERE job_id = ? AND idx > ? AND state IN (?, ?) "
+                    "ORDER BY idx LIMIT ?",
+                    (job_id, last, COMPLETED, FAILED, SUBMIT_BATCH_SIZE),
+                ).fetchall()
+            if not rows:
+                return
+            yield from rows
+            last = rows[-1][0]
+
+    def progress(self, job_id: str) -> Dict[str, int]:
+        """
+        Count the items of a job by state.
+
+        Args:
+            job_id (str): Identifier of the job
+
+        Returns:
+            Dict[str, int]: Total and per-state item counts
+        """
+        counts = {PENDING: 0, IN_FLIGHT: 0, COMPLETED: 0, FAILED: 0}
+        with self._lock:
+            for state, count in self._conn.execute(
+                "SELECT state, COUNT(*) FROM items WHERE job_id = ? GROUP BY state",
+                (job_id,),
+            ):
+                counts[state] = count
+        return {"total": sum(counts.values()), **counts}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def encode_outcome(codec: JSONCodec, item: BatchItem) -> JobOutcome:
+    """
+    Encode the result or error of a finished batch item for the job store.
+
+    Args:
+        codec (JSONCodec): Codec for results that arrived decoded
+        item (BatchItem): The finished item
+
+    Returns:
+        JobOutcome: Index, encoded result and encoded error of the item
+    """
+    if item.error is not None:
+        error = {"type": type(item.error).__name__, "message": str(item.error)}
+        status_code = getattr(item.error, "status_code", None)
+        if status_code is not None:
+            error["status_code"] = status_code
+        return item.index, None, codec.dumps(error)
+    if isinstance(item.result, LazyResult):
+        return item.index, item.result.raw, None
+    return item.index, codec.dumps(item.result), None
+
+
+async def run_job(
+    client: "SwarmsClient",
+    store: JobStore,
+    job_id: str,
+    kind: str,
+    items: Iterable[Dict[str, Any]],
+    concurrency: int,
+    chunk_size: Optional[int] = None,
+    item_retries: Optional[int] = None,
+) -> AsyncIterator[JobOutcome]:
+    """
+    Run a job's pending items, recording each outcome before yielding it.
+
+    A new job's items are submitted first; a resumed job keeps the items it
+    was submitted with and only runs those not yet finished. Each worker
+    claims one chunk of items at a time and runs it as a batch, and the
+    chunk's outcomes are committed together as soon as it completes. Store
+    operations run in the default executor, off the event loop.
+
+    Args:
+        client (SwarmsClient): Client running the batches
+        store (JobStore): Store recording the job
+        job_id (str): Identifier of the job
+        kind (str): "agent" or "swarm"
+        items (Iterable[Dict[str, Any]]): Agent or swarm configurations, read
+            only if the job's items were not all submitted yet
+        concurrency (int): Chunks run at once
+        chunk_size (Optional[int]): Items per chunk. Defaults to
+            SWARMS_API_BATCH_CHUNK_SIZE.
+        item_retries (Optional[int]): Resubmissions of each failed item.
+            Defaults to SWARMS_API_BATCH_ITEM_RETRIES.
+
+    Yields:
+        JobOutcome: Index, encoded result and encoded error of each item, in
+            completion order
+
+    Raises:
+        SwarmsError: If the job exists with a different kind
+    """
+    chunk_size = chunk_size or SwarmsConfig.get_batch_chunk_size()
+    iterate = (
+        client.async_iter_agent_batch
+        if kind == "agent"
+        else client.async_iter_swarm_batch
+    )
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, store.open_job, job_id, kind)
+    if not await loop.run_in_executor(None, store.is_submitted, job_id):
+        # Reading the input happens in the executor too
+        await loop.run_in_executor(None, store.submit, job_id, items)
+
+    finished: "asyncio.Queue[Optional[List[JobOutcome]]]" = asyncio.Queue()
+
+    async def _worker() -> None:
+        try:
+            while True:
+                claimed = await loop.run_in_executor(
+                    None, store.claim, job_id, chunk_size
+                )
+                if not claimed:
+                    return
+                indices = [index for index, _, _ in claimed]
+                attempt = max(attempts for _, _, attempts in claimed)
+                outcomes = []
+                async for item in iterate(
+                    [config for _, config, _ in claimed],
+                    idempotency_key=f"{job_id}-{indices[0]}-a{attempt}",
+                    chunk_size=chunk_size,
+                    item_retries=item_retries,
+                ):
+                    outcomes.append(
+                        encode_outcome(
+                            client.codec, item._replace(index=indices[item.index])
+                        )
+                    )
+                await loop.run_in_executor(None, store.complete, job_id, outcomes)
+                await finished.put(outcomes)
+        finally:
+            await finished.put(None)
+
+    workers = [asyncio.ensure_future(_worker()) for _ in range(max(1, concurrency))]
+    try:
+        running = len(workers)
+        while running:
+            outcomes = await finished.get()
+            if outcomes is None:
+                running -= 1
+                for worker in workers:
+                    # Raise the error that stopped a worker; the items it
+                    # claimed stay in flight and run again on resume
+                    if worker.done() and not worker.cancelled():
+                        worker.result()
+                continue
+            for outcome in outcomes:
+                yield outcome
+    finally:
+        for worker in workers:
+            worker.cancel()
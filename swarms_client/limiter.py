@@ -0,0 +1,509 @@
+"""
+Concurrency limiter module for Swarms API client.
+
+This module provides limiters that gate the number of requests in flight.
+Besides a fixed limit, it offers AIMD and gradient (Vegas-style) limiters
+that adjust the limit from observed round-trip times and overload signals.
+"""
+
+import asyncio
+import collections
+import math
+import threading
+import time
+from typing import Any, Deque, Dict, Optional, Union
+
+import aiohttp
+import requests
+from loguru import logger
+
+from .config import SwarmsConfig
+
+# HTTP status codes signalling that the server is overloaded
+OVERLOAD_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def is_overload_error(exception: BaseException) -> Optional[bool]:
+    """
+    Classify an exception as an overload signal for limit adjustment.
+
+    Args:
+        exception (BaseException): The exception raised by a request
+
+    Returns:
+        Optional[bool]: True for overload (429, 5xx, timeouts, connection
+            failures), False for other HTTP errors, None if the exception
+            says nothing about server load (e.g. cancellation)
+    """
+    status = getattr(exception, "status", None) or getattr(
+        exception, "status_code", None
+    )
+    if isinstance(status, int):
+        return status in OVERLOAD_STATUS_CODES
+
+    if isinstance(
+        exception,
+        (
+            asyncio.TimeoutError,
+            TimeoutError,
+            ConnectionError,
+            aiohttp.ClientConnectionError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ),
+    ):
+        return True
+
+    return None
+
+
+class _SyncWaiter:
+    """A thread blocked waiting for a limiter slot."""
+
+    __slots__ = ("event",)
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def done(self) -> bool:
+        return self.event.is_set()
+
+
+class _Permit:
+    """Context manager holding one limiter slot, usable with or without async."""
+
+    def __init__(self, limiter: "ConcurrencyLimiter", sample: bool):
+        self.limiter = limiter
+        self.sample = sample
+        self.start_time = 0.0
+
+    async def __aenter__(self) -> "_Permit":
+        await self.limiter._acquire()
+        self.start_time = time.monotonic()
+        return self
+
+    def __enter__(self) -> "_Permit":
+        self.limiter._acquire_sync()
+        self.start_time = time.monotonic()
+        return self
+
+    def restart_timer(self) -> None:
+        """Start the round-trip timer now, excluding time spent so far."""
+        self.start_time = time.monotonic()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._exit(exc_val)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._exit(exc_val)
+
+    def _exit(self, exc_val: Optional[BaseException]) -> None:
+        rtt = time.monotonic() - self.start_time
+        self.limiter._release()
+
+        if exc_val is None:
+            if self.sample:
+                self.limiter.record(rtt, dropped=False)
+        else:
+            overload = is_overload_error(exc_val)
+            if overload is not None:
+                self.limiter.record(rtt, dropped=overload)
+
+        # The limit may have grown, letting more waiters through
+        self.limiter._wake_waiters()
+
+
+class ConcurrencyLimiter:
+    """Fixed concurrency limiter and base class for adaptive limiters."""
+
+    def __init__(
+        self,
+        initial_limit: int = SwarmsConfig.DEFAULT_MAX_CONCURRENT_REQUESTS,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit (int): Starting number of requests allowed in flight
+            min_limit (int): Lower bound for the limit
+            max_limit (Optional[int]): Upper bound for the limit, defaults to
+                the initial limit
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(max_limit or initial_limit, self.min_limit)
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[Union["asyncio.Future[None]", _SyncWaiter]] = (
+            collections.deque()
+        )
+        self._lock = threading.Lock()
+
+        # Guards slots and waiters, which may belong to several event loops
+        self._slots_lock = threading.Lock()
+
+        # Track limiter statistics
+        self.stats: Dict[str, float] = {
+            "acquired": 0,
+            "queued": 0,
+            "dropped": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def average_wait_time(self) -> float:
+        """Average time in seconds requests waited for a slot."""
+        if not self.stats["acquired"]:
+            return 0.0
+        return self.stats["total_wait_time"] / self.stats["acquired"]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the limiter's state.
+
+        Returns:
+            Dict[str, Any]: Limit, in-flight count, queue depth and wait times
+        """
+        return {
+            "type": type(self).__name__,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "average_wait_time": self.average_wait_time,
+            **self.stats,
+        }
+
+    def acquire(self, sample: bool = True) -> _Permit:
+        """
+        Get a context manager holding a slot for one request.
+
+        Use it with ``async with`` on an event loop, or with ``with`` from
+        sync code, which blocks the calling thread until a slot is free.
+        Both share the same slots and queue, so one limit holds across sync
+        and async callers.
+
+        Args:
+            sample (bool): Whether the request's round-trip time should be
+                used to adjust the limit. Long-lived requests such as
+                streams should pass False.
+
+        Returns:
+            _Permit: Context manager for the slot
+        """
+        return _Permit(self, sample)
+
+    def record(self, rtt: float, dropped: bool) -> None:
+        """
+        Record the outcome of a request and adjust the limit.
+
+        Safe to call from any thread.
+
+        Args:
+            rtt (float): Round-trip time of the request in seconds
+            dropped (bool): Whether the request hit an overload signal
+        """
+        with self._lock:
+            old_limit = self.limit
+            if dropped:
+                self.stats["dropped"] += 1
+            self._update(rtt, dropped)
+            self._limit = min(max(self._limit, self.min_limit), self.max_limit)
+            new_limit = self.limit
+
+        if new_limit != old_limit:
+            logger.debug(f"Concurrency limit changed from {old_limit} to {new_limit}")
+
+    def _update(self, rtt: float, dropped: bool) -> None:
+        """Adjust self._limit from a sample. Fixed limiters never change."""
+        pass
+
+    async def _acquire(self) -> None:
+        """Wait until a slot is free and take it."""
+        start_time = time.monotonic()
+
+        future = None
+        with self._slots_lock:
+            if self._in_flight >= self.limit or self._waiters:
+                self.stats["queued"] += 1
+                future = asyncio.get_running_loop().create_future()
+                self._waiters.append(future)
+            else:
+                self._in_flight += 1
+
+        if future is not None:
+            try:
+                await future
+            except asyncio.CancelledError:
+                handed_over = False
+                with self._slots_lock:
+                    if future.done() and not future.cancelled():
+                        # The slot was handed over just before cancellation
+                        handed_over = True
+                    elif future in self._waiters:
+                        self._waiters.remove(future)
+                if handed_over:
+                    self._release()
+                raise
+
+        wait_time = time.monotonic() - start_time
+        self._record_wait(wait_time)
+
+    def _acquire_sync(self) -> None:
+        """Block the calling thread until a slot is free and take it."""
+        start_time = time.monotonic()
+
+        try:
+            asyncio.get_running_loop()
+            in_loop = True
+        except RuntimeError:
+            in_loop = False
+
+        waiter = None
+        with self._slots_lock:
+            if in_loop:
+                # Blocking here could wait forever on slots held by tasks of
+                # this thread's own loop, so a sync call made from a loop
+                # takes a slot over the limit instead
+                self._in_flight += 1
+            elif self._in_flight >= self.limit or self._waiters:
+                self.stats["queued"] += 1
+                waiter = _SyncWaiter()
+                self._waiters.append(waiter)
+            else:
+                self._in_flight += 1
+
+        if waiter is not None:
+            try:
+                waiter.event.wait()
+            except BaseException:
+                # Interrupted, e.g. by KeyboardInterrupt
+                handed_over = False
+                with self._slots_lock:
+                    if waiter.done():
+                        handed_over = True
+                    elif waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                if handed_over:
+                    self._release()
+                raise
+
+        self._record_wait(time.monotonic() - start_time)
+
+    def _record_wait(self, wait_time: float) -> None:
+        with self._lock:
+            self.stats["acquired"] += 1
+            self.stats["total_wait_time"] += wait_time
+            self.stats["max_wait_time"] = max(self.stats["max_wait_time"], wait_time)
+
+    def _release(self) -> None:
+        """Give a slot back and hand it to the next waiter."""
+        with self._slots_lock:
+            self._in_flight -= 1
+        self._wake_waiters()
+
+    def _hand_over(self, future: "asyncio.Future[None]") -> None:
+        """Pass a slot to a waiter on its own loop, or give it back."""
+        if future.done():
+            self._release()
+        else:
+            future.set_result(None)
+
+    def _wake_waiters(self) -> None:
+        """
+        Hand free slots to waiters in FIFO order.
+
+        Waiters on another event loop are woken through that loop, and
+        blocked threads directly, so one limit holds across all loops and
+        threads using the limiter.
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        handoffs = []
+        with self._slots_lock:
+            while self._waiters and self._in_flight < self.limit:
+                future = self._waiters.popleft()
+                if future.done():
+                    continue
+                self._in_flight += 1
+                if isinstance(future, _SyncWaiter):
+                    future.event.set()
+                elif future.get_loop() is running_loop:
+                    future.set_result(None)
+                else:
+                    handoffs.append(future)
+
+        for future in handoffs:
+            try:
+                future.get_loop().call_soon_threadsafe(self._hand_over, future)
+            except RuntimeError:
+                # The waiter's loop has closed
+                self._release()
+
+
+class AIMDLimiter(ConcurrencyLimiter):
+    """Additive-increase, multiplicative-decrease concurrency limiter."""
+
+    def __init__(
+        self,
+        initial_limit: int = SwarmsConfig.DEFAULT_MAX_CONCURRENT_REQUESTS,
+        min_limit: int = 1,
+        max_limit: int = SwarmsConfig.DEFAULT_MAX_ADAPTIVE_CONCURRENCY,
+        backoff_ratio: float = 0.9,
+        latency_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize the AIMD limiter.
+
+        The limit grows by one per limit's worth of successful requests while
+        the limit is being used, and is multiplied by backoff_ratio on 429s,
+        5xx responses, timeouts and connection failures.
+
+        Args:
+            initial_limit (int): Starting number of requests allowed in flight
+            min_limit (int): Lower bound for the limit
+            max_limit (int): Upper bound for the limit
+            backoff_ratio (float): Factor applied to the limit on overload
+            latency_threshold (Optional[float]): Round-trip time in seconds
+                above which a successful request also counts as overload
+        """
+        super().__init__(initial_limit, min_limit, max_limit)
+        self.backoff_ratio = backoff_ratio
+        self.latency_threshold = latency_threshold
+
+    def _update(self, rtt: float, dropped: bool) -> None:
+        """Apply additive increase or multiplicative decrease."""
+        if dropped or (
+            self.latency_threshold is not None and rtt > self.latency_threshold
+        ):
+            self._limit *= self.backoff_ratio
+        elif self._in_flight * 2 >= self._limit:
+            self._limit += 1.0 / self._limit
+
+
+class GradientLimiter(ConcurrencyLimiter):
+    """Vegas-style limiter driven by the gradient of round-trip times."""
+
+    def __init__(
+        self,
+        initial_limit: int = SwarmsConfig.DEFAULT_MAX_CONCURRENT_REQUESTS,
+        min_limit: int = 1,
+        max_limit: int = SwarmsConfig.DEFAULT_MAX_ADAPTIVE_CONCURRENCY,
+        smoothing: float = 0.2,
+        rtt_tolerance: float = 1.5,
+        long_window: int = 600,
+        backoff_ratio: float = 0.9,
+    ):
+        """
+        Initialize the gradient limiter.
+
+        A short-term average of round-trip times is compared with a long-term
+        baseline. While they match the limit grows by about sqrt(limit); as
+        short-term latency rises above the baseline the limit shrinks in
+        proportion. Overload errors shrink the limit by backoff_ratio.
+
+        Args:
+            initial_limit (int): Starting number of requests allowed in flight
+            min_limit (int): Lower bound for the limit
+            max_limit (int): Upper bound for the limit
+            smoothing (float): Weight of each new limit estimate
+            rtt_tolerance (float): Ratio of short to long RTT tolerated before
+                the limit shrinks
+            long_window (int): Number of samples in the long-term RTT average
+            backoff_ratio (float): Factor applied to the limit on overload
+        """
+        super().__init__(initial_limit, min_limit, max_limit)
+        self.smoothing = smoothing
+        self.rtt_tolerance = rtt_tolerance
+        self.long_window = long_window
+        self.backoff_ratio = backoff_ratio
+        self._short_rtt: Optional[float] = None
+        self._long_rtt: Optional[float] = None
+
+    def _update(self, rtt: float, dropped: bool) -> None:
+        """Move the limit towards the RTT-gradient estimate."""
+        if dropped:
+            self._limit *= self.backoff_ratio
+            return
+
+        if self._short_rtt is None or self._long_rtt is None:
+            self._short_rtt = self._long_rtt = rtt
+            return
+
+        self._short_rtt += 0.5 * (rtt - self._short_rtt)
+        self._long_rtt += (rtt - self._long_rtt) / self.long_window
+
+        # Let the baseline recover quickly after a latency spike has passed
+        if self._long_rtt / max(self._short_rtt, 1e-9) > 2:
+            self._long_rtt *= 0.95
+
+        # Do not grow the limit while it is not being used
+        if self._in_flight * 2 < self._limit:
+            return
+
+        gradient = max(
+            0.5,
+            min(1.0, self.rtt_tolerance * self._long_rtt / max(self._short_rtt, 1e-9)),
+        )
+        estimate = self._limit * gradient + math.sqrt(self._limit)
+        self._limit = self._limit * (1 - self.smoothing) + estimate * self.smoothing
+
+
+def create_limiter(
+    limiter: Union[str, ConcurrencyLimiter, None],
+    max_concurrent_requests: int,
+) -> ConcurrencyLimiter:
+    """
+    Build a concurrency limiter from a name or return the given instance.
+
+    Args:
+        limiter (Union[str, ConcurrencyLimiter, None]): "fixed", "aimd",
+            "gradient", a limiter instance, or None for the configured default
+        max_concurrent_requests (int): Fixed limit, or starting limit for
+            adaptive limiters
+
+    Returns:
+        ConcurrencyLimiter: The limiter
+
+    Raises:
+        ValueError: If the limiter name is unknown
+    """
+    if isinstance(limiter, ConcurrencyLimiter):
+        return limiter
+
+    name = (limiter or SwarmsConfig.get_concurrency_limiter()).lower()
+    max_limit = max(
+        SwarmsConfig.get_max_adaptive_concurrency(), max_concurrent_requests
+    )
+
+    if name == "fixed":
+        return ConcurrencyLimiter(initial_limit=max_concurrent_requests)
+    if name == "aimd":
+        return AIMDLimiter(initial_limit=max_concurrent_requests, max_limit=max_limit)
+    if name == "gradient":
+        return GradientLimiter(
+            initial_limit=max_concurrent_requests, max_limit=max_limit
+        )
+
+    raise ValueError(
+        f"Unknown concurrency limiter '{name}'. Use 'fixed', 'aimd' or 'gradient'."
+    )
@@ -0,0 +1,130 @@
+"""
+Event loop module for Swarms API client.
+
+This module keeps resources that are bound to an event loop, such as sessions,
+connectors and tables of in-flight futures, separately for each running loop,
+so one client can be used from several loops: per-thread loops, worker
+processes or test frameworks creating a loop per test.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """A value per event loop, created on first use in each loop."""
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        on_discard: Optional[Callable[[T], None]] = None,
+    ):
+        """
+        Initialize the loop-local value.
+
+        Values are held weakly by loop, and the values of loops that have
+        closed are discarded on the next access from any loop.
+
+        Args:
+            factory (Callable[[], T]): Creates the value, called in the loop
+            on_discard (Optional[Callable[[T], None]]): Called with the value
+                of a closed loop when it is discarded
+        """
+        self.factory = factory
+        self.on_discard = on_discard
+        self._values: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _prune(self) -> List[T]:
+        """Remove the values of closed loops. Call with the lock held."""
+        discarded = []
+        for loop in list(self._values.keys()):
+            if loop.is_closed():
+                discarded.append(self._values.pop(loop))
+        return discarded
+
+    def _discard(self, values: List[T]) -> None:
+        if values:
+            logger.debug(f"Discarding {len(values)} resources of closed event loops")
+        if self.on_discard is not None:
+            for value in values:
+                self.on_discard(value)
+
+    def get(self) -> T:
+        """
+        Get the running loop's value, creating it if needed.
+
+        Returns:
+            T: The value
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            value = self._values.get(loop)
+            if value is None:
+                value = self._values[loop] = self.factory()
+            discarded = self._prune()
+        self._discard(discarded)
+        return value
+
+    def peek(self) -> Optional[T]:
+        """
+        Get the running loop's value without creating it.
+
+        Returns:
+            Optional[T]: The value, or None outside a loop or if not created
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        return self._values.get(loop)
+
+    def pop(self) -> Optional[T]:
+        """
+        Remove the running loop's value.
+
+        Returns:
+            Optional[T]: The removed value, or None if there was none
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        with self._lock:
+            return self._values.pop(loop, None)
+
+    def items(self) -> List[Tuple[asyncio.AbstractEventLoop, T]]:
+        """
+        Get the values of all loops that are still open.
+
+        Returns:
+            List[Tuple[asyncio.AbstractEventLoop, T]]: Loops and their values
+        """
+        with self._lock:
+            discarded = self._prune()
+            items = list(self._values.items())
+        self._discard(discarded)
+        return items
+
+    def values(self) -> List[T]:
+        """
+        Get the values of all loops that are still open.
+
+        Returns:
+            List[T]: The values
+        """
+        return [value for _, value in self.items()]
@@ -65,6 +65,9 @@ class AgentCompletion(BaseModel):
         ..., description="The configuration of the agent to be completed."
     )
     task: str = Field(..., description="The task to be completed by the agent.")
+    stream: Optional[bool] = Field(
+        None, description="Whether the agent should stream its output."
+    )
 
     class Config:
         arbitrary_types_allowed = True
@@ -136,3 +139,22 @@ class SwarmSpec(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+
+
+class StreamEvent(BaseModel):
+    """A single event received from a streaming completion."""
+
+    event: str = Field(
+        "message", description="The type of the event as sent by the server."
+    )
+    agent_name: Optional[str] = Field(
+        None, description="The name of the agent that produced the event."
+    )
+    step: Optional[int] = Field(
+        None, description="The execution step or loop the event belongs to."
+    )
+    delta: str = Field("", description="The token delta carried by the event, if any.")
+    id: Optional[str] = Field(None, description="The server-assigned event id.")
+    data: Dict[str, Any] = Field(
+        default_factory=dict, description="The raw decoded event payload."
+    )
@@ -0,0 +1,179 @@
+"""
+Connection pool module for Swarms API client.
+
+This module provides the connection pool of the sync client: one pool of
+keep-alive connections per client, shared by all threads, with statistics on
+how often connections are opened and reused.
+"""
+
+import collections
+import threading
+import time
+from typing import Any, Deque, Dict, List
+
+import requests
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Window in seconds over which connection rates are reported
+POOL_STATS_WINDOW = 10.0
+
+
+class SyncConnectionPool:
+    """Per-client pool of keep-alive connections shared across threads."""
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        pool_size: int,
+        max_retries: int = 0,
+    ):
+        """
+        Initialize the pool.
+
+        Each thread gets its own lightweight session carrying the client's
+        headers, and every session sends through the same adapter, whose
+        thread-safe urllib3 pool holds the connections. When all pool_size
+        connections are in use, further requests wait for one to be released
+        instead of opening and discarding extra connections.
+
+        Args:
+            headers (Dict[str, str]): Headers sent with every request
+            pool_size (int): Maximum connections per host, usually the
+                client's concurrency limit
+            max_retries (int): Connection-level retries of the adapter
+        """
+        self.headers = dict(headers)
+        self.pool_size = pool_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._buckets: Deque[List[int]] = collections.deque()
+
+        # Track pool statistics
+        self.stats: Dict[str, int] = {
+            "sessions": 0,
+            "checkouts": 0,
+            "returns": 0,
+            "connections_created": 0,
+        }
+
+        self.adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=max_retries,
+            pool_block=True,
+        )
+        self.adapter.poolmanager.pool_classes_by_scheme = {
+            "http": self._counting_pool(HTTPConnectionPool, HTTPConnection),
+            "https": self._counting_pool(HTTPSConnectionPool, HTTPSConnection),
+        }
+
+    def _counting_pool(self, pool_cls: type, connection_cls: type) -> type:
+        """Subclass a urllib3 pool class to count connections for this pool."""
+        pool = self
+
+        class CountingConnection(connection_cls):
+            def connect(self) -> None:
+                super().connect()
+                pool._record_connect()
+
+        class CountingPool(pool_cls):
+            ConnectionCls = CountingConnection
+
+            def _get_conn(self, timeout=None):
+                conn = super()._get_conn(timeout)
+                pool._record("checkouts")
+                return conn
+
+            def _put_conn(self, conn) -> None:
+                pool._record("returns")
+                super()._put_conn(conn)
+
+        return CountingPool
+
+    def _bucket(self, now: float) -> List[int]:
+        """Get the bucket of the current second as [second, connects, checkouts]."""
+        second = int(now)
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        while self._buckets[0][0] <= now - POOL_STATS_WINDOW:
+            self._buckets.popleft()
+        return self._buckets[-1]
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+            if name == "checkouts":
+                self._bucket(time.monotonic())[2] += 1
+
+    def _record_connect(self) -> None:
+        with self._lock:
+            self.stats["connections_created"] += 1
+            self._bucket(time.monotonic())[1] += 1
+
+    def session(self) -> requests.Session:
+        """
+        Get the calling thread's session for this pool.
+
+        Returns:
+            requests.Session: Session sending through the shared adapter
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._local.session = session
+            with self._lock:
+                self.stats["sessions"] += 1
+        return session
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the pool's state.
+
+        Returns:
+            Dict[str, Any]: Connections open, in use and idle, connections
+                created and reused in total and per second over the last
+                POOL_STATS_WINDOW seconds, and counters
+        """
+        idle = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            host_pool = pools.get(key)
+            if host_pool is None or host_pool.pool is None:
+                continue
+            idle += sum(
+                1
+                for conn in list(host_pool.pool.queue)
+                if conn is not None and getattr(conn, "sock", None) is not None
+            )
+
+        with self._lock:
+            now = time.monotonic()
+            self._bucket(now)
+            window = min(POOL_STATS_WINDOW, max(now - self._buckets[0][0], 1.0))
+            connects = sum(bucket[1] for bucket in self._buckets)
+            checkouts = sum(bucket[2] for bucket in self._buckets)
+            in_use = self.stats["checkouts"] - self.stats["returns"]
+            return {
+                "pool_size": self.pool_size,
+                "connections_open": in_use + idle,
+                "connections_in_use": in_use,
+                "connections_idle": idle,
+                "connections_reused": max(
+                    self.stats["checkouts"] - self.stats["connections_created"], 0
+                ),
+                "created_per_second": connects / window,
+                "reused_per_second": max(checkouts - connects, 0) / window,
+                **self.stats,
+            }
+
+    def close(self) -> None:
+        """
+        Close every pooled connection, for all threads.
+
+        The pool stays usable and opens new connections on the next request.
+        """
+        self.adapter.close()
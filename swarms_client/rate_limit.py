@@ -0,0 +1,248 @@
+"""
+Rate limiting module for Swarms API client.
+
+This module provides a client-wide token bucket that follows the rate limits
+advertised by the server through ``Retry-After`` and ``X-RateLimit-*`` headers.
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+from loguru import logger
+
+from .config import SwarmsConfig
+
+# Header prefixes carrying rate limit information, legacy and IETF draft style
+RATE_LIMIT_HEADER_PREFIXES = ("X-RateLimit-", "RateLimit-")
+
+# X-RateLimit-Reset values above this are epoch timestamps, not delays
+EPOCH_THRESHOLD = 1_000_000_000
+
+# Longest sleep between checks, so waiters notice rate updates promptly
+MAX_POLL_INTERVAL = 0.25
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (Optional[str]): Delay in seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> Optional[float]:
+    """Read a numeric rate limit header under any supported prefix."""
+    for prefix in RATE_LIMIT_HEADER_PREFIXES:
+        value = headers.get(prefix + name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+class RateLimiter:
+    """Client-wide token bucket that follows server rate limit headers."""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        default_pause: float = SwarmsConfig.DEFAULT_RATE_LIMIT_PAUSE,
+        probe_timeout: float = SwarmsConfig.DEFAULT_RATE_LIMIT_PROBE_TIMEOUT,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Until the server advertises a limit, requests are only throttled by
+        the optional client-side rate.
+
+        When a pause ends, a single probe request is let through and every
+        other request waits until a response that is not a 429 arrives,
+        so queued requests are not all released into the next 429.
+
+        Args:
+            rate (Optional[float]): Requests per second, None for unlimited
+            burst (Optional[int]): Maximum burst of requests, defaults to one
+                second's worth of rate
+            default_pause (float): Pause in seconds after a 429 response that
+                carries no timing headers
+            probe_timeout (float): Seconds to wait for the probe's response
+                before another probe is sent
+        """
+        self.rate = rate
+        self.burst = float(burst or max(rate or 1.0, 1.0))
+        self.default_pause = default_pause
+        self.probe_timeout = probe_timeout
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._probing = False
+        self._probe_sent_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+        # Track rate limiting statistics
+        self.stats: Dict[str, float] = {
+            "throttled": 0,
+            "pauses": 0,
+            "probes": 0,
+            "total_wait_time": 0.0,
+        }
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds left until requests may be sent again after a 429."""
+        return max(self._paused_until - time.monotonic(), 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the rate limiter's state.
+
+        Returns:
+            Dict[str, Any]: Current rate, burst, pause and statistics
+        """
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "paused_for": self.paused_for,
+            "probing": self._probing,
+            **self.stats,
+        }
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        start_time = time.monotonic()
+        wait = self._try_take()
+        if wait <= 0:
+            return
+
+        while wait > 0:
+            await asyncio.sleep(min(wait, MAX_POLL_INTERVAL))
+            wait = self._try_take()
+        self._record_wait(time.monotonic() - start_time)
+
+    def acquire_sync(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        start_time = time.monotonic()
+        wait = self._try_take()
+        if wait <= 0:
+            return
+
+        while wait > 0:
+            time.sleep(min(wait, MAX_POLL_INTERVAL))
+            wait = self._try_take()
+        self._record_wait(time.monotonic() - start_time)
+
+    def _try_take(self) -> float:
+        """Take a token if one is available, else return the time until one is."""
+        with self._lock:
+            now = time.monotonic()
+            if self._paused_until > now:
+                return self._paused_until - now
+
+            if self._probing:
+                # Half-open: one request at a time tests the new window
+                if (
+                    self._probe_sent_at is None
+                    or now - self._probe_sent_at >= self.probe_timeout
+                ):
+                    self._probe_sent_at = now
+                    self.stats["probes"] += 1
+                    return 0.0
+                return self.probe_timeout - (now - self._probe_sent_at)
+
+            if not self.rate:
+                return 0.0
+
+            # Tokens do not accumulate while paused
+            refill_from = max(self._updated, self._paused_until)
+            self._tokens = min(
+                self.burst, self._tokens + (now - refill_from) * self.rate
+            )
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            return (1 - self._tokens) / self.rate
+
+    def _record_wait(self, wait_time: float) -> None:
+        """Record time a request spent throttled."""
+        with self._lock:
+            self.stats["throttled"] += 1
+            self.stats["total_wait_time"] += wait_time
+
+    def update(self, status: int, headers: Optional[Mapping[str, str]]) -> None:
+        """
+        Update the limiter from a response's status and headers.
+
+        A 429, or a response reporting no remaining quota, pauses every
+        request until the server's reset time. Whenever the server reports
+        its remaining quota and reset time, the rate is set to spread that
+        quota over the rest of the window.
+
+        Args:
+            status (int): HTTP status code of the response
+            headers (Optional[Mapping[str, str]]): Response headers
+        """
+        headers = headers or {}
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        limit = _get_header(headers, "Limit")
+        remaining = _get_header(headers, "Remaining")
+        reset = _get_header(headers, "Reset")
+
+        if reset is not None and reset > EPOCH_THRESHOLD:
+            reset = max(reset - time.time(), 0.0)
+
+        with self._lock:
+            if reset and remaining is not None:
+                self.rate = max(remaining, 1.0) / reset
+                self.burst = max(min(remaining, limit or remaining), 1.0)
+                self._tokens = min(self._tokens, self.burst)
+
+            if status == 429 or remaining == 0:
+                pause = retry_after if retry_after is not None else reset
+                if pause is None:
+                    pause = self.default_pause
+                self._pause(pause)
+            elif self._probing and self._probe_sent_at is not None:
+                # The server accepts requests again
+                self._probing = False
+                self._probe_sent_at = None
+
+    def _pause(self, seconds: float) -> None:
+        """Hold every request until the given number of seconds has passed."""
+        paused_until = time.monotonic() + seconds
+        if paused_until > self._paused_until:
+            self._paused_until = paused_until
+            # Let one probe through after the pause to pick up the new window,
+            # then refill from an empty bucket
+            self._probing = True
+            self._probe_sent_at = None
+            self._tokens = 0.0
+            self.stats["pauses"] += 1
+            logger.warning(f"Rate limit reached, pausing requests for {seconds:.2f}s")
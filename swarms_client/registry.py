@@ -0,0 +1,256 @@
+"""
+Agent registry module for Swarms API client.
+
+This module keeps agent definitions that are validated and serialized once,
+so running a registered agent only encodes the task and any overrides and
+splices them into the cached JSON fragment.
+"""
+
+import json
+import threading
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+
+import pydantic
+from pydantic import TypeAdapter
+
+from .exceptions import ValidationError
+from .models import AgentCompletion, AgentSpec
+
+_FIELD_ADAPTERS: Dict[str, TypeAdapter] = {}
+
+
+def _get_adapter(field: str) -> TypeAdapter:
+    """Get the validator and serializer for one AgentSpec field."""
+    adapter = _FIELD_ADAPTERS.get(field)
+    if adapter is None:
+        if field not in AgentSpec.model_fields:
+            raise ValidationError(f"Unknown agent field '{field}'")
+        adapter = _FIELD_ADAPTERS[field] = TypeAdapter(
+            AgentSpec.model_fields[field].annotation
+        )
+    return adapter
+
+
+def _encode_field(field: str, value: Any) -> bytes:
+    """Encode one field as a JSON object member."""
+    return json.dumps(field).encode() + b":" + _get_adapter(field).dump_json(value)
+
+
+class AgentHandle:
+    """A registered agent whose spec is validated and encoded once."""
+
+    __slots__ = ("name", "spec", "fragment", "_fields")
+
+    def __init__(self, name: str, spec: AgentSpec):
+        """
+        Initialize the handle, encoding the spec.
+
+        Args:
+            name (str): Name the agent is registered under
+            spec (AgentSpec): Validated agent spec
+        """
+        self.name = name
+        self.spec = spec
+
+        # Encoded members of the spec, in field order, leaving out None
+        self._fields: Dict[str, bytes] = {
+            field: _encode_field(field, value)
+            for field, value in spec
+            if value is not None
+        }
+        self.fragment = b"{" + b",".join(self._fields.values()) + b"}"
+
+    def __repr__(self) -> str:
+        return f"AgentHandle(name={self.name!r})"
+
+    def validate_overrides(self, overrides: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Validate overrides of the agent's fields, one field at a time.
+
+        Args:
+            overrides (Mapping[str, Any]): New values by field name
+
+        Returns:
+            Dict[str, Any]: The validated values
+
+        Raises:
+            ValidationError: If a field is unknown or a value is invalid
+        """
+        try:
+            return {
+                field: _get_adapter(field).validate_python(value)
+                for field, value in overrides.items()
+            }
+        except pydantic.ValidationError as e:
+            raise ValidationError(f"Invalid override for agent {self.name}: {e}")
+
+    def get(self, field: str, overrides: Optional[Mapping[str, Any]] = None) -> Any:
+        """
+        Get the effective value of a field.
+
+        Args:
+            field (str): Field name
+            overrides (Optional[Mapping[str, Any]]): Overrides of this run
+
+        Returns:
+            Any: The overridden value if there is one, else the spec's
+        """
+        if overrides and field in overrides:
+            return overrides[field]
+        return getattr(self.spec, field)
+
+    def encode(
+        self,
+        task: str,
+        overrides: Optional[Mapping[str, Any]] = None,
+        stream: Optional[bool] = None,
+    ) -> bytes:
+        """
+        Encode an agent completion request.
+
+        Args:
+            task (str): Task for the agent to complete
+            overrides (Optional[Mapping[str, Any]]): Field overrides for this
+                run, e.g. {"temperature": 0}
+            stream (Optional[bool]): Whether the agent should stream its output
+
+        Returns:
+            bytes: The encoded AgentCompletion
+
+        Raises:
+            ValidationError: If an override is invalid
+        """
+        fragment = self.fragment
+        if overrides:
+            fields = dict(self._fields)
+            for field, value in self.validate_overrides(overrides).items():
+                if value is None:
+                    fields.pop(field, None)
+                else:
+                    fields[field] = _encode_field(field, value)
+            fragment = b"{" + b",".join(fields.values()) + b"}"
+
+        body = b'{"agent_config":' + fragment + b',"task":' + json.dumps(task).encode()
+        if stream is not None:
+            body += b',"stream":' + (b"true" if stream else b"false")
+        return body + b"}"
+
+    def to_completion(
+        self, task: str, overrides: Optional[Mapping[str, Any]] = None
+    ) -> AgentCompletion:
+        """
+        Build the AgentCompletion model of a run, without validating it again.
+
+        Args:
+            task (str): Task for the agent to complete
+            overrides (Optional[Mapping[str, Any]]): Field overrides
+
+        Returns:
+            AgentCompletion: The request model, e.g. for the completion cache
+        """
+        spec = self.spec
+        if overrides:
+            spec = spec.model_copy(update=self.validate_overrides(overrides))
+        return AgentCompletion.model_construct(agent_config=spec, task=task)
+
+
+def create_handle(
+    spec: Union[AgentSpec, Dict[str, Any]], name: Optional[str] = None
+) -> AgentHandle:
+    """
+    Validate and encode an agent definition without registering it.
+
+    Args:
+        spec (Union[AgentSpec, Dict[str, Any]]): The agent definition
+        name (Optional[str]): Name of the handle, defaulting to the spec's
+            agent_name
+
+    Returns:
+        AgentHandle: Handle for running the agent
+
+    Raises:
+        ValidationError: If the spec is invalid
+    """
+    try:
+        spec = AgentSpec.model_validate(
+            spec.model_dump() if isinstance(spec, AgentSpec) else spec
+        )
+    except pydantic.ValidationError as e:
+        raise ValidationError(f"Invalid agent spec: {e}")
+    return AgentHandle(name or spec.agent_name or "", spec)
+
+
+class AgentRegistry:
+    """Registered agents by name."""
+
+    def __init__(self):
+        self._handles: Dict[str, AgentHandle] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._handles
+
+    def __iter__(self) -> Iterator[AgentHandle]:
+        return iter(list(self._handles.values()))
+
+    def register(
+        self,
+        spec: Union[AgentSpec, Dict[str, Any]],
+        name: Optional[str] = None,
+    ) -> AgentHandle:
+        """
+        Validate and encode an agent definition once.
+
+        Registering a name again replaces the earlier definition.
+
+        Args:
+            spec (Union[AgentSpec, Dict[str, Any]]): The agent definition
+            name (Optional[str]): Name to register under, defaulting to the
+                spec's agent_name
+
+        Returns:
+            AgentHandle: Handle for running the agent
+
+        Raises:
+            ValidationError: If the spec is invalid or has no name
+        """
+        handle = create_handle(spec, name)
+        if not handle.name:
+            raise ValidationError("A registered agent needs a name or agent_name")
+
+        with self._lock:
+            self._handles[handle.name] = handle
+        return handle
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove a registered agent if present.
+
+        Args:
+            name (str): Registered name
+        """
+        with self._lock:
+            self._handles.pop(name, None)
+
+    def get(self, handle: Union[AgentHandle, str]) -> AgentHandle:
+        """
+        Resolve a handle or registered name.
+
+        Args:
+            handle (Union[AgentHandle, str]): Handle or registered name
+
+        Returns:
+            AgentHandle: The handle
+
+        Raises:
+            KeyError: If no agent is registered under the name
+        """
+        if isinstance(handle, AgentHandle):
+            return handle
+        try:
+            return self._handles[handle]
+        except KeyError:
+            raise KeyError(f"No agent registered as '{handle}'") from None
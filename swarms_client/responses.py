@@ -0,0 +1,235 @@
+"""
+Response objects for Swarms API client.
+
+This module provides typed, slotted response objects that hold the raw JSON
+bytes of a result and decode each field on first access, locating it in the
+raw bytes without decoding the rest, so large numbers of results can be kept
+in memory for aggregation at a fraction of the cost of decoded dicts.
+"""
+
+import json
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from .batching import BATCH_RESULT_KEYS
+from .incremental import find_field, split_array
+
+T = TypeVar("T", bound="LazyResult")
+
+_MISSING = object()
+
+
+class _LazyField:
+    """Descriptor decoding one field of a result on first access."""
+
+    def __init__(self, key: Optional[str] = None):
+        self.key = key
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.key = self.key or name
+        self.slot = f"_{name}"
+
+    def __get__(self, obj: Optional["LazyResult"], owner: type) -> Any:
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot, _MISSING)
+        if value is _MISSING:
+            value = obj.get(self.key)
+            setattr(obj, self.slot, value)
+        return value
+
+
+class LazyResult:
+    """Base class for results decoded lazily from their raw JSON bytes."""
+
+    __slots__ = ("raw", "_loads")
+
+    def __init__(self, raw: bytes, loads: Callable[[bytes], Any] = json.loads):
+        """
+        Initialize the result.
+
+        Args:
+            raw (bytes): The result's raw JSON
+            loads (Callable[[bytes], Any]): Decoder for the raw JSON
+        """
+        self.raw = raw
+        self._loads = loads
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self.raw)} bytes)"
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return find_field(self.raw, key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Decode a single field of the result, skipping over the others.
+
+        Args:
+            key (str): Field name
+            default (Any): Value returned if the field is missing
+
+        Returns:
+            Any: The field's value
+        """
+        span = find_field(self.raw, key)
+        if span is None:
+            return default
+        start, end = span
+        return self._loads(self.raw[start:end])
+
+    def to_dict(self) -> Any:
+        """
+        Decode the whole result, without caching it.
+
+        Returns:
+            Any: The decoded result, usually a dict
+        """
+        return self._loads(self.raw)
+
+
+class AgentResult(LazyResult):
+    """Result of an agent completion."""
+
+    __slots__ = (
+        "_id",
+        "_success",
+        "_name",
+        "_description",
+        "_temperature",
+        "_outputs",
+        "_usage",
+        "_timestamp",
+    )
+
+    id = _LazyField()
+    success = _LazyField()
+    name = _LazyField()
+    description = _LazyField()
+    temperature = _LazyField()
+    outputs = _LazyField()
+    usage = _LazyField()
+    timestamp = _LazyField()
+
+
+class SwarmResult(LazyResult):
+    """Result of a swarm completion."""
+
+    __slots__ = (
+        "_job_id",
+        "_status",
+        "_swarm_name",
+        "_description",
+        "_swarm_type",
+        "_output",
+        "_number_of_agents",
+        "_service_tier",
+        "_execution_time",
+        "_usage",
+    )
+
+    job_id = _LazyField()
+    status = _LazyField()
+    swarm_name = _LazyField()
+    description = _LazyField()
+    swarm_type = _LazyField()
+    output = _LazyField()
+    number_of_agents = _LazyField()
+    service_tier = _LazyField()
+    execution_time = _LazyField()
+    usage = _LazyField()
+
+
+class LogEntry(LazyResult):
+    """Entry of the API request logs."""
+
+    __slots__ = ("_id", "_api_key", "_data", "_created_at")
+
+    id = _LazyField()
+    api_key = _LazyField()
+    data = _LazyField()
+    created_at = _LazyField()
+
+
+class BatchResult(LazyResult, Generic[T]):
+    """List of results held as one raw JSON document."""
+
+    __slots__ = ("item_type", "keys", "_spans")
+
+    def __init__(
+        self,
+        raw: bytes,
+        loads: Callable[[bytes], Any] = json.loads,
+        item_type: Type[T] = LazyResult,
+        keys: Iterable[str] = BATCH_RESULT_KEYS,
+    ):
+        """
+        Initialize the batch.
+
+        The items are located on first access, without being decoded, and
+        each access creates a fresh item sharing nothing with earlier ones,
+        so hold on to an item to reuse its decoded fields.
+
+        Args:
+            raw (bytes): The batch's raw JSON, a list of results or an object
+                holding one
+            loads (Callable[[bytes], Any]): Decoder for the raw JSON
+            item_type (Type[T]): Result class of the items
+            keys (Iterable[str]): Keys an object may hold the list under
+        """
+        super().__init__(raw, loads)
+        self.item_type = item_type
+        self.keys = tuple(keys)
+        self._spans: Optional[List[Tuple[int, int]]] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchResult[{self.item_type.__name__}]"
+            f"({len(self)} items, {len(self.raw)} bytes)"
+        )
+
+    def _get_spans(self) -> List[Tuple[int, int]]:
+        if self._spans is None:
+            self._spans = split_array(self.raw, self.keys)
+        return self._spans
+
+    def _item(self, span: Tuple[int, int]) -> T:
+        start, end = span
+        return self.item_type(self.raw[start:end], self._loads)
+
+    def __len__(self) -> int:
+        return len(self._get_spans())
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        spans = self._get_spans()
+        if isinstance(index, slice):
+            return [self._item(span) for span in spans[index]]
+        return self._item(spans[index])
+
+    def __iter__(self) -> Iterator[T]:
+        for span in self._get_spans():
+            yield self._item(span)
@@ -5,15 +5,133 @@ This module provides retry functionality with exponential backoff for API reques
 """
 
 import asyncio
+import collections
 import random
-from typing import Callable, Optional, Set, TypeVar, Any, Dict
+import threading
+import time
+from typing import (
+    Callable,
+    Deque,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Any,
+    Dict,
+)
+
+import aiohttp
+import requests
 from loguru import logger
 
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    is_circuit_failure,
+    is_circuit_failure_status,
+)
 from .config import SwarmsConfig
+from .exceptions import CircuitOpenError
 
 T = TypeVar("T")
 
 
+class RetryBudget:
+    """Caps retries at a fraction of recent successful requests."""
+
+    def __init__(
+        self,
+        ratio: Optional[float] = None,
+        window: Optional[float] = None,
+        min_retries_per_second: Optional[float] = None,
+    ):
+        """
+        Initialize the retry budget.
+
+        Every successful request deposits ``ratio`` tokens and every retry
+        withdraws one. Tokens older than the window expire, so when most
+        requests fail the budget drains and further retries fail immediately
+        instead of multiplying load on the backend. A small reserve of
+        ``min_retries_per_second`` keeps retries possible at low traffic.
+
+        Args:
+            ratio (Optional[float]): Retries allowed per successful request.
+                Defaults to value from config.
+            window (Optional[float]): Sliding window in seconds. Defaults to
+                value from config.
+            min_retries_per_second (Optional[float]): Retries allowed
+                regardless of successes. Defaults to value from config.
+        """
+        self.ratio = (
+            ratio if ratio is not None else SwarmsConfig.get_retry_budget_ratio()
+        )
+        self.window = window or SwarmsConfig.get_retry_budget_window()
+        self.min_retries_per_second = (
+            min_retries_per_second
+            if min_retries_per_second is not None
+            else SwarmsConfig.get_retry_budget_min_per_second()
+        )
+
+        # One [second, successes, retries] bucket per second of the window
+        self._buckets: Deque[List[int]] = collections.deque()
+        self._successes = 0
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        """Number of retries the budget currently allows."""
+        with self._lock:
+            self._trim(time.monotonic())
+            return self._available()
+
+    def record_success(self) -> None:
+        """Deposit tokens for a successful request."""
+        with self._lock:
+            self._bucket(time.monotonic())[1] += 1
+            self._successes += 1
+
+    def try_spend(self) -> bool:
+        """
+        Withdraw a token for a retry if the budget allows one.
+
+        Returns:
+            bool: True if the retry may proceed
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            if self._available() < 1:
+                return False
+            self._bucket(now)[2] += 1
+            self._retries += 1
+            return True
+
+    def _available(self) -> float:
+        """Tokens left in the window. Callers must hold the lock."""
+        return (
+            self.min_retries_per_second * self.window
+            + self.ratio * self._successes
+            - self._retries
+        )
+
+    def _bucket(self, now: float) -> List[int]:
+        """Get the bucket for the current second."""
+        second = int(now)
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
+
+    def _trim(self, now: float) -> None:
+        """Drop buckets that fell out of the sliding window."""
+        while self._buckets and now - self._buckets[0][0] > self.window:
+            _, successes, retries = self._buckets.popleft()
+            self._successes -= successes
+            self._retries -= retries
+
+
 class RetryHandler:
     """Handles retry logic with exponential backoff for API requests."""
 
@@ -24,6 +142,8 @@ class RetryHandler:
         max_retry_delay: int = SwarmsConfig.DEFAULT_MAX_RETRY_DELAY,
         retry_on_status: Optional[Set[int]] = None,
         jitter: bool = True,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        retry_budget: Optional[RetryBudget] = None,
     ):
         """
         Initialize retry handler with optimized settings.
@@ -34,6 +154,10 @@ class RetryHandler:
             max_retry_delay (int): Maximum delay between retries in seconds
             retry_on_status (Optional[Set[int]]): HTTP status codes to retry on
             jitter (bool): Whether to add random jitter to retry delays
+            circuit_breakers (Optional[CircuitBreakerRegistry]): Circuit breakers
+                consulted before every attempt, None to disable circuit breaking
+            retry_budget (Optional[RetryBudget]): Budget shared by all calls
+                that every retry must fit in, None for unlimited retries
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
@@ -42,25 +166,43 @@ class RetryHandler:
             SwarmsConfig.DEFAULT_RETRY_ON_STATUS
         )
         self.jitter = jitter
+        self.circuit_breakers = circuit_breakers
+        self.retry_budget = retry_budget
 
         # Track retry statistics
         self.retry_stats: Dict[str, int] = {
             "total_retries": 0,
             "successful_retries": 0,
             "failed_retries": 0,
+            "budget_spent": 0,
+            "budget_exhausted": 0,
         }
 
-    def calculate_delay(self, attempt: int, error_type: Optional[str] = None) -> float:
+    def calculate_delay(
+        self,
+        attempt: int,
+        error_type: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ) -> float:
         """
         Calculate optimized delay for current retry attempt.
 
         Args:
             attempt (int): Current retry attempt number
             error_type (Optional[str]): Type of error that triggered the retry
+            retry_after (Optional[float]): Delay requested by the server
 
         Returns:
             float: Delay in seconds
         """
+        # Honor the server's requested delay instead of guessing one
+        if retry_after is not None:
+            delay = max(retry_after, self.retry_delay)
+            if self.jitter:
+                # Only add jitter, never retry before the server allows it
+                delay += random.uniform(0, min(delay * 0.1, 1.0))
+            return delay
+
         # Base exponential backoff
         delay = min(self.retry_delay * (1.5 ** (attempt - 1)), self.max_retry_delay)
 
@@ -98,22 +240,199 @@ class RetryHandler:
         if attempt > self.max_retries:
             return False, None
 
-        if hasattr(exception, "status"):
-            status = getattr(exception, "status")
-            if status in self.retry_on_status:
-                error_type = None
-                if status == 429:
-                    error_type = "rate_limit"
-                elif status in {408, 504}:
-                    error_type = "timeout"
-                elif status >= 500:
-                    error_type = "server_error"
-                return True, error_type
+        # Connection failures, bodies cut off mid-read and timeouts are safe
+        # to retry: GETs are idempotent and every POST carries an idempotency key
+        if isinstance(
+            exception,
+            (asyncio.TimeoutError, TimeoutError, requests.exceptions.Timeout),
+        ):
+            return True, "timeout"
+        if isinstance(
+            exception,
+            (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ),
+        ):
+            return True, "connection"
+
+        # aiohttp errors carry a status, APIError a status_code
+        status = getattr(exception, "status", None)
+        if status is None:
+            status = getattr(exception, "status_code", None)
+        if status in self.retry_on_status:
+            error_type = None
+            if status == 429:
+                error_type = "rate_limit"
+            elif status in {408, 504}:
+                error_type = "timeout"
+            elif status >= 500:
+                error_type = "server_error"
+            return True, error_type
 
         return False, None
 
+    def enter_circuits(
+        self, circuit_keys: Sequence[str]
+    ) -> List[Tuple[CircuitBreaker, bool]]:
+        """
+        Check the circuits guarding a call before it is attempted.
+
+        Args:
+            circuit_keys (Sequence[str]): Circuits guarding the call, e.g. its
+                base URL and endpoint
+
+        Returns:
+            List[Tuple[CircuitBreaker, bool]]: Entered breakers, each with
+                whether the call is its probe, to pass to exit_circuits
+
+        Raises:
+            CircuitOpenError: If any of the circuits is open
+        """
+        if self.circuit_breakers is None:
+            return []
+
+        entered: List[Tuple[CircuitBreaker, bool]] = []
+        for key in circuit_keys:
+            breaker = self.circuit_breakers.get(key)
+            allowed, probe = breaker.allow()
+            if not allowed:
+                # Hand back probes reserved on circuits checked earlier
+                for entered_breaker, entered_probe in entered:
+                    entered_breaker.record(None, entered_probe)
+                raise CircuitOpenError(breaker.name, breaker.retry_after)
+            entered.append((breaker, probe))
+
+        return entered
+
+    def exit_circuits(
+        self,
+        breakers: List[Tuple[CircuitBreaker, bool]],
+        exception: Optional[BaseException] = None,
+        status: Optional[int] = None,
+    ) -> None:
+        """
+        Record the outcome of a call on the circuits it entered.
+
+        Args:
+            breakers (List[Tuple[CircuitBreaker, bool]]): Result of enter_circuits
+            exception (Optional[BaseException]): The call's exception, if any
+            status (Optional[int]): The call's HTTP status, if no exception
+                was raised for it
+        """
+        if exception is not None:
+            failed = is_circuit_failure(exception)
+        elif status is not None:
+            failed = is_circuit_failure_status(status)
+        else:
+            failed = False
+        for breaker, probe in breakers:
+            breaker.record(failed, probe)
+
+    def _record_success(self, attempt: int, duration: float) -> None:
+        """Record a successful attempt on the budget and statistics."""
+        if self.retry_budget is not None:
+            self.retry_budget.record_success()
+
+        # Log success after retries
+        if attempt > 1:
+            self.retry_stats["successful_retries"] += 1
+            logger.info(
+                f"Request succeeded after {attempt-1} retries in {duration:.2f}s"
+            )
+
+    def _get_retry_delay(self, exception: Exception, attempt: int) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            exception (Exception): The exception raised by the attempt
+            attempt (int): Attempt number that failed
+
+        Returns:
+            Optional[float]: Delay before the next attempt, or None if the
+                exception should be raised
+        """
+        self.retry_stats["total_retries"] += 1
+
+        should_retry, error_type = self.should_retry(exception, attempt)
+        if not should_retry:
+            self.retry_stats["failed_retries"] += 1
+            if attempt > 1:
+                logger.error(
+                    f"Request failed after {attempt-1} retries: {str(exception)}"
+                )
+            return None
+
+        if self.retry_budget is not None:
+            if not self.retry_budget.try_spend():
+                self.retry_stats["budget_exhausted"] += 1
+                self.retry_stats["failed_retries"] += 1
+                logger.warning(
+                    f"Retry budget exhausted, not retrying: {str(exception)}"
+                )
+                return None
+            self.retry_stats["budget_spent"] += 1
+
+        delay = self.calculate_delay(
+            attempt, error_type, getattr(exception, "retry_after", None)
+        )
+        logger.warning(
+            f"Attempt {attempt} failed ({error_type or 'unknown error'}): {str(exception)}. "
+            f"Retrying in {delay:.2f}s..."
+        )
+        return delay
+
+    def execute_with_retry_sync(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Execute a blocking function with the same retry logic as
+        execute_with_retry.
+
+        Circuits are not entered here; the function is expected to guard its
+        own request.
+
+        Args:
+            func (Callable): Function to execute
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            T: Function result
+
+        Raises:
+            Exception: If all retries fail or the retry budget is exhausted
+        """
+        start_time = time.monotonic()
+
+        for attempt in range(1, self.max_retries + 2):  # +2 for initial try
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = self._get_retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+
+            self._record_success(attempt, time.monotonic() - start_time)
+            return result
+
+        # This should never be reached due to the raise in the loop
+        raise Exception("Retry failed")
+
     async def execute_with_retry(
-        self, func: Callable[..., T], *args: Any, **kwargs: Any
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        circuit_keys: Sequence[str] = (),
+        **kwargs: Any,
     ) -> T:
         """
         Execute function with optimized retry logic.
@@ -121,50 +440,39 @@ class RetryHandler:
         Args:
             func (Callable): Function to execute
             *args: Positional arguments for func
+            circuit_keys (Sequence[str]): Circuits guarding the call. An open
+                circuit fails the call fast with CircuitOpenError.
             **kwargs: Keyword arguments for func
 
         Returns:
             T: Function result
 
         Raises:
-            Exception: If all retries fail
+            CircuitOpenError: If a circuit guarding the call is open
+            Exception: If all retries fail or the retry budget is exhausted
         """
         last_exception = None
         start_time = asyncio.get_event_loop().time()
 
         for attempt in range(1, self.max_retries + 2):  # +2 for initial try
+            breakers = self.enter_circuits(circuit_keys)
             try:
-                result = await func(*args, **kwargs)
-
-                # Log success after retries
-                if attempt > 1:
-                    self.retry_stats["successful_retries"] += 1
-                    duration = asyncio.get_event_loop().time() - start_time
-                    logger.info(
-                        f"Request succeeded after {attempt-1} retries in {duration:.2f}s"
-                    )
-
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    self.exit_circuits(breakers, e)
+                    raise
+                self.exit_circuits(breakers, None)
+                self._record_success(
+                    attempt, asyncio.get_event_loop().time() - start_time
+                )
                 return result
 
             except Exception as e:
                 last_exception = e
-                self.retry_stats["total_retries"] += 1
-
-                should_retry, error_type = self.should_retry(e, attempt)
-                if not should_retry:
-                    self.retry_stats["failed_retries"] += 1
-                    if attempt > 1:
-                        logger.error(
-                            f"Request failed after {attempt-1} retries: {str(e)}"
-                        )
+                delay = self._get_retry_delay(e, attempt)
+                if delay is None:
                     raise
-
-                delay = self.calculate_delay(attempt, error_type)
-                logger.warning(
-                    f"Attempt {attempt} failed ({error_type or 'unknown error'}): {str(e)}. "
-                    f"Retrying in {delay:.2f}s..."
-                )
-
                 await asyncio.sleep(delay)
 
         # This should never be reached due to the raise in the loop
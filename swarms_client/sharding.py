@@ -0,0 +1,251 @@
+"""
+Sharding module for Swarms API client.
+
+This module runs very large agent and swarm workloads across worker processes,
+each with its own client, so request validation, encoding, decoding and
+logging are spread over several CPUs. Tasks reach the workers in chunks
+through a bounded queue, and results come back as raw JSON bytes tagged with
+their input index.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import queue
+import sys
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from .exceptions import SwarmsError
+from .models import AgentSpec, SwarmSpec
+
+# Tasks sent to a worker at a time
+DEFAULT_SHARD_CHUNK_SIZE = 256
+
+# Seconds between checks that the workers are still alive
+WORKER_POLL_INTERVAL = 1.0
+
+# A task, or a dict with the task and fields overriding the spec
+ShardTask = Union[str, Dict[str, Any]]
+
+# Input index, raw JSON result and error of one task
+ShardResult = Tuple[int, Optional[bytes], Optional[BaseException]]
+
+
+def split_limit(total: int, shards: int) -> List[int]:
+    """
+    Split a limit into per-shard limits that add up to it.
+
+    Args:
+        total (int): The global limit
+        shards (int): Number of shards, at most total
+
+    Returns:
+        List[int]: Limit of each shard, each at least 1
+    """
+    base, extra = divmod(total, shards)
+    return [base + (1 if shard < extra else 0) for shard in range(shards)]
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    """Get an exception that survives being sent to another process."""
+    try:
+        return pickle.loads(pickle.dumps(error))
+    except Exception:
+        return SwarmsError(f"{type(error).__name__}: {error}")
+
+
+def _split_task(task: ShardTask) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Split a task into its text and its overrides."""
+    if isinstance(task, str):
+        return task, None
+    overrides = dict(task)
+    return overrides.pop("task"), overrides or None
+
+
+async def _run_shard(
+    config: Dict[str, Any],
+    kind: str,
+    spec: Union[AgentSpec, SwarmSpec],
+    inbox: "multiprocessing.Queue",
+    outbox: "multiprocessing.Queue",
+) -> None:
+    """Run the tasks a worker receives until the end of the input."""
+    from .client import SwarmsClient
+
+    client = SwarmsClient(**config)
+    loop = asyncio.get_running_loop()
+    window = client.limiter.max_limit * 2
+
+    if kind == "agent":
+        handle = client.register_agent(spec, name=spec.agent_name or "shard")
+
+    async def _run_one(index: int, task: ShardTask) -> None:
+        try:
+            text, overrides = _split_task(task)
+            if kind == "agent":
+                result = await client.async_run_registered_agent(
+                    handle, text, overrides=overrides
+                )
+            else:
+                swarm_spec = (
+                    SwarmSpec.model_validate(
+                        {**spec.model_dump(), **overrides, "task": text}
+                    )
+                    if overrides
+                    else spec.model_copy(update={"task": text})
+                )
+                result = await client._async_run_swarm_spec(swarm_spec)
+            outbox.put((index, result.raw, None))
+        except Exception as e:
+            outbox.put((index, None, _portable_error(e)))
+
+    pending = set()
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, inbox.get)
+            if chunk is None:
+                break
+            start, tasks = chunk
+            for offset, task in enumerate(tasks):
+                while len(pending) >= window:
+                    _, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                pending.add(asyncio.ensure_future(_run_one(start + offset, task)))
+        if pending:
+            await asyncio.wait(pending)
+    finally:
+        await client.aclose()
+        client.close()
+
+
+def _shard_main(
+    shard: int,
+    config: Dict[str, Any],
+    kind: str,
+    spec: Union[AgentSpec, SwarmSpec],
+    inbox: "multiprocessing.Queue",
+    outbox: "multiprocessing.Queue",
+    log_level: str,
+) -> None:
+    """Entry point of a worker process."""
+    logger.remove()
+    logger.add(sys.stderr, level=log_level)
+    asyncio.run(_run_shard(config, kind, spec, inbox, outbox))
+
+    # Only a worker that ran all its tasks reports that it finished, so the
+    # parent notices one that died
+    outbox.put((None, shard, None))
+
+
+def run_sharded(
+    configs: List[Dict[str, Any]],
+    kind: str,
+    spec: Union[AgentSpec, SwarmSpec],
+    tasks: Iterable[ShardTask],
+    chunk_size: int = DEFAULT_SHARD_CHUNK_SIZE,
+    log_level: str = "WARNING",
+) -> Iterator[ShardResult]:
+    """
+    Run tasks across worker processes, one per client configuration.
+
+    Workers take chunks of tasks from a shared queue as they have capacity,
+    so faster shards take more of the work, and the input is read lazily.
+
+    Args:
+        configs (List[Dict[str, Any]]): SwarmsClient arguments of each worker
+        kind (str): "agent" or "swarm"
+        spec (Union[AgentSpec, SwarmSpec]): The validated agent or swarm run
+            on every task
+        tasks (Iterable[ShardTask]): Tasks, or dicts with a "task" and fields
+            overriding the spec
+        chunk_size (int): Tasks sent to a worker at a time
+        log_level (str): Log level of the workers
+
+    Yields:
+        ShardResult: Input index, raw JSON result and error of each task, in
+            completion order
+
+    Raises:
+        SwarmsError: If a worker process dies
+    """
+    context = multiprocessing.get_context("spawn")
+    inbox = context.Queue(maxsize=len(configs) * 2)
+    outbox = context.Queue()
+    stopped = threading.Event()
+
+    workers = [
+        context.Process(
+            target=_shard_main,
+            args=(shard, config, kind, spec, inbox, outbox, log_level),
+            name=f"swarms_client_shard_{shard}",
+            daemon=True,
+        )
+        for shard, config in enumerate(configs)
+    ]
+    for worker in workers:
+        worker.start()
+
+    def _put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                inbox.put(item, timeout=WORKER_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    feed_errors: List[BaseException] = []
+
+    def _feed() -> None:
+        chunk: List[ShardTask] = []
+        start = 0
+        try:
+            for index, task in enumerate(tasks):
+                chunk.append(task)
+                if len(chunk) >= chunk_size:
+                    if not _put((start, chunk)):
+                        return
+                    start, chunk = index + 1, []
+            if chunk and not _put((start, chunk)):
+                return
+        except Exception as e:
+            feed_errors.append(e)
+        for _ in workers:
+            _put(None)
+
+    feeder = threading.Thread(target=_feed, name="swarms_client_shard_feeder")
+    feeder.start()
+    logger.info(f"Started {len(workers)} shard workers")
+
+    finished = set()
+    try:
+        while len(finished) < len(workers):
+            try:
+                index, raw, error = outbox.get(timeout=WORKER_POLL_INTERVAL)
+            except queue.Empty:
+                for shard, worker in enumerate(workers):
+                    if shard not in finished and not worker.is_alive():
+                        raise SwarmsError(
+                            f"Shard worker {shard} exited with code {worker.exitcode}"
+                        )
+                continue
+
+            if index is None:
+                # A finished worker sends its shard number in place of a result
+                finished.add(raw)
+                continue
+            yield index, raw, error
+
+        if feed_errors:
+            raise feed_errors[0]
+    finally:
+        stopped.set()
+        feeder.join()
+        for worker in workers:
+            if worker.is_alive() and len(finished) < len(workers):
+                worker.terminate()
+            worker.join()
@@ -0,0 +1,198 @@
+"""
+Streaming module for Swarms API client.
+
+This module parses server-sent event (SSE) streams returned by completion
+endpoints when ``stream=True`` is requested.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from .models import StreamEvent
+
+# Sentinel payload used by the API to mark the end of a stream
+STREAM_DONE = "[DONE]"
+
+# Line terminators of the event stream format
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+
+
+class SSEParser:
+    """Incremental parser for ``text/event-stream`` response bodies."""
+
+    def __init__(self, loads: Callable[[str], Any] = json.loads):
+        """
+        Initialize an empty parser.
+
+        Args:
+            loads (Callable[[str], Any]): JSON decoder for event payloads
+        """
+        self.loads = loads
+        self._partial: List[bytes] = []
+        self._skip_lf = False
+        self._event_type: Optional[str] = None
+        self._data_lines: List[str] = []
+        self._event_id: Optional[str] = None
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[StreamEvent]:
+        """
+        Feed a chunk of the response body into the parser.
+
+        Args:
+            chunk (bytes): Raw bytes as received from the connection
+
+        Returns:
+            List[StreamEvent]: Events completed by this chunk
+        """
+        events: List[StreamEvent] = []
+        if self.done or not chunk:
+            return events
+
+        # A CRLF split across chunks ends a single line
+        if self._skip_lf and chunk.startswith(b"\n"):
+            chunk = chunk[1:]
+        self._skip_lf = False
+
+        # Only the new chunk is scanned, so long lines split over many
+        # chunks are not rescanned
+        start = 0
+        for match in _LINE_END.finditer(chunk):
+            raw_line = chunk[start : match.start()]
+            if self._partial:
+                self._partial.append(raw_line)
+                raw_line = b"".join(self._partial)
+                self._partial = []
+            start = match.end()
+
+            event = self._process_line(raw_line.decode("utf-8", errors="replace"))
+            if event is not None:
+                events.append(event)
+            if self.done:
+                return events
+
+        # Keep an incomplete trailing line for the next chunk
+        if start < len(chunk):
+            self._partial.append(chunk[start:])
+        elif chunk.endswith(b"\r"):
+            self._skip_lf = True
+
+        return events
+
+    def flush(self) -> List[StreamEvent]:
+        """
+        Dispatch any event still pending once the body has ended.
+
+        Returns:
+            List[StreamEvent]: The final event, if one was pending
+        """
+        events: List[StreamEvent] = []
+        if self._partial and not self.done:
+            line = b"".join(self._partial).decode("utf-8", errors="replace")
+            self._partial = []
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        if not self.done:
+            event = self._dispatch()
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _process_line(self, line: str) -> Optional[StreamEvent]:
+        """Process a single line of the event stream."""
+        if not line:
+            return self._dispatch()
+
+        if line.startswith(":"):
+            # Comment / keep-alive line
+            return None
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data_lines.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            self._event_id = value
+
+        return None
+
+    def _dispatch(self) -> Optional[StreamEvent]:
+        """Build an event from the buffered fields and reset them."""
+        if not self._data_lines:
+            self._event_type = None
+            return None
+
+        data = "\n".join(self._data_lines)
+        event_type = self._event_type or "message"
+        self._data_lines = []
+        self._event_type = None
+
+        if data.strip() == STREAM_DONE:
+            self.done = True
+            return None
+
+        return build_stream_event(event_type, data, self._event_id, self.loads)
+
+
+def build_stream_event(
+    event_type: str,
+    data: str,
+    event_id: Optional[str] = None,
+    loads: Callable[[str], Any] = json.loads,
+) -> StreamEvent:
+    """
+    Convert a raw SSE message into a StreamEvent.
+
+    Args:
+        event_type (str): The SSE event type
+        data (str): The SSE data payload
+        event_id (Optional[str]): The SSE event id, if any
+        loads (Callable[[str], Any]): JSON decoder for the payload
+
+    Returns:
+        StreamEvent: The parsed event
+    """
+    try:
+        payload: Any = loads(data)
+    except ValueError:
+        return StreamEvent(event=event_type, delta=data, id=event_id)
+
+    if not isinstance(payload, dict):
+        return StreamEvent(
+            event=event_type, delta=str(payload), id=event_id, data={"value": payload}
+        )
+
+    return StreamEvent(
+        event=payload.get("event", event_type),
+        agent_name=payload.get("agent_name", payload.get("agent")),
+        step=_get_step(payload),
+        delta=_get_delta(payload),
+        id=event_id,
+        data=payload,
+    )
+
+
+def _get_step(payload: Dict[str, Any]) -> Optional[int]:
+    """Extract the step number from an event payload."""
+    for key in ("step", "loop", "index"):
+        value = payload.get(key)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _get_delta(payload: Dict[str, Any]) -> str:
+    """Extract the token delta from an event payload."""
+    for key in ("delta", "content", "token", "text"):
+        value = payload.get(key)
+        if isinstance(value, str):
+            return value
+        if isinstance(value, dict) and isinstance(value.get("content"), str):
+            return value["content"]
+    return ""